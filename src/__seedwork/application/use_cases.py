@@ -0,0 +1,27 @@
+import abc
+from abc import ABC
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+
+Input = TypeVar('Input')
+Output = TypeVar('Output')
+T = TypeVar('T')
+
+
+class UseCase(Generic[Input, Output], ABC):
+
+    @abc.abstractmethod
+    async def execute(self, input_param: Input) -> Output:
+        raise NotImplementedError()
+
+
+async def run_in_executor(
+    function: Callable[..., T],
+    *args: Any,
+    executor: Optional[Executor] = None
+) -> T:
+    return await asyncio.get_running_loop().run_in_executor(
+        executor, partial(function, *args))
@@ -1,10 +1,18 @@
 from abc import ABC
-from dataclasses import asdict, dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields
+import inspect
+from types import MemberDescriptorType
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, \
+    Sequence, Tuple
+import weakref
 
+from __seedwork.domain.serializers import EntitySerializer
 from __seedwork.domain.value_objects import UniqueEntityId
 
 
+EntityObserver = Callable[['Entity', str, Any, Any], None]
+
+
 @dataclass(frozen=True, slots=True)
 class Entity(ABC):
 
@@ -12,17 +20,181 @@ class Entity(ABC):
         default_factory=lambda: UniqueEntityId()
     )
 
+    # one bit per field changed since the entity was loaded or last
+    # persisted; new entities start with every bit set
+    _changes: int = field(
+        default_factory=lambda: -1, init=False, repr=False, compare=False
+    )
+    # the version of the stored entity this one was read from, for
+    # repositories that reject stale writes; 0 until first stored
+    _version: int = field(
+        default_factory=lambda: 0, init=False, repr=False, compare=False
+    )
+
+    _observers: ClassVar[Dict[type, List[weakref.ref]]] = {}
+    _field_bits: ClassVar[Dict[type, Dict[str, int]]] = {}
+    _field_setters: ClassVar[Dict[type, Tuple[Callable, ...]]] = {}
+
     @property
     def id(self) -> str:
         return str(self.unique_entity_id)
 
     def _set(self, name: str, value: Any):
+        old_value = getattr(self, name)
+        if old_value is value or (
+                type(old_value) is type(value) and old_value == value):
+            return self
+
         object.__setattr__(self, name, value)
+        object.__setattr__(
+            self, '_changes', self._changes | self.__bits()[name])
+        references = Entity._observers.get(type(self))
+        if not references:
+            return self
+
+        for reference in tuple(references):
+            observer = reference()
+            if observer is None:
+                references.remove(reference)
+            else:
+                observer(self, name, old_value, value)
+        if not references:
+            Entity._observers.pop(type(self), None)
         return self
 
-    def to_dict(self) -> dict:
-        entity_dict = asdict(self)
-        entity_dict.pop('unique_entity_id')
-        entity_dict['id'] = self.id
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._changes != 0
+
+    def changed_fields(self) -> Tuple[str, ...]:
+        changes = self._changes
+        return tuple(
+            name for name, bit in self.__bits().items() if changes & bit
+        )
+
+    def clear_changes(self) -> None:
+        object.__setattr__(self, '_changes', 0)
+
+    def mark_all_changed(self) -> None:
+        object.__setattr__(self, '_changes', -1)
+
+    @classmethod
+    def __bits(cls) -> Dict[str, int]:
+        bits = Entity._field_bits.get(cls)
+        if bits is None:
+            bits = Entity._field_bits[cls] = {
+                entity_field.name: 1 << position
+                for position, entity_field in enumerate(
+                    entity_field for entity_field in fields(cls)
+                    if not entity_field.name.startswith('_'))
+            }
+        return bits
+
+    # setters of the public fields, in field order, then of `_changes` and
+    # `_version`, that write past the frozen __setattr__. Slotted fields are
+    # set through the descriptor of `cls` itself: before Python 3.11 a
+    # slotted dataclass declares the slots it inherits again, so the base
+    # class descriptors write slots the subclass never reads
+    @classmethod
+    def __setters(cls) -> Tuple[Callable, ...]:
+        setters = Entity._field_setters.get(cls)
+        if setters is None:
+            setters = Entity._field_setters[cls] = tuple(
+                cls.__setter(name)
+                for name in (*cls.__bits(), '_changes', '_version'))
+        return setters
+
+    @classmethod
+    def __setter(cls, name: str) -> Callable[['Entity', Any], None]:
+        attribute = inspect.getattr_static(cls, name, None)
+        if isinstance(attribute, MemberDescriptorType):
+            return attribute.__set__
+        return lambda entity, value: object.__setattr__(entity, name, value)
+
+    # builds an entity from values that were valid when they were stored:
+    # neither the validating __new__ nor __init__ and its default factories
+    # run, values are taken as they are (pass UniqueEntityId.trusted ids and
+    # datetimes) and the entity starts with no changes
+    @classmethod
+    def from_persistence(cls, **values: Any) -> 'Entity':
+        names = cls.__bits()
+        if values.keys() != names.keys():
+            raise TypeError(
+                f'{cls.__name__}.from_persistence() takes exactly the '
+                f'fields {", ".join(names)}')
+        return cls.rehydrate_many((tuple(map(values.__getitem__, names)),))[0]
+
+    # the batch variant of from_persistence for rows of field values in
+    # field order, as they come back from a store
+    @classmethod
+    def rehydrate_many(
+        cls,
+        rows: Iterable[Sequence[Any]]
+    ) -> List['Entity']:
+        *setters, set_changes, set_version = cls.__setters()
+        new = object.__new__
+        entities = []
+        append = entities.append
+        for row in rows:
+            entity = new(cls)
+            for setter, value in zip(setters, row, strict=True):
+                setter(entity, value)
+            set_changes(entity, 0)
+            set_version(entity, 0)
+            append(entity)
+        return entities
+
+    # bypasses __new__, where subclasses validate their input, since the
+    # copied values were already valid
+    def __copy__(self) -> 'Entity':
+        clone = object.__new__(type(self))
+        for entity_field in fields(self):
+            object.__setattr__(
+                clone, entity_field.name, getattr(self, entity_field.name))
+        return clone
+
+    def to_dict(self, json_ready: bool = False) -> dict:
+        serializer = EntitySerializer.for_class(type(self))
+        return serializer.to_json_dict(self) if json_ready \
+            else serializer.to_dict(self)
+
+    @classmethod
+    def to_dicts(
+        cls,
+        entities: Iterable['Entity'],
+        json_ready: bool = False
+    ) -> List[dict]:
+        return EntitySerializer.for_class(cls).to_dicts(entities, json_ready)
+
+    @classmethod
+    def to_columns(
+        cls,
+        entities: Iterable['Entity'],
+        json_ready: bool = False
+    ) -> Dict[str, list]:
+        return EntitySerializer.for_class(cls).to_columns(
+            entities, json_ready)
+
+    # observers are held weakly so that a discarded repository or cache
+    # stops being notified without having to unregister itself
+    @classmethod
+    def observe(cls, observer: EntityObserver) -> None:
+        reference = weakref.WeakMethod(observer) \
+            if inspect.ismethod(observer) \
+            else weakref.ref(observer)
+        Entity._observers.setdefault(cls, []).append(reference)
 
-        return entity_dict
+    @classmethod
+    def unobserve(cls, observer: EntityObserver) -> None:
+        references = [
+            reference for reference in Entity._observers.get(cls, [])
+            if reference() is not None and reference() != observer
+        ]
+        if references:
+            Entity._observers[cls] = references
+        else:
+            Entity._observers.pop(cls, None)
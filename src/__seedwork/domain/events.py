@@ -0,0 +1,96 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+import inspect
+from typing import Callable, ClassVar, Dict, List, Type
+import weakref
+
+from __seedwork.domain.serializers import to_builtin
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DomainEvent:
+
+    aggregate_id: str
+    occurred_on: datetime = field(default_factory=lambda: datetime.now())
+
+    @property
+    def event_name(self) -> str:
+        return type(self).__name__
+
+    def to_dict(self, json_ready: bool = False) -> dict:
+        return {'event_name': self.event_name,
+                **to_builtin(self, json_ready)}
+
+
+EventHandler = Callable[[DomainEvent], None]
+
+
+class DomainEvents:
+    # handlers subscribe to an event class and receive its subclasses too;
+    # like entity observers they are held weakly, and publishing with no
+    # handler registered costs a single dict lookup
+
+    _handlers: ClassVar[Dict[type, List[weakref.ref]]] = {}
+    _routes: ClassVar[Dict[type, List[weakref.ref]]] = {}
+
+    @classmethod
+    def subscribe(
+        cls,
+        event_class: Type[DomainEvent],
+        handler: EventHandler
+    ) -> None:
+        reference = weakref.WeakMethod(handler) \
+            if inspect.ismethod(handler) \
+            else weakref.ref(handler)
+        cls._handlers.setdefault(event_class, []).append(reference)
+        cls._routes.clear()
+
+    @classmethod
+    def unsubscribe(
+        cls,
+        event_class: Type[DomainEvent],
+        handler: EventHandler
+    ) -> None:
+        references = [
+            reference for reference in cls._handlers.get(event_class, [])
+            if reference() is not None and reference() != handler
+        ]
+        if references:
+            cls._handlers[event_class] = references
+        else:
+            cls._handlers.pop(event_class, None)
+        cls._routes.clear()
+
+    @classmethod
+    def publish(cls, event: DomainEvent) -> None:
+        if not cls._handlers:
+            return
+        references = cls._routes.get(type(event))
+        if references is None:
+            references = cls._routes[type(event)] = [
+                reference
+                for event_class in type(event).__mro__
+                for reference in cls._handlers.get(event_class, ())
+            ]
+        stale = False
+        for reference in references:
+            handler = reference()
+            if handler is None:
+                stale = True
+            else:
+                handler(event)
+        if stale:
+            cls._prune()
+
+    @classmethod
+    def _prune(cls) -> None:
+        for event_class, references in list(cls._handlers.items()):
+            references = [
+                reference for reference in references
+                if reference() is not None
+            ]
+            if references:
+                cls._handlers[event_class] = references
+            else:
+                del cls._handlers[event_class]
+        cls._routes.clear()
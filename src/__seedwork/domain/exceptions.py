@@ -3,5 +3,18 @@ class InvalidUuidException(Exception):
         super().__init__(error)
 
 
+class InvalidCursorException(Exception):
+    def __init__(self, error: str = 'Cursor is invalid') -> None:
+        super().__init__(error)
+
+
 class ValidationException(Exception):
     pass
+
+
+class NotFoundException(Exception):
+    pass
+
+
+class StaleEntityException(Exception):
+    pass
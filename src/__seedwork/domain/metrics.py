@@ -0,0 +1,406 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Callable, ClassVar, Dict, List, Optional, Sequence, \
+    Tuple, Type
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.validators import MESSAGES, ValidationSchema, \
+    ValidatorRules
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+Labels = Tuple[str, ...]
+
+# seconds; the domain paths measured here run in the microsecond range
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2
+)
+
+
+@dataclass(slots=True)
+class Counter:
+    name: str
+    help: str
+    label_names: Tuple[str, ...] = ()
+    values: Dict[Labels, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False)
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def value(self, labels: Labels = ()) -> float:
+        return self.values.get(labels, 0)
+
+    def samples(self) -> List[Tuple[str, Labels, Tuple, float]]:
+        return [(self.name, labels, (), value)
+                for labels, value in sorted(self.values.items())]
+
+
+@dataclass(slots=True)
+class Histogram:
+    name: str
+    help: str
+    label_names: Tuple[str, ...] = ()
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    # per label set: [count per bucket plus +Inf, sum]
+    values: Dict[Labels, list] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False)
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        with self._lock:
+            state = self.values.get(labels)
+            if state is None:
+                state = self.values[labels] = [
+                    [0] * (len(self.buckets) + 1), 0.0]
+            state[0][bisect_left(self.buckets, value)] += 1
+            state[1] += value
+
+    def count(self, labels: Labels = ()) -> int:
+        state = self.values.get(labels)
+        return sum(state[0]) if state else 0
+
+    def sum(self, labels: Labels = ()) -> float:
+        state = self.values.get(labels)
+        return state[1] if state else 0.0
+
+    def samples(self) -> List[Tuple[str, Labels, Tuple, float]]:
+        samples = []
+        bounds = [_format_value(bound) for bound in self.buckets] + ['+Inf']
+        for labels, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                samples.append((f'{self.name}_bucket', labels,
+                                (('le', bound),), cumulative))
+            samples.append((f'{self.name}_sum', labels, (), total))
+            samples.append((f'{self.name}_count', labels, (), cumulative))
+        return samples
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', r'\\').replace('"', r'\"') \
+        .replace('\n', r'\n')
+
+
+class MetricsRegistry:
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Counter | Histogram] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> Counter | Histogram:
+        return self._metrics[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._metrics
+
+    def counter(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = ()
+    ) -> Counter:
+        return self.__register(Counter, name, help, tuple(label_names))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.__register(
+            Histogram, name, help, tuple(label_names),
+            buckets=tuple(sorted(buckets)))
+
+    def __register(self, metric_class, name, help, label_names, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(
+                    name, help, label_names, **kwargs)
+            elif not isinstance(metric, metric_class) \
+                    or metric.label_names != label_names:
+                raise ValueError(
+                    f'Metric "{name}" is already registered differently')
+            return metric
+
+    def reset(self) -> None:
+        with self._lock:
+            for metric in self._metrics.values():
+                with metric._lock:  # pylint: disable=protected-access
+                    metric.values.clear()
+
+    # the Prometheus text exposition format, version 0.0.4
+    def to_prometheus(self) -> str:
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            kind = 'counter' if isinstance(metric, Counter) else 'histogram'
+            lines.append(f'# HELP {name} {metric.help}')
+            lines.append(f'# TYPE {name} {kind}')
+            for sample_name, labels, extra, value in metric.samples():
+                pairs = tuple(zip(metric.label_names, labels)) + extra
+                label_text = ','.join(
+                    f'{label}="{_escape(str(label_value))}"'
+                    for label, label_value in pairs)
+                if label_text:
+                    sample_name = f'{sample_name}{{{label_text}}}'
+                lines.append(f'{sample_name} {_format_value(value)}')
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+class Instrumentation:
+    # opt-in: enabling wraps the measured methods in place and disabling
+    # puts the originals back, so while it is off the domain layer runs
+    # its own code untouched and pays nothing at all
+
+    _active: ClassVar[Optional['Instrumentation']] = None
+
+    RULES = ('required', 'string', 'max_length', 'boolean')
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None) -> None:
+        self.registry = registry if registry is not None \
+            else MetricsRegistry()
+        self._patches: List[Tuple[object, str, object]] = []
+        self._schemas: List[
+            Tuple[ValidationSchema, Callable, Callable]] = []
+
+        counter, histogram = self.registry.counter, self.registry.histogram
+        self.constructions = counter(
+            'entity_constructions_total',
+            'Entities constructed, by outcome', ('entity', 'outcome'))
+        self.construction_seconds = histogram(
+            'entity_construction_seconds',
+            'Time spent constructing entities, by phase',
+            ('entity', 'phase'))
+        self.validations = counter(
+            'entity_validations_total',
+            'Entity schema validations, by mode', ('entity', 'mode'))
+        self.validation_seconds = histogram(
+            'entity_validation_seconds',
+            'Time spent in entity schema validation', ('entity',))
+        self.rule_executions = counter(
+            'validator_rule_executions_total',
+            'ValidatorRules rules executed', ('rule',))
+        self.rule_seconds = histogram(
+            'validator_rule_seconds',
+            'Time spent executing ValidatorRules rules', ('rule',))
+        self.validation_failures = counter(
+            'validation_failures_total',
+            'Broken validation rules', ('attribute', 'rule'))
+        self.id_creations = counter(
+            'unique_entity_id_creations_total',
+            'UniqueEntityIds created, by source', ('source',))
+        self.to_dict_calls = counter(
+            'entity_to_dict_total',
+            'Entity.to_dict calls', ('entity',))
+        self.to_dict_seconds = histogram(
+            'entity_to_dict_seconds',
+            'Time spent in Entity.to_dict', ('entity',))
+
+    @property
+    def enabled(self) -> bool:
+        return Instrumentation._active is self
+
+    def enable(self, *entity_classes: Type[Entity]) -> 'Instrumentation':
+        if Instrumentation._active is not None:
+            raise RuntimeError('Instrumentation is already enabled')
+        Instrumentation._active = self
+        try:
+            for rule in self.RULES:
+                self.__patch(ValidatorRules, rule, self.__rule(rule))
+            self.__patch(UniqueEntityId, '__init__', self.__id_init())
+            self.__patch(UniqueEntityId, 'trusted', self.__id_trusted())
+            self.__patch(Entity, 'to_dict', self.__to_dict())
+            for entity_class in entity_classes:
+                self.__instrument_entity(entity_class)
+        except BaseException:
+            self.disable()
+            raise
+        return self
+
+    def disable(self) -> None:
+        while self._patches:
+            owner, name, original = self._patches.pop()
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        while self._schemas:
+            schema, schema.validate, schema.collect = self._schemas.pop()
+        if Instrumentation._active is self:
+            Instrumentation._active = None
+
+    def __enter__(self) -> 'Instrumentation':
+        return self if self.enabled else self.enable()
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def __patch(self, owner: type, name: str, replacement: object) -> None:
+        self._patches.append(
+            (owner, name, owner.__dict__.get(name, _MISSING)))
+        setattr(owner, name, replacement)
+
+    def __instrument_entity(self, entity_class: Type[Entity]) -> None:
+        entity = entity_class.__name__
+        constructions = self.constructions
+        observe = self.construction_seconds.observe
+        perf_counter = time.perf_counter
+
+        # subclasses validate in __new__ and dataclasses set their fields
+        # in __init__; both are timed, as separate phases, and whichever
+        # runs first counts the construction and its outcome
+        def timed(original, phase, counts):
+            def construct(*args, **kwargs):
+                start = perf_counter()
+                try:
+                    result = original(*args, **kwargs)
+                except ValidationException:
+                    if counts:
+                        constructions.inc((entity, 'invalid'))
+                    raise
+                finally:
+                    observe(perf_counter() - start, (entity, phase))
+                if counts:
+                    constructions.inc((entity, 'ok'))
+                return result
+            return construct
+
+        # only a __new__ the class defines itself is wrapped: one added on
+        # top of object.__new__ could not be removed cleanly again
+        defines_new = '__new__' in entity_class.__dict__
+        if defines_new:
+            self.__patch(entity_class, '__new__', staticmethod(
+                timed(entity_class.__new__, 'new', True)))
+        self.__patch(entity_class, '__init__',
+                     timed(entity_class.__init__, 'init', not defines_new))
+        schema = getattr(entity_class, 'validation_schema', None)
+        if isinstance(schema, ValidationSchema) and all(
+                instrumented is not schema
+                for instrumented, _, _ in self._schemas):
+            self.__instrument_schema(entity, schema)
+
+    def __instrument_schema(
+        self,
+        entity: str,
+        schema: ValidationSchema
+    ) -> None:
+        failures = {
+            MESSAGES[rule].format(attribute=field_rules.attribute,
+                                  **arguments): (field_rules.attribute, rule)
+            for field_rules in schema.fields
+            for rule, arguments in field_rules.rules
+        }
+        validate, collect = schema.validate, schema.collect
+        validations = self.validations
+        validation_failures = self.validation_failures
+        observe = self.validation_seconds.observe
+        perf_counter = time.perf_counter
+
+        def instrumented_validate(*values):
+            start = perf_counter()
+            try:
+                return validate(*values)
+            except ValidationException as exception:
+                validation_failures.inc(
+                    failures.get(str(exception), ('', '')))
+                raise
+            finally:
+                observe(perf_counter() - start, (entity,))
+                validations.inc((entity, 'raise'))
+
+        def instrumented_collect(*values):
+            errors = values[-1]
+            before = {name: len(messages)
+                      for name, messages in errors.items()}
+            start = perf_counter()
+            try:
+                return collect(*values)
+            finally:
+                observe(perf_counter() - start, (entity,))
+                validations.inc((entity, 'collect'))
+                for name, messages in errors.items():
+                    for message in messages[before.get(name, 0):]:
+                        validation_failures.inc(
+                            failures.get(message, (name, '')))
+
+        self._schemas.append((schema, validate, collect))
+        schema.validate = instrumented_validate
+        schema.collect = instrumented_collect
+
+    def __rule(self, rule: str) -> Callable:
+        original = getattr(ValidatorRules, rule)
+        executions = self.rule_executions
+        validation_failures = self.validation_failures
+        observe = self.rule_seconds.observe
+        perf_counter = time.perf_counter
+
+        def instrumented(rules: ValidatorRules, *args):
+            start = perf_counter()
+            try:
+                result = original(rules, *args)
+            except ValidationException:
+                validation_failures.inc((rules.attribute, rule))
+                raise
+            finally:
+                observe(perf_counter() - start, (rule,))
+                executions.inc((rule,))
+            # a passing rule returns the same ValidatorRules to chain on
+            if result is not rules:
+                validation_failures.inc((rules.attribute, rule))
+            return result
+
+        instrumented.__name__ = rule
+        return instrumented
+
+    def __id_init(self) -> Callable:
+        original = UniqueEntityId.__init__
+        inc = self.id_creations.inc
+
+        def __init__(unique_entity_id, id=None):
+            original(unique_entity_id, id)
+            inc(('generated',) if id is None else ('parsed',))
+
+        return __init__
+
+    def __id_trusted(self) -> classmethod:
+        original = UniqueEntityId.trusted.__func__
+        inc = self.id_creations.inc
+
+        def trusted(cls, value):
+            unique_entity_id = original(cls, value)
+            inc(('trusted',))
+            return unique_entity_id
+
+        return classmethod(trusted)
+
+    def __to_dict(self) -> Callable:
+        original = Entity.to_dict
+        inc = self.to_dict_calls.inc
+        observe = self.to_dict_seconds.observe
+        perf_counter = time.perf_counter
+
+        def to_dict(entity, json_ready=False):
+            start = perf_counter()
+            try:
+                return original(entity, json_ready)
+            finally:
+                labels = (type(entity).__name__,)
+                observe(perf_counter() - start, labels)
+                inc(labels)
+
+        return to_dict
+
+
+_MISSING = object()
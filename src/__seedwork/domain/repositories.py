@@ -0,0 +1,347 @@
+import abc
+from abc import ABC
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+import json
+import math
+from typing import Any, Callable, Generic, Iterable, List, Optional, \
+    Tuple, TypeVar
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import InvalidCursorException, \
+    NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+ET = TypeVar('ET', bound=Entity)
+Filter = TypeVar('Filter')
+
+
+class RepositoryInterface(Generic[ET], ABC):
+
+    @abc.abstractmethod
+    def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        raise NotImplementedError()
+
+    # writes the whole entity, stored or not, whatever it was read from and
+    # whichever fields changed since; for copying state from elsewhere
+    def save(self, entity: ET) -> None:
+        entity.mark_all_changed()
+        try:
+            self.update(entity)
+        except NotFoundException:
+            self.insert(entity)
+
+
+@dataclass(slots=True, kw_only=True)
+class SearchParams(Generic[Filter]):
+    page: Optional[int] = 1
+    per_page: Optional[int] = 15
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        self._normalize_page()
+        self._normalize_per_page()
+        self._normalize_sort()
+        self._normalize_sort_dir()
+        self._normalize_filter()
+
+    def _normalize_page(self):
+        page = self._convert_to_int(self.page)
+        if page <= 0:
+            page = self._get_dataclass_field('page').default
+        self.page = page
+
+    def _normalize_per_page(self):
+        per_page = self._convert_to_int(self.per_page)
+        if per_page < 1:
+            per_page = self._get_dataclass_field('per_page').default
+        self.per_page = per_page
+
+    def _normalize_sort(self):
+        self.sort = None if self.sort == '' or self.sort is None \
+            else str(self.sort)
+
+    def _normalize_sort_dir(self):
+        if not self.sort:
+            self.sort_dir = None
+            return
+
+        sort_dir = str(self.sort_dir).lower()
+        self.sort_dir = 'asc' if sort_dir not in ['asc', 'desc'] else sort_dir
+
+    def _normalize_filter(self):
+        self.filter = None if self.filter == '' else self.filter
+
+    def _convert_to_int(self, value: Any, default: int = 0) -> int:
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return default
+
+    def _get_dataclass_field(self, field_name: str):
+        return SearchParams.__dataclass_fields__[field_name]
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SearchResult(Generic[ET, Filter]):
+    items: List[ET]
+    total: int
+    current_page: int
+    per_page: int
+    last_page: int = field(init=False)
+    sort: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, 'last_page', math.ceil(self.total / self.per_page))
+
+    def to_dict(self) -> dict:
+        return {
+            'items': self.items,
+            'total': self.total,
+            'current_page': self.current_page,
+            'per_page': self.per_page,
+            'last_page': self.last_page,
+            'sort': self.sort,
+            'sort_dir': self.sort_dir,
+            'filter': self.filter
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Cursor:
+    # the sort key of the last item seen; a backward cursor pages towards
+    # the items before it instead of after it. Encoded it is an opaque,
+    # url safe token
+
+    key: Tuple[Any, ...]
+    backward: bool = False
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            [int(self.backward), [_encode_key(value) for value in self.key]],
+            separators=(',', ':'))
+        return base64.urlsafe_b64encode(
+            payload.encode()).rstrip(b'=').decode()
+
+    @classmethod
+    def decode(cls, token: str) -> 'Cursor':
+        try:
+            payload = base64.urlsafe_b64decode(
+                token + '=' * (-len(token) % 4))
+            backward, key = json.loads(payload)
+            return cls(tuple(map(_decode_key, key)), bool(backward))
+        except (TypeError, ValueError, binascii.Error) as ex:
+            raise InvalidCursorException() from ex
+
+
+def _encode_key(value: Any) -> list:
+    if value is None:
+        return ['n']
+    if isinstance(value, datetime):
+        return ['d', value.isoformat()]
+    if isinstance(value, (bool, int, float, str)):
+        return ['v', value]
+    raise TypeError(f'Cannot encode a {type(value).__name__} in a cursor')
+
+
+def _decode_key(value: list) -> Any:
+    match value:
+        case ['n']:
+            return None
+        case ['d', str(iso)]:
+            return datetime.fromisoformat(iso)
+        case ['v', bool() | int() | float() | str() as plain]:
+            return plain
+    raise ValueError(f'Invalid cursor key {value!r}')
+
+
+@dataclass(slots=True, kw_only=True)
+class CursorParams(Generic[Filter]):
+    cursor: Optional[str | Cursor] = None
+    per_page: Optional[int] = 15
+    sort_dir: Optional[str] = 'desc'
+    filter: Optional[Filter] = None
+
+    def __post_init__(self):
+        try:
+            per_page = int(self.per_page)
+        except (ValueError, TypeError):
+            per_page = 0
+        self.per_page = per_page if per_page >= 1 else 15
+        sort_dir = str(self.sort_dir).lower()
+        self.sort_dir = sort_dir if sort_dir in ['asc', 'desc'] else 'desc'
+        if self.cursor == '':
+            self.cursor = None
+        elif isinstance(self.cursor, str):
+            self.cursor = Cursor.decode(self.cursor)
+        self.filter = None if self.filter == '' else self.filter
+
+    @property
+    def backward(self) -> bool:
+        return self.cursor is not None and self.cursor.backward
+
+    # the order rows are read in: the page's order, or the opposite one
+    # when paging backward
+    @property
+    def descending(self) -> bool:
+        return (self.sort_dir == 'desc') != self.backward
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class CursorPage(Generic[ET, Filter]):
+    items: List[ET]
+    per_page: int
+    next_cursor: Optional[str] = None
+    previous_cursor: Optional[str] = None
+    sort_dir: Optional[str] = None
+    filter: Optional[Filter] = None
+
+    # `window` holds up to per_page + 1 items read after the cursor in
+    # the params' `descending` order; the extra one only tells whether
+    # there is more to read in that direction
+    @classmethod
+    def from_window(
+        cls,
+        window: List[ET],
+        input_params: CursorParams[Filter],
+        key: Callable[[ET], Tuple[Any, ...]]
+    ):
+        per_page = input_params.per_page
+        cursor = input_params.cursor
+        backward = input_params.backward
+        more = len(window) > per_page
+        items = window[:per_page]
+        if backward:
+            items.reverse()
+
+        if items:
+            has_next = True if backward else more
+            has_previous = more if backward else cursor is not None
+            next_cursor = Cursor(key(items[-1])).encode() \
+                if has_next else None
+            previous_cursor = Cursor(key(items[0]), True).encode() \
+                if has_previous else None
+        else:
+            # past either end: the only way is back across the cursor
+            next_cursor = Cursor(cursor.key).encode() \
+                if backward else None
+            previous_cursor = Cursor(cursor.key, True).encode() \
+                if cursor is not None and not backward else None
+        return cls(
+            items=items,
+            per_page=per_page,
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            'items': self.items,
+            'per_page': self.per_page,
+            'next_cursor': self.next_cursor,
+            'previous_cursor': self.previous_cursor,
+            'sort_dir': self.sort_dir,
+            'filter': self.filter
+        }
+
+
+class SearchableRepositoryInterface(
+    Generic[ET, Filter],
+    RepositoryInterface[ET],
+    ABC
+):
+    sortable_fields: List[str] = []
+
+    @abc.abstractmethod
+    def search(
+        self,
+        input_params: SearchParams[Filter]
+    ) -> SearchResult[ET, Filter]:
+        raise NotImplementedError()
+
+    # keyset pagination: each page costs the same however deep it is, and
+    # rows inserted meanwhile never shift or repeat items across pages
+    @abc.abstractmethod
+    def paginate(
+        self,
+        input_params: CursorParams[Filter]
+    ) -> CursorPage[ET, Filter]:
+        raise NotImplementedError()
+
+
+class AsyncRepositoryInterface(Generic[ET], ABC):
+
+    @abc.abstractmethod
+    async def insert(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    async def insert_many(self, entities: Iterable[ET]) -> int:
+        inserted = 0
+        for entity in entities:
+            await self.insert(entity)
+            inserted += 1
+        return inserted
+
+    @abc.abstractmethod
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def find_all(self) -> List[ET]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update(self, entity: ET) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        raise NotImplementedError()
+
+
+class AsyncSearchableRepositoryInterface(
+    Generic[ET, Filter],
+    AsyncRepositoryInterface[ET],
+    ABC
+):
+    sortable_fields: List[str] = []
+
+    @abc.abstractmethod
+    async def search(
+        self,
+        input_params: SearchParams[Filter]
+    ) -> SearchResult[ET, Filter]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def paginate(
+        self,
+        input_params: CursorParams[Filter]
+    ) -> CursorPage[ET, Filter]:
+        raise NotImplementedError()
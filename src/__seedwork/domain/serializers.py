@@ -0,0 +1,178 @@
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+import types
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, \
+    Union, get_args, get_origin, get_type_hints
+import uuid
+
+
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+_TEMPORAL_TYPES = (datetime, date, time)
+
+
+def to_builtin(value: Any, json_ready: bool = False) -> Any:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, _TEMPORAL_TYPES):
+        return value.isoformat() if json_ready else value
+    if isinstance(value, uuid.UUID):
+        return str(value) if json_ready else value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: to_builtin(getattr(value, field.name), json_ready)
+            for field in fields(value)
+        }
+    if isinstance(value, dict):
+        return {
+            to_builtin(key, json_ready): to_builtin(item, json_ready)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [to_builtin(item, json_ready) for item in value]
+        return items if json_ready or isinstance(value, list) \
+            else type(value)(items)
+    return value
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return None if value is None else value.isoformat()
+
+
+class EntitySerializer:
+    # field list and per-field converters are resolved once per entity
+    # class from its type hints, then baked into generated functions
+
+    _serializers: ClassVar[Dict[type, 'EntitySerializer']] = {}
+
+    def __init__(self, entity_class: type) -> None:
+        self.entity_class = entity_class
+        self.fields = tuple(
+            field.name for field in fields(entity_class)
+            if not field.name.startswith('_')
+        )
+        self.keys = tuple(
+            name for name in self.fields if name != 'unique_entity_id'
+        ) + (('id',) if 'unique_entity_id' in self.fields else ())
+
+        hints = get_type_hints(entity_class)
+        namespace = {'str': str}
+        self.to_dict = self.__generate(
+            'to_dict', hints, False, namespace)
+        self.to_json_dict = self.__generate(
+            'to_json_dict', hints, True, namespace)
+        self.__to_columns = self.__generate_columns(hints, False, namespace)
+        self.__to_json_columns = self.__generate_columns(
+            hints, True, namespace)
+
+    @classmethod
+    def for_class(cls, entity_class: type) -> 'EntitySerializer':
+        serializer = cls._serializers.get(entity_class)
+        if serializer is None:
+            serializer = cls._serializers[entity_class] = cls(entity_class)
+        return serializer
+
+    def to_dicts(
+        self,
+        entities: Iterable[Any],
+        json_ready: bool = False
+    ) -> List[dict]:
+        return list(map(
+            self.to_json_dict if json_ready else self.to_dict, entities))
+
+    def to_columns(
+        self,
+        entities: Iterable[Any],
+        json_ready: bool = False
+    ) -> Dict[str, list]:
+        if not isinstance(entities, (list, tuple)):
+            entities = list(entities)
+        return self.__to_json_columns(entities) if json_ready \
+            else self.__to_columns(entities)
+
+    def __expressions(
+        self,
+        hints: Dict[str, Any],
+        json_ready: bool,
+        namespace: Dict[str, Any]
+    ) -> Dict[str, str]:
+        expressions = {}
+        for name in self.fields:
+            attribute = f'entity.{name}'
+            if name == 'unique_entity_id':
+                expressions['id'] = f'str({attribute})'
+                continue
+
+            converter = _converter(hints.get(name, Any), json_ready)
+            if converter is None:
+                expressions[name] = attribute
+            else:
+                converter_name = f'_{converter.__name__.lstrip("_")}'
+                namespace[converter_name] = converter
+                expressions[name] = f'{converter_name}({attribute})'
+        return {key: expressions[key] for key in self.keys}
+
+    def __generate(
+        self,
+        function_name: str,
+        hints: Dict[str, Any],
+        json_ready: bool,
+        namespace: Dict[str, Any]
+    ) -> Callable[[Any], dict]:
+        expressions = self.__expressions(hints, json_ready, namespace)
+        items = ', '.join(
+            f'{key!r}: {expression}'
+            for key, expression in expressions.items()
+        )
+        source = f'def {function_name}(entity):\n    return {{{items}}}\n'
+        return self.__compile(function_name, source, namespace)
+
+    def __generate_columns(
+        self,
+        hints: Dict[str, Any],
+        json_ready: bool,
+        namespace: Dict[str, Any]
+    ) -> Callable[[list], Dict[str, list]]:
+        expressions = self.__expressions(hints, json_ready, namespace)
+        items = ', '.join(
+            f'{key!r}: [{expression} for entity in entities]'
+            for key, expression in expressions.items()
+        )
+        source = f'def to_columns(entities):\n    return {{{items}}}\n'
+        return self.__compile('to_columns', source, namespace)
+
+    def __compile(
+        self,
+        function_name: str,
+        source: str,
+        namespace: Dict[str, Any]
+    ) -> Callable:
+        scope = dict(namespace)
+        exec(compile(
+            source, f'<{self.entity_class.__name__}Serializer>', 'exec'),
+            scope)
+        return scope[function_name]
+
+
+def _json_to_builtin(value: Any) -> Any:
+    return to_builtin(value, True)
+
+
+def _converter(
+    annotation: Any,
+    json_ready: bool
+) -> Optional[Callable[[Any], Any]]:
+    if get_origin(annotation) in (Union, types.UnionType):
+        candidates = [
+            candidate for candidate in get_args(annotation)
+            if candidate is not type(None)
+        ]
+    else:
+        candidates = [annotation]
+
+    if all(candidate in _IMMUTABLE_TYPES for candidate in candidates):
+        return None
+    if all(isinstance(candidate, type)
+           and issubclass(candidate, _TEMPORAL_TYPES)
+           for candidate in candidates):
+        return _isoformat if json_ready else None
+    return _json_to_builtin if json_ready else to_builtin
@@ -1,46 +1,190 @@
 from abc import ABC
 import abc
 from dataclasses import dataclass
-from typing import Any, Dict, Generic, List, TypeVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, \
+    TypeVar
 
 from __seedwork.domain.exceptions import ValidationException
 
 
+ErrorFields = Dict[str, List[str]]
+AttributesValidated = TypeVar('AttributesValidated')
+
+MESSAGES = {
+    'required': 'The "{attribute}" is required.',
+    'string': 'The "{attribute}" must be a string.',
+    'max_length': 'The "{attribute}" must be less than {max_length} characters.',
+    'boolean': 'The "{attribute}" must be a boolean.',
+    'naive_datetime':
+        'The "{attribute}" must be a datetime without a time zone.'
+}
+
+
 @dataclass(frozen=True, slots=True)
 class ValidatorRules:
     value: Any
     attribute: str
+    errors: Optional[ErrorFields] = None
 
     @staticmethod
-    def values(value: Any, attribute: str):
-        return ValidatorRules(value, attribute)
+    def values(value: Any, attribute: str, errors: ErrorFields = None):
+        return ValidatorRules(value, attribute, errors)
 
     def required(self) -> 'ValidatorRules':
         if self.value is None or self.value == "":
-            raise ValidationException(f'The "{self.attribute}" is required.')
+            return self.__fail(
+                MESSAGES['required'].format(attribute=self.attribute))
         return self
 
     def string(self) -> 'ValidatorRules':
         if self.value is not None and not isinstance(self.value, str):
-            raise ValidationException(
-                f'The "{self.attribute}" must be a string.')
+            return self.__fail(
+                MESSAGES['string'].format(attribute=self.attribute))
         return self
 
     def max_length(self, max_length: int) -> 'ValidatorRules':
         if self.value is not None and len(self.value) > max_length:
-            raise ValidationException(
-                f'The "{self.attribute}" must be less than {max_length} characters.')
+            return self.__fail(MESSAGES['max_length'].format(
+                attribute=self.attribute, max_length=max_length))
         return self
 
     def boolean(self) -> 'ValidatorRules':
         if self.value is not None and self.value is not True and self.value is not False:
-            raise ValidationException(
-                f'The "{self.attribute}" must be a boolean.')
+            return self.__fail(
+                MESSAGES['boolean'].format(attribute=self.attribute))
         return self
 
+    def naive_datetime(self) -> 'ValidatorRules':
+        if self.value is not None and (
+                not isinstance(self.value, datetime)
+                or self.value.tzinfo is not None):
+            return self.__fail(
+                MESSAGES['naive_datetime'].format(attribute=self.attribute))
+        return self
 
-ErrorFields = Dict[str, List[str]]
-AttributesValidated = TypeVar('AttributesValidated')
+    # without an `errors` collector the first broken rule raises, as
+    # always; with one the message is recorded and the remaining rules of
+    # the chain are skipped, so batch validation never pays for raising
+    def __fail(self, message: str) -> 'ValidatorRules':
+        if self.errors is None:
+            raise ValidationException(message)
+        self.errors.setdefault(self.attribute, []).append(message)
+        return _SKIPPED_RULES
+
+
+class _SkippedRules:
+    __slots__ = ()
+
+    def __getattr__(self, name: str):
+        return self.__skip
+
+    def __skip(self, *args: Any) -> '_SkippedRules':
+        return self
+
+
+_SKIPPED_RULES = _SkippedRules()
+
+
+# (condition, needs a `not None` guard) per rule; `{value}` is the checked
+# argument and the remaining placeholders are the rule arguments
+_CONDITIONS = {
+    'required': ('{value} is None or {value} == ""', False),
+    'string': ('not isinstance({value}, str)', True),
+    'max_length': ('len({value}) > {max_length}', True),
+    'boolean': ('{value} is not True and {value} is not False', True),
+    'naive_datetime': (
+        '(not isinstance({value}, datetime) '
+        'or {value}.tzinfo is not None)',
+        True)
+}
+
+
+@dataclass(frozen=True, slots=True)
+class FieldRules:
+    attribute: str
+    rules: Tuple[Tuple[str, Dict[str, Any]], ...] = ()
+
+    def required(self) -> 'FieldRules':
+        return self.__add('required')
+
+    def string(self) -> 'FieldRules':
+        return self.__add('string')
+
+    def max_length(self, max_length: int) -> 'FieldRules':
+        return self.__add('max_length', max_length=int(max_length))
+
+    def boolean(self) -> 'FieldRules':
+        return self.__add('boolean')
+
+    def naive_datetime(self) -> 'FieldRules':
+        return self.__add('naive_datetime')
+
+    def __add(self, rule: str, **arguments: Any) -> 'FieldRules':
+        return FieldRules(self.attribute, self.rules + ((rule, arguments),))
+
+
+class ValidationSchema:
+    # the same chains as `ValidatorRules`, declared once and compiled into
+    # two plain functions taking the attributes positionally: `validate`
+    # raises the first broken rule and `collect` fills an ErrorFields
+
+    def __init__(self, *fields: FieldRules) -> None:
+        self.fields = fields
+        self.attributes = tuple(field.attribute for field in fields)
+        self.source = self.__generate_source()
+
+        namespace = {
+            'ValidationException': ValidationException,
+            'datetime': datetime
+        }
+        exec(compile(self.source, f'<{type(self).__name__}>', 'exec'),
+             namespace)
+        self.validate: Callable[..., None] = namespace['validate']
+        self.collect: Callable[..., None] = namespace['collect']
+
+    # the rules of some attributes only, taking them in the given order
+    def subset(self, *attributes: str) -> 'ValidationSchema':
+        fields = {field.attribute: field for field in self.fields}
+        return ValidationSchema(*map(fields.__getitem__, attributes))
+
+    def __generate_source(self) -> str:
+        parameters = ', '.join(
+            f'_{position}' for position in range(len(self.fields)))
+        validate_lines = [f'def validate({parameters}):']
+        collect_lines = [f'def collect({parameters}, errors):']
+
+        for position, field in enumerate(self.fields):
+            checks = self.__checks(f'_{position}', field)
+            for condition, message in checks:
+                validate_lines.append(f'    if {condition}:')
+                validate_lines.append(
+                    f'        raise ValidationException({message!r})')
+
+            keyword = 'if'
+            for condition, message in checks:
+                collect_lines.append(f'    {keyword} {condition}:')
+                collect_lines.append(
+                    f'        errors.setdefault({field.attribute!r}, [])'
+                    f'.append({message!r})')
+                keyword = 'elif'
+
+        validate_lines.append('    return None')
+        collect_lines.append('    return None')
+        return '\n'.join(validate_lines + [''] + collect_lines) + '\n'
+
+    def __checks(self, value: str, field: FieldRules) -> List[Tuple[str, str]]:
+        checks = []
+        not_none = False
+        for rule, arguments in field.rules:
+            condition, guarded = _CONDITIONS[rule]
+            condition = condition.format(value=value, **arguments)
+            if guarded and not not_none:
+                condition = f'{value} is not None and {condition}'
+            not_none = not_none or rule == 'required'
+            checks.append((condition, MESSAGES[rule].format(
+                attribute=field.attribute, **arguments)))
+        return checks
 
 
 @dataclass(slots=True)
@@ -1,39 +1,304 @@
 from abc import ABC
-from dataclasses import dataclass, field, fields
+import abc
+from dataclasses import FrozenInstanceError, dataclass, fields
 import json
+import os
+import struct
+import threading
+import time
+from typing import ClassVar, Dict, Hashable, Optional, Tuple
 import uuid
 
 from __seedwork.domain.exceptions import InvalidUuidException
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True)
 class ValueObject(ABC):
 
-    def __str__(self) -> str:
-        field_names = [field.name for field in fields(self)]
-        return str(getattr(self, field_names[0])) \
-            if len(field_names) == 1 \
-            else json.dumps({field_name: getattr(self, field_name) for field_name in field_names})
+    # memoizes __str__, as value objects are frozen; a slot rather than a
+    # field, so it takes no part in fields(), equality or hashing
+    __slots__ = ('_str',)
+
+    # @dataclass runs after this, and keeps an __eq__ or __hash__ the class
+    # already has instead of generating its own, so every subclass starts
+    # with stubs that compile the methods specialized to its fields on
+    # first call
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for name, stub in _STUBS.items():
+            if name not in cls.__dict__:
+                setattr(cls, name, stub)
+
+    # copies and pickles carry the fields only: the memoized string is
+    # cheap to rebuild, and restoring its slot would go through the frozen
+    # __setattr__. Slotted subclasses get their own from @dataclass
+    def __getstate__(self) -> Optional[dict]:
+        return getattr(self, '__dict__', None)
+
+
+def _specialize(cls: type) -> None:
+    names = [value_field.name for value_field in fields(cls)]
+    if len(names) == 1:
+        to_str = f'str(self.{names[0]})'
+        to_hash = f'hash(self.{names[0]})'
+    else:
+        to_str = 'dumps({%s})' % ', '.join(
+            f'{name!r}: self.{name}' for name in names)
+        to_hash = 'hash((%s))' % ''.join(f'self.{name}, ' for name in names)
+    equal = ' and '.join(
+        f'self.{name} == other.{name}' for name in names) or 'True'
+
+    # a single field is its own string, anything else is memoized
+    str_body = f'return {to_str}' if len(names) == 1 else f"""try:
+        return self._str
+    except AttributeError:
+        value = {to_str}
+        setattr(self, '_str', value)
+        return value"""
+
+    namespace = {'dumps': json.dumps, 'setattr': object.__setattr__}
+    exec(f"""
+def __eq__(self, other):
+    if other.__class__ is self.__class__:
+        return {equal}
+    return NotImplemented
+
+def __hash__(self):
+    return {to_hash}
+
+def __str__(self):
+    {str_body}
+""", namespace)
+
+    for name, stub in _STUBS.items():
+        if getattr(cls, name) is stub:
+            setattr(cls, name, namespace[name])
+
+
+def _stub(name: str):
+    def stub(self, *args):
+        cls = type(self)
+        _specialize(cls)
+        return getattr(cls, name)(self, *args)
+    stub.__name__ = name
+    return stub
+
+
+_STUBS = {name: _stub(name) for name in ('__eq__', '__hash__', '__str__')}
+ValueObject.__eq__, ValueObject.__hash__, ValueObject.__str__ = \
+    _STUBS.values()
+
+
+class IdGenerator(ABC):
+
+    @abc.abstractmethod
+    def __call__(self) -> bytes:
+        raise NotImplementedError()
+
+
+class RandomIdGenerator(IdGenerator):
+
+    def __call__(self) -> bytes:
+        raw = bytearray(os.urandom(16))
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        return bytes(raw)
+
+
+class TimeOrderedIdGenerator(IdGenerator):
+    # UUIDv7 layout: 48 bits of unix milliseconds, then a 42 bit counter
+    # (rand_a plus the top of rand_b) seeded randomly each millisecond and
+    # incremented within it, then 32 random bits; ids are strictly
+    # increasing per generator even when the clock stalls or goes back
+
+    COUNTER_BITS = 42
+
+    _pack = struct.Struct('>QQ').pack
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+
+    def __call__(self) -> bytes:
+        random_bits = int.from_bytes(os.urandom(4), 'big')
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._counter = self.__seed()
+            else:
+                self._counter += 1
+                if self._counter >> self.COUNTER_BITS:
+                    self._last_ms += 1
+                    self._counter = self.__seed()
+            timestamp_ms, counter = self._last_ms, self._counter
+
+        return self._pack(
+            (timestamp_ms & 0xFFFF_FFFF_FFFF) << 16
+            | 0x7000
+            | counter >> 30,
+            0b10 << 62
+            | (counter & 0x3FFF_FFFF) << 32
+            | random_bits
+        )
 
+    def __seed(self) -> int:
+        # leaves the top counter bit clear so a millisecond has room to
+        # count before borrowing from the next one
+        return int.from_bytes(os.urandom(6), 'big') >> 7
 
-@dataclass(frozen=True, slots=True)
+    @staticmethod
+    def timestamp_ms(raw: bytes) -> int:
+        return int.from_bytes(raw[:6], 'big')
+
+
+def _format(raw: bytes) -> str:
+    hex_value = raw.hex()
+    return f'{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-' \
+        f'{hex_value[16:20]}-{hex_value[20:]}'
+
+
+def _is_canonical(value: str) -> bool:
+    return len(value) == 36 and value[8] == value[13] == value[18] \
+        == value[23] == '-' and value == value.lower()
+
+
+@dataclass(frozen=True, slots=True, init=False, repr=False)
 class UniqueEntityId(ValueObject):
 
-    id: str = field(
-        default_factory=lambda: str(uuid.uuid4())
-    )
+    # the id is kept as its 16 raw bytes; the canonical string is only
+    # formatted when first asked for and then memoized as the __str__
+    raw: bytes
+
+    generator: ClassVar[IdGenerator] = RandomIdGenerator()
 
-    def __post_init__(self) -> None:
-        id_value = str(self.id) if isinstance(self.id, uuid.UUID) else self.id
-        object.__setattr__(self, 'id', id_value)
+    def __init__(self, id: str | bytes | uuid.UUID | None = None) -> None:
+        raw, formatted = self.__validate(
+            self.generator() if id is None else id)
+        object.__setattr__(self, 'raw', raw)
+        if formatted is not None:
+            object.__setattr__(self, '_str', formatted)
 
-        self.__validate()
+    def __validate(
+        self,
+        value: str | bytes | uuid.UUID
+    ) -> Tuple[bytes, Optional[str]]:
+        if isinstance(value, (bytes, bytearray)) and len(value) == 16:
+            return bytes(value), None
+        if isinstance(value, uuid.UUID):
+            return value.bytes, None
+        if not isinstance(value, str):
+            raise InvalidUuidException()
 
-    def __validate(self) -> None:
+        if _is_canonical(value):
+            try:
+                raw = bytes.fromhex(value.replace('-', ''))
+                if len(raw) == 16:
+                    return raw, value
+            except ValueError:
+                pass
         try:
-            uuid.UUID(self.id)
+            return uuid.UUID(value).bytes, None
         except ValueError as ex:
             raise InvalidUuidException() from ex
 
+    # skips parsing and validation, for ids this service generated itself
+    # or loaded back from its own store
+    @classmethod
+    def trusted(cls, value: str | bytes | uuid.UUID) -> 'UniqueEntityId':
+        unique_entity_id = object.__new__(cls)
+        if isinstance(value, str):
+            raw, formatted = bytes.fromhex(value.replace('-', '')), value
+        elif isinstance(value, uuid.UUID):
+            raw, formatted = value.bytes, None
+        else:
+            raw, formatted = bytes(value), None
+        object.__setattr__(unique_entity_id, 'raw', raw)
+        if formatted is not None:
+            object.__setattr__(unique_entity_id, '_str', formatted)
+        return unique_entity_id
+
+    @property
+    def id(self) -> str:
+        try:
+            return self._str
+        except AttributeError:
+            formatted = _format(self.raw)
+            object.__setattr__(self, '_str', formatted)
+            return formatted
+
+    def to_uuid(self) -> uuid.UUID:
+        return uuid.UUID(bytes=self.raw)
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.raw == other.raw
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id='{self.id}')"
+
     def __str__(self) -> str:
-        return f"{self.id}"
+        return self.id
+
+
+# the frozen __setattr__ generated for slotted dataclasses only handles
+# field names, so `id` (a property here) is refused explicitly as well
+def _refuse_assignment(self, name: str, value=None) -> None:
+    raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+
+UniqueEntityId.__setattr__ = _refuse_assignment
+UniqueEntityId.__delattr__ = _refuse_assignment
+
+
+class UniqueEntityIdPool:
+    # hands out one shared UniqueEntityId per distinct id, whatever the
+    # representation it is looked up with, so large caches of ids neither
+    # re-parse nor duplicate them
+
+    def __init__(
+        self,
+        trusted: bool = False,
+        max_size: Optional[int] = None
+    ) -> None:
+        self.trusted = trusted
+        self.max_size = max_size
+        self._by_value: Dict[Hashable, UniqueEntityId] = {}
+        self._by_raw: Dict[bytes, UniqueEntityId] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_raw)
+
+    def intern(
+        self,
+        value: str | bytes | uuid.UUID | UniqueEntityId
+    ) -> UniqueEntityId:
+        unique_entity_id = self._by_value.get(value)
+        if unique_entity_id is not None:
+            return unique_entity_id
+
+        if isinstance(value, UniqueEntityId):
+            unique_entity_id = value
+        elif self.trusted:
+            unique_entity_id = UniqueEntityId.trusted(value)
+        else:
+            unique_entity_id = UniqueEntityId(value)
+
+        shared = self._by_raw.get(unique_entity_id.raw)
+        if shared is not None:
+            unique_entity_id = shared
+        elif self.max_size is not None and len(self._by_raw) >= self.max_size:
+            return unique_entity_id
+        else:
+            self._by_raw[unique_entity_id.raw] = unique_entity_id
+        self._by_value[value] = unique_entity_id
+        return unique_entity_id
+
+    def clear(self) -> None:
+        self._by_value.clear()
+        self._by_raw.clear()
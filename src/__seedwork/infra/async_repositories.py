@@ -0,0 +1,79 @@
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Generic, Iterable, List, Optional
+
+from __seedwork.domain.repositories import ET, Filter, \
+    AsyncSearchableRepositoryInterface, CursorPage, CursorParams, \
+    SearchableRepositoryInterface, SearchParams, SearchResult
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.streams import chunked
+
+
+class AsyncRepositoryAdapter(
+    Generic[ET, Filter],
+    AsyncSearchableRepositoryInterface[ET, Filter]
+):
+    # exposes a blocking repository to coroutines: calls run on `executor`
+    # (the loop's default one when None) so the event loop keeps serving
+    # other requests, and concurrent reads run side by side; `blocking=False`
+    # calls straight through, for repositories that never wait on I/O
+
+    # bulk inserts go through in chunks, yielding to the loop in between
+    chunk_size = 1000
+
+    def __init__(
+        self,
+        repository: SearchableRepositoryInterface[ET, Filter],
+        executor: Optional[Executor] = None,
+        blocking: bool = True
+    ) -> None:
+        self.repository = repository
+        self.executor = executor
+        self.blocking = blocking
+
+    async def insert(self, entity: ET) -> None:
+        return await self._call(self.repository.insert, entity)
+
+    async def insert_many(self, entities: Iterable[ET]) -> int:
+        inserted = 0
+        for chunk in chunked(entities, self.chunk_size):
+            await self._call(self._insert_chunk, chunk)
+            inserted += len(chunk)
+            if not self.blocking:
+                await asyncio.sleep(0)
+        return inserted
+
+    async def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        return await self._call(self.repository.find_by_id, entity_id)
+
+    async def find_all(self) -> List[ET]:
+        return await self._call(self.repository.find_all)
+
+    async def update(self, entity: ET) -> None:
+        return await self._call(self.repository.update, entity)
+
+    async def delete(self, entity_id: str | UniqueEntityId) -> None:
+        return await self._call(self.repository.delete, entity_id)
+
+    async def search(
+        self,
+        input_params: SearchParams[Filter]
+    ) -> SearchResult[ET, Filter]:
+        return await self._call(self.repository.search, input_params)
+
+    async def paginate(
+        self,
+        input_params: CursorParams[Filter]
+    ) -> CursorPage[ET, Filter]:
+        return await self._call(self.repository.paginate, input_params)
+
+    def _insert_chunk(self, entities: List[ET]) -> None:
+        for entity in entities:
+            self.repository.insert(entity)
+
+    async def _call(self, method: Callable[..., Any], *args: Any) -> Any:
+        if not self.blocking:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(method, *args))
@@ -0,0 +1,119 @@
+from copy import copy
+from dataclasses import fields
+import sys
+import threading
+from typing import Any, Generic, List, Optional, Type
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import InvalidUuidException
+from __seedwork.domain.repositories import ET, Filter, CursorPage, \
+    CursorParams, SearchableRepositoryInterface, SearchParams, SearchResult
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.caches import LRUCache
+
+
+def entity_size(entity: Entity) -> int:
+    return sys.getsizeof(entity) + sum(
+        sys.getsizeof(getattr(entity, entity_field.name))
+        for entity_field in fields(entity)
+    )
+
+
+class CachedRepository(
+    Generic[ET, Filter],
+    SearchableRepositoryInterface[ET, Filter]
+):
+    # read-through cache for find_by_id; it keeps a private copy of each
+    # entity and hands out copies of it, so callers can never mutate what
+    # is cached, and any change to an entity with a cached id (through
+    # `Entity._set` or this repository) drops the entry
+
+    def __init__(
+        self,
+        repository: SearchableRepositoryInterface[ET, Filter],
+        entity_class: Type[ET],
+        cache: Optional[LRUCache] = None
+    ) -> None:
+        self.repository = repository
+        self.cache = LRUCache(sizeof=entity_size) if cache is None else cache
+        # bumped on every invalidation, so a read that raced with a write
+        # does not cache what it read
+        self._version = 0
+        self._lock = threading.Lock()
+        entity_class.observe(self._on_entity_changed)
+
+    def insert(self, entity: ET) -> None:
+        self.repository.insert(entity)
+        self._invalidate(entity.unique_entity_id.raw)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        key = self._key(entity_id)
+        if key is None:
+            return self.repository.find_by_id(entity_id)
+
+        cached = self.cache.get(key)
+        if cached is None:
+            version = self._version
+            cached = copy(self.repository.find_by_id(entity_id))
+            with self._lock:
+                if version == self._version:
+                    self.cache.put(key, cached)
+        return copy(cached)
+
+    def find_all(self) -> List[ET]:
+        return self.repository.find_all()
+
+    def update(self, entity: ET) -> None:
+        try:
+            self.repository.update(entity)
+        finally:
+            self._invalidate(entity.unique_entity_id.raw)
+
+    def save(self, entity: ET) -> None:
+        try:
+            self.repository.save(entity)
+        finally:
+            self._invalidate(entity.unique_entity_id.raw)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        try:
+            self.repository.delete(entity_id)
+        finally:
+            key = self._key(entity_id)
+            if key is not None:
+                self._invalidate(key)
+
+    def search(
+        self,
+        input_params: SearchParams[Filter]
+    ) -> SearchResult[ET, Filter]:
+        return self.repository.search(input_params)
+
+    def paginate(
+        self,
+        input_params: CursorParams[Filter]
+    ) -> CursorPage[ET, Filter]:
+        return self.repository.paginate(input_params)
+
+    def _key(self, entity_id: str | UniqueEntityId) -> Optional[bytes]:
+        if isinstance(entity_id, UniqueEntityId):
+            return entity_id.raw
+        try:
+            return UniqueEntityId(entity_id).raw
+        except InvalidUuidException:
+            return None
+
+    def _invalidate(self, key: bytes) -> None:
+        with self._lock:
+            self._version += 1
+            self.cache.invalidate(key)
+
+    def _on_entity_changed(
+        self,
+        entity: ET,
+        name: str,
+        old_value: Any,
+        new_value: Any
+    ) -> None:
+        if old_value is not new_value:
+            self._invalidate(entity.unique_entity_id.raw)
@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+import sys
+import threading
+import time
+from typing import Any, Callable, Generic, Hashable, Optional, Tuple, \
+    TypeVar
+
+
+V = TypeVar('V')
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[V]):
+    # least recently used entries are evicted first once either
+    # `max_entries` or `max_size` (as measured by `sizeof`) is exceeded;
+    # entries older than their ttl are dropped when next looked up
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        max_size: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError('A cache must hold at least one entry')
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.clock = clock
+
+        # key -> (value, expires_at, size)
+        self._entries: OrderedDict[
+            Hashable, Tuple[V, Optional[float], int]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+        self._expirations = self._invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None \
+            and (entry[1] is None or entry[1] > self.clock())
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= self.clock():
+                self._discard(key)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+        size = self.sizeof(value) if self.max_size is not None else 0
+        with self._lock:
+            self._discard(key)
+            if self.max_size is not None and size > self.max_size:
+                return
+            self._entries[key] = (value, expires_at, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_size is not None and self._size > self.max_size):
+                evicted, (_, _, evicted_size) = \
+                    self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            if self._discard(key):
+                self._invalidations += 1
+                return True
+            return False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                size=self._size
+            )
+
+    def _discard(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._size -= entry[2]
+        return True
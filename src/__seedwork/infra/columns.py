@@ -0,0 +1,268 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from __seedwork.infra.indexes import Bitmap
+
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_micros(value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    if value.tzinfo is not None:
+        raise ValueError(
+            'Only naive datetimes can be stored as epoch microseconds')
+    return (value - EPOCH) // MICROSECOND
+
+
+def from_epoch_micros(value: Optional[int]) -> Optional[datetime]:
+    return None if value is None else EPOCH + value * MICROSECOND
+
+
+# row masks are plain ints where bit `i` selects row `i`, so combining
+# criteria (&, |, ~) and counting rows (int.bit_count) run in C
+
+
+def mask_from_flags(flags: Iterable[bool]) -> int:
+    digits = bytearray(0x31 if flag else 0x30 for flag in flags)
+    if not digits:
+        return 0
+    digits.reverse()
+    return int(digits, 2)
+
+
+def mask_positions(mask: int) -> Iterator[int]:
+    return iter(Bitmap.from_int(mask))
+
+
+def all_rows(length: int) -> int:
+    return (1 << length) - 1
+
+
+def _slice_bitmap(bitmap: Bitmap, start: int, stop: int) -> Bitmap:
+    return Bitmap.from_int((bitmap.to_int() >> start) & all_rows(stop - start))
+
+
+def _take_bitmap(bitmap: Bitmap, positions: List[int]) -> Bitmap:
+    if not bitmap:
+        return Bitmap()
+    return Bitmap.from_int(mask_from_flags(map(bitmap.__contains__, positions)))
+
+
+class BitColumn:
+
+    __slots__ = ('_values', '_nulls', '_length')
+
+    def __init__(self, values: Iterable[Optional[bool]] = ()) -> None:
+        self._values = Bitmap()
+        self._nulls = Bitmap()
+        self._length = 0
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Optional[bool]:
+        if index in self._nulls:
+            return None
+        return index in self._values
+
+    def append(self, value: Optional[bool]) -> None:
+        if value is None:
+            self._nulls.add(self._length)
+        elif value:
+            self._values.add(self._length)
+        self._length += 1
+
+    def mask(self, value: Optional[bool]) -> int:
+        if value is None:
+            return self._nulls.to_int()
+        if value:
+            return self._values.to_int()
+        return all_rows(self._length) \
+            & ~self._values.to_int() & ~self._nulls.to_int()
+
+    def slice(self, start: int, stop: int) -> 'BitColumn':
+        column = BitColumn()
+        column._values = _slice_bitmap(self._values, start, stop)
+        column._nulls = _slice_bitmap(self._nulls, start, stop)
+        column._length = stop - start
+        return column
+
+    def take(self, positions: List[int]) -> 'BitColumn':
+        column = BitColumn()
+        column._values = _take_bitmap(self._values, positions)
+        column._nulls = _take_bitmap(self._nulls, positions)
+        column._length = len(positions)
+        return column
+
+    def nbytes(self) -> int:
+        return (self._length + 7) // 8 * 2
+
+
+class Int64Column:
+
+    __slots__ = ('_values', '_nulls')
+
+    def __init__(self, values: Iterable[Optional[int]] = ()) -> None:
+        self._values = array('q')
+        self._nulls = Bitmap()
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> Optional[int]:
+        if index in self._nulls:
+            return None
+        return self._values[index]
+
+    def append(self, value: Optional[int]) -> None:
+        if value is None:
+            self._nulls.add(len(self._values))
+            value = 0
+        self._values.append(value)
+
+    def mask(self, predicate: Callable[[int], bool]) -> int:
+        nulls = self._nulls
+        if not nulls:
+            return mask_from_flags(map(predicate, self._values))
+        return mask_from_flags(
+            position not in nulls and predicate(value)
+            for position, value in enumerate(self._values)
+        )
+
+    def slice(self, start: int, stop: int) -> 'Int64Column':
+        column = Int64Column()
+        column._values = self._values[start:stop]
+        column._nulls = _slice_bitmap(self._nulls, start, stop)
+        return column
+
+    def take(self, positions: List[int]) -> 'Int64Column':
+        values = self._values
+        column = Int64Column()
+        column._values = array('q', [values[position] for position in positions])
+        column._nulls = _take_bitmap(self._nulls, positions)
+        return column
+
+    def nbytes(self) -> int:
+        return self._values.itemsize * len(self._values) \
+            + (len(self._values) + 7) // 8
+
+
+class FixedBytesColumn:
+
+    __slots__ = ('width', '_buffer')
+
+    def __init__(self, width: int, values: Iterable[bytes] = ()) -> None:
+        self.width = width
+        self._buffer = bytearray()
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._buffer) // self.width
+
+    def __getitem__(self, index: int) -> bytes:
+        start = index * self.width
+        return bytes(self._buffer[start:start + self.width])
+
+    def append(self, value: bytes) -> None:
+        if len(value) != self.width:
+            raise ValueError(f'Expected {self.width} bytes, got {len(value)}')
+        self._buffer += value
+
+    def slice(self, start: int, stop: int) -> 'FixedBytesColumn':
+        column = FixedBytesColumn(self.width)
+        column._buffer = self._buffer[start * self.width:stop * self.width]
+        return column
+
+    def take(self, positions: List[int]) -> 'FixedBytesColumn':
+        buffer, width = self._buffer, self.width
+        column = FixedBytesColumn(width)
+        column._buffer = bytearray(b''.join(
+            buffer[position * width:(position + 1) * width]
+            for position in positions
+        ))
+        return column
+
+    def nbytes(self) -> int:
+        return len(self._buffer)
+
+
+class StringColumn:
+
+    # every value is utf-8 encoded into one buffer; row `i` spans
+    # offsets[i]:offsets[i + 1]
+    __slots__ = ('_buffer', '_offsets', '_nulls')
+
+    def __init__(self, values: Iterable[Optional[str]] = ()) -> None:
+        self._buffer = bytearray()
+        self._offsets = array('q', [0])
+        self._nulls = Bitmap()
+        for value in values:
+            self.append(value)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if index in self._nulls:
+            return None
+        return self._buffer[
+            self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self._nulls.add(len(self))
+        else:
+            self._buffer += value.encode('utf-8')
+        self._offsets.append(len(self._buffer))
+
+    def mask_prefix(self, prefix: str) -> int:
+        encoded = prefix.encode('utf-8')
+        buffer, offsets, nulls = self._buffer, self._offsets, self._nulls
+        return mask_from_flags(
+            position not in nulls
+            and buffer.startswith(encoded, offsets[position],
+                                  offsets[position + 1])
+            for position in range(len(self))
+        )
+
+    def slice(self, start: int, stop: int) -> 'StringColumn':
+        offsets = self._offsets
+        base = offsets[start]
+        column = StringColumn()
+        column._buffer = self._buffer[base:offsets[stop]]
+        column._offsets = array(
+            'q', [offset - base for offset in offsets[start:stop + 1]])
+        column._nulls = _slice_bitmap(self._nulls, start, stop)
+        return column
+
+    def take(self, positions: List[int]) -> 'StringColumn':
+        buffer, offsets = self._buffer, self._offsets
+        column = StringColumn()
+        column._buffer = bytearray(b''.join(
+            buffer[offsets[position]:offsets[position + 1]]
+            for position in positions
+        ))
+        lengths = (
+            offsets[position + 1] - offsets[position]
+            for position in positions
+        )
+        column._offsets = array('q', [0])
+        total = 0
+        for length in lengths:
+            total += length
+            column._offsets.append(total)
+        column._nulls = _take_bitmap(self._nulls, positions)
+        return column
+
+    def nbytes(self) -> int:
+        return len(self._buffer) + self._offsets.itemsize * len(self._offsets) \
+            + (len(self) + 7) // 8
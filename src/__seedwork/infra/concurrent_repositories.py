@@ -0,0 +1,117 @@
+from copy import copy
+import threading
+from typing import Callable, Dict, Generic, Iterable, List
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import InvalidUuidException, \
+    NotFoundException, StaleEntityException
+from __seedwork.domain.repositories import ET, RepositoryInterface
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+class ConcurrentRepository(Generic[ET], RepositoryInterface[ET]):
+    # an in-memory store that threads can share. It keeps a private copy of
+    # each entity and hands out copies, so what one thread mutates through
+    # `Entity._set` is never seen by another until it is written back.
+    # Writes are compare-and-swap on the entity version: updating a copy
+    # older than the stored entity raises StaleEntityException. A write
+    # holds only the lock of its id's stripe; reads take no lock, as a
+    # stored copy is replaced, never changed
+
+    def __init__(
+        self,
+        entities: Iterable[ET] = (),
+        stripes: int = 64
+    ) -> None:
+        if stripes < 1:
+            raise ValueError('A repository needs at least one lock stripe')
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._items: Dict[bytes, ET] = {}
+        for entity in entities:
+            self.insert(entity)
+
+    def insert(self, entity: ET) -> None:
+        key = entity.unique_entity_id.raw
+        with self._lock(key):
+            stored = self._items.get(key)
+            if stored is not None:
+                raise self._stale(entity, stored)
+            self._store(key, entity, 1)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> ET:
+        stored = self._items.get(self._key(entity_id))
+        if stored is None:
+            raise self._not_found(entity_id)
+        return copy(stored)
+
+    def find_all(self) -> List[ET]:
+        return [copy(stored) for stored in self._items.copy().values()]
+
+    def update(self, entity: ET) -> None:
+        key = entity.unique_entity_id.raw
+        with self._lock(key):
+            stored = self._items.get(key)
+            if stored is None:
+                raise self._not_found(entity.id)
+            if stored.version != entity.version:
+                raise self._stale(entity, stored)
+            self._store(key, entity, stored.version + 1)
+
+    # overwrites the stored entity whatever version it is at
+    def save(self, entity: ET) -> None:
+        key = entity.unique_entity_id.raw
+        with self._lock(key):
+            stored = self._items.get(key)
+            self._store(key, entity, 1 if stored is None
+                        else stored.version + 1)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        key = self._key(entity_id)
+        with self._lock(key):
+            if self._items.pop(key, None) is None:
+                raise self._not_found(entity_id)
+
+    # reads, changes and writes back an entity, reading it again whenever
+    # another writer got there first
+    def modify(
+        self,
+        entity_id: str | UniqueEntityId,
+        change: Callable[[ET], object],
+        attempts: int = 100
+    ) -> ET:
+        for attempt in range(1, attempts + 1):
+            entity = self.find_by_id(entity_id)
+            change(entity)
+            try:
+                self.update(entity)
+                return entity
+            except StaleEntityException:
+                if attempt == attempts:
+                    raise
+
+    def _lock(self, key: bytes) -> threading.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    def _store(self, key: bytes, entity: ET, version: int) -> None:
+        stored = copy(entity)
+        object.__setattr__(stored, '_version', version)
+        stored.clear_changes()
+        self._items[key] = stored
+        object.__setattr__(entity, '_version', version)
+        entity.clear_changes()
+
+    def _key(self, entity_id: str | UniqueEntityId) -> bytes:
+        if isinstance(entity_id, UniqueEntityId):
+            return entity_id.raw
+        try:
+            return UniqueEntityId(entity_id).raw
+        except InvalidUuidException:
+            return b''
+
+    def _not_found(self, entity_id: str | UniqueEntityId) -> Exception:
+        return NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    def _stale(self, entity: Entity, stored: Entity) -> Exception:
+        return StaleEntityException(
+            f"Entity '{entity.id}' is at version {stored.version}, "
+            f"not {entity.version}")
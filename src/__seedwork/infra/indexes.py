@@ -0,0 +1,291 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, \
+    Tuple
+
+
+class _Highest:
+    __slots__ = ()
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __le__(self, other: Any) -> bool:
+        return self is other
+
+    def __gt__(self, other: Any) -> bool:
+        return self is not other
+
+    def __ge__(self, other: Any) -> bool:
+        return True
+
+    def __eq__(self, other: Any) -> bool:
+        return self is other
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def __repr__(self) -> str:
+        return 'HIGHEST'
+
+
+# compares greater than any other value, so `(value, HIGHEST)` is an
+# inclusive upper bound for every `(value, tie_breaker)` key
+HIGHEST = _Highest()
+
+
+def prefix_bounds(prefix: str) -> Tuple[Tuple[str], Optional[Tuple[str]]]:
+    # `(successor,)` sorts before every `(successor, tie_breaker)` key, so
+    # it bounds exactly the keys whose first item starts with `prefix`
+    stem = prefix.rstrip(chr(0x10FFFF))
+    if not stem:
+        return (prefix,), None
+    return (prefix,), (stem[:-1] + chr(ord(stem[-1]) + 1),)
+
+
+class SortedIndex:
+    # sorted multiset split into buckets of about `load` keys, so that an
+    # insert or remove only shifts one bucket instead of the whole index
+
+    def __init__(self, keys: Iterable[Any] = (), load: int = 512) -> None:
+        self._load = load
+        self._lists: List[list] = []
+        self._maxes: list = []
+        self._offsets: Optional[List[int]] = None
+        self._len = 0
+        self.update(keys)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return chain.from_iterable(
+            reversed(bucket) for bucket in reversed(self._lists)
+        )
+
+    def __contains__(self, key: Any) -> bool:
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        return bucket[bisect_left(bucket, key)] == key
+
+    def update(self, keys: Iterable[Any]) -> None:
+        values = sorted(chain(self, keys))
+        load = self._load
+        self._lists = [
+            values[start:start + load]
+            for start in range(0, len(values), load)
+        ]
+        self._maxes = [bucket[-1] for bucket in self._lists]
+        self._offsets = None
+        self._len = len(values)
+
+    def add(self, key: Any) -> None:
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([key])
+            maxes.append(key)
+        else:
+            pos = bisect_left(maxes, key)
+            if pos == len(maxes):
+                pos -= 1
+                self._lists[pos].append(key)
+                maxes[pos] = key
+            else:
+                insort(self._lists[pos], key)
+            self._split(pos)
+        self._offsets = None
+        self._len += 1
+
+    def remove(self, key: Any) -> None:
+        maxes = self._maxes
+        pos = bisect_left(maxes, key)
+        if pos == len(maxes):
+            raise KeyError(key)
+
+        bucket = self._lists[pos]
+        idx = bisect_left(bucket, key)
+        if bucket[idx] != key:
+            raise KeyError(key)
+
+        del bucket[idx]
+        self._offsets = None
+        self._len -= 1
+        if not bucket:
+            del self._lists[pos]
+            del maxes[pos]
+        elif idx == len(bucket):
+            maxes[pos] = bucket[-1]
+
+    def count(self, minimum: Any = None, maximum: Any = None) -> int:
+        start, stop = self._bounds(minimum, maximum)
+        return max(stop - start, 0)
+
+    def irange(
+        self,
+        minimum: Any = None,
+        maximum: Any = None,
+        reverse: bool = False,
+        offset: int = 0
+    ) -> Iterator[Any]:
+        start, stop = self._bounds(minimum, maximum)
+        if reverse:
+            stop -= offset
+        else:
+            start += offset
+        if start >= stop:
+            return iter(())
+        return self._iterate(
+            self._position(start), self._position(stop), reverse)
+
+    def _split(self, pos: int) -> None:
+        bucket = self._lists[pos]
+        if len(bucket) > self._load * 2:
+            half = bucket[self._load:]
+            del bucket[self._load:]
+            self._maxes[pos] = bucket[-1]
+            self._lists.insert(pos + 1, half)
+            self._maxes.insert(pos + 1, half[-1])
+
+    def _bounds(self, minimum: Any, maximum: Any) -> Tuple[int, int]:
+        start = 0 if minimum is None else self._index(minimum, bisect_left)
+        stop = self._len if maximum is None \
+            else self._index(maximum, bisect_right)
+        return start, stop
+
+    def _index(self, key: Any, bisect) -> int:
+        pos = bisect(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._cumulative()[pos] + bisect(self._lists[pos], key)
+
+    def _position(self, index: int) -> Tuple[int, int]:
+        if index >= self._len:
+            return len(self._lists), 0
+        offsets = self._cumulative()
+        pos = bisect_right(offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def _cumulative(self) -> List[int]:
+        if self._offsets is None:
+            self._offsets = list(
+                accumulate(map(len, self._lists), initial=0))
+        return self._offsets
+
+    def _iterate(
+        self,
+        start: Tuple[int, int],
+        stop: Tuple[int, int],
+        reverse: bool
+    ) -> Iterator[Any]:
+        lists = self._lists
+        (start_pos, start_idx), (stop_pos, stop_idx) = start, stop
+        positions = range(stop_pos, start_pos - 1, -1) if reverse \
+            else range(start_pos, stop_pos + 1)
+        for pos in positions:
+            if pos >= len(lists):
+                continue
+            bucket = lists[pos]
+            low = start_idx if pos == start_pos else 0
+            high = stop_idx if pos == stop_pos else len(bucket)
+            if reverse:
+                yield from reversed(bucket[low:high])
+            else:
+                yield from bucket[low:high]
+
+
+class Bitmap:
+
+    __slots__ = ('_bytes', '_count')
+
+    def __init__(self, positions: Iterable[int] = ()) -> None:
+        self._bytes = bytearray()
+        self._count = 0
+        for position in positions:
+            self.add(position)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, position: int) -> bool:
+        index = position >> 3
+        return index < len(self._bytes) \
+            and bool(self._bytes[index] & (1 << (position & 7)))
+
+    def __iter__(self) -> Iterator[int]:
+        for index, byte in enumerate(self._bytes):
+            if byte:
+                base = index << 3
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield base + bit
+
+    def add(self, position: int) -> None:
+        index = position >> 3
+        if index >= len(self._bytes):
+            self._bytes.extend(bytes(index - len(self._bytes) + 1))
+        mask = 1 << (position & 7)
+        if not self._bytes[index] & mask:
+            self._bytes[index] |= mask
+            self._count += 1
+
+    def discard(self, position: int) -> None:
+        index = position >> 3
+        if index < len(self._bytes):
+            mask = 1 << (position & 7)
+            if self._bytes[index] & mask:
+                self._bytes[index] &= ~mask & 0xFF
+                self._count -= 1
+
+    def to_int(self) -> int:
+        return int.from_bytes(self._bytes, 'little')
+
+    @classmethod
+    def from_int(cls, value: int) -> 'Bitmap':
+        bitmap = cls()
+        bitmap._bytes = bytearray(
+            value.to_bytes((value.bit_length() + 7) // 8, 'little'))
+        bitmap._count = value.bit_count()
+        return bitmap
+
+    def __and__(self, other: 'Bitmap') -> 'Bitmap':
+        return Bitmap.from_int(self.to_int() & other.to_int())
+
+    def __or__(self, other: 'Bitmap') -> 'Bitmap':
+        return Bitmap.from_int(self.to_int() | other.to_int())
+
+    def __sub__(self, other: 'Bitmap') -> 'Bitmap':
+        return Bitmap.from_int(self.to_int() & ~other.to_int())
+
+
+class BitmapIndex:
+    # one bitmap of positions per distinct value, meant for low
+    # cardinality attributes such as flags and statuses
+
+    def __init__(self) -> None:
+        self._bitmaps: Dict[Hashable, Bitmap] = {}
+
+    def add(self, position: int, value: Hashable) -> None:
+        bitmap = self._bitmaps.get(value)
+        if bitmap is None:
+            bitmap = self._bitmaps[value] = Bitmap()
+        bitmap.add(position)
+
+    def discard(self, position: int, value: Hashable) -> None:
+        bitmap = self._bitmaps.get(value)
+        if bitmap is not None:
+            bitmap.discard(position)
+
+    def get(self, value: Hashable) -> Bitmap:
+        return self._bitmaps.get(value) or Bitmap()
+
+    def count(self, value: Hashable) -> int:
+        bitmap = self._bitmaps.get(value)
+        return 0 if bitmap is None else len(bitmap)
+
+    def values(self) -> List[Hashable]:
+        return [value for value, bitmap in self._bitmaps.items() if bitmap]
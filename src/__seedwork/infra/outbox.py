@@ -0,0 +1,172 @@
+import abc
+from abc import ABC
+from collections import deque
+import json
+import threading
+import time
+from typing import Deque, List, Optional, Type
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+
+
+class EventSink(ABC):
+
+    @abc.abstractmethod
+    def write(self, events: List[DomainEvent]) -> None:
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        pass
+
+
+class InMemorySink(EventSink):
+
+    def __init__(self) -> None:
+        self.batches: List[List[DomainEvent]] = []
+
+    @property
+    def events(self) -> List[DomainEvent]:
+        return [event for batch in self.batches for event in batch]
+
+    def write(self, events: List[DomainEvent]) -> None:
+        self.batches.append(events)
+
+
+class JsonlFileSink(EventSink):
+    # one json object per event, appended and flushed once per batch
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, events: List[DomainEvent]) -> None:
+        self._file.write(''.join(
+            json.dumps(event.to_dict(json_ready=True), ensure_ascii=False)
+            + '\n' for event in events
+        ))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Outbox:
+    # events are appended to a queue on the write path and handed to the
+    # sink in batches by a background thread, once `max_batch_size` events
+    # are pending or the oldest has waited `max_delay` seconds; a batch the
+    # sink fails to write is kept and retried on the next flush. After a
+    # failure the dispatcher waits `max_delay`, doubled on each failure in a
+    # row up to `max_retry_delay`, however many events are pending
+
+    def __init__(
+        self,
+        sink: EventSink,
+        max_batch_size: int = 500,
+        max_delay: float = 0.05,
+        max_retry_delay: float = 5.0
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError('Batch size must be at least 1')
+        self.sink = sink
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_retry_delay = max_retry_delay
+
+        self._pending: Deque[DomainEvent] = deque()
+        self._ready = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self.dispatched = 0
+        self.batches = 0
+        self.failures = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def subscribe(self, event_class: Type[DomainEvent] = DomainEvent) -> None:
+        DomainEvents.subscribe(event_class, self.append)
+
+    def unsubscribe(
+        self,
+        event_class: Type[DomainEvent] = DomainEvent
+    ) -> None:
+        DomainEvents.unsubscribe(event_class, self.append)
+
+    def append(self, event: DomainEvent) -> None:
+        self._pending.append(event)
+        if len(self._pending) >= self.max_batch_size and self._running:
+            with self._ready:
+                self._ready.notify()
+
+    def flush(self) -> int:
+        flushed = 0
+        with self._flush_lock:
+            while self._pending:
+                batch = self._take_batch()
+                try:
+                    self.sink.write(batch)
+                except Exception:
+                    self.failures += 1
+                    self._pending.extendleft(reversed(batch))
+                    break
+                flushed += len(batch)
+                self.dispatched += len(batch)
+                self.batches += 1
+        return flushed
+
+    def start(self) -> 'Outbox':
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._dispatch, name='outbox-dispatcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._running = False
+            with self._ready:
+                self._ready.notify()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> 'Outbox':
+        self.subscribe()
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.unsubscribe()
+        self.stop()
+
+    def _take_batch(self) -> List[DomainEvent]:
+        pending = self._pending
+        return [pending.popleft()
+                for _ in range(min(len(pending), self.max_batch_size))]
+
+    def _dispatch(self) -> None:
+        failed = 0
+        while self._running:
+            if failed:
+                self._wait(min(self.max_delay * 2 ** (failed - 1),
+                               self.max_retry_delay), until_full=False)
+            else:
+                self._wait(self.max_delay, until_full=True)
+            if self._pending:
+                failures = self.failures
+                self.flush()
+                # capped so the delay stays a float
+                failed = min(failed + 1, 64) \
+                    if self.failures > failures else 0
+
+    def _wait(self, delay: float, until_full: bool) -> None:
+        deadline = time.monotonic() + delay
+        with self._ready:
+            while self._running and not (
+                    until_full
+                    and len(self._pending) >= self.max_batch_size):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._ready.wait(remaining)
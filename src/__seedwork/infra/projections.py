@@ -0,0 +1,113 @@
+import abc
+from abc import ABC
+from bisect import bisect_left, bisect_right, insort
+import threading
+from typing import ClassVar, Dict, List, Optional, Tuple, Type
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+
+
+class BucketCounts:
+    # counts per integer bucket (a day, an hour...): changing one is O(1),
+    # and a range only visits the non-empty buckets inside it
+
+    __slots__ = ('_counts', '_buckets')
+
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self._buckets: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __getitem__(self, bucket: int) -> int:
+        return self._counts.get(bucket, 0)
+
+    def add(self, bucket: int, delta: int = 1) -> None:
+        counts = self._counts
+        count = counts.get(bucket)
+        if count is None:
+            if delta:
+                counts[bucket] = delta
+                buckets = self._buckets
+                # time moves forward, so a new bucket is nearly always last
+                if not buckets or bucket > buckets[-1]:
+                    buckets.append(bucket)
+                else:
+                    insort(buckets, bucket)
+        elif count + delta:
+            counts[bucket] = count + delta
+        else:
+            del counts[bucket]
+            del self._buckets[bisect_left(self._buckets, bucket)]
+
+    def total(
+        self,
+        first: Optional[int] = None,
+        last: Optional[int] = None
+    ) -> int:
+        counts = self._counts
+        if first is None and last is None:
+            return sum(counts.values())
+        return sum(map(counts.__getitem__, self._range(first, last)))
+
+    def items(
+        self,
+        first: Optional[int] = None,
+        last: Optional[int] = None
+    ) -> List[Tuple[int, int]]:
+        counts = self._counts
+        return [
+            (bucket, counts[bucket]) for bucket in self._range(first, last)
+        ]
+
+    def clear(self) -> None:
+        self._counts.clear()
+        self._buckets.clear()
+
+    def _range(self, first: Optional[int], last: Optional[int]) -> List[int]:
+        buckets = self._buckets
+        return buckets[
+            0 if first is None else bisect_left(buckets, first):
+            len(buckets) if last is None else bisect_right(buckets, last)
+        ]
+
+
+class Projection(ABC):
+    # a read model kept up to date by the domain events of `event_classes`
+    # as they are published, so reading it never touches the entities.
+    # Events are applied one at a time, and `reset` followed by replaying
+    # the current entities (see subclasses) rebuilds it from scratch
+
+    event_classes: ClassVar[Tuple[Type[DomainEvent], ...]] = (DomainEvent,)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    @abc.abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def apply(self, event: DomainEvent) -> None:
+        raise NotImplementedError()
+
+    def handle(self, event: DomainEvent) -> None:
+        with self._lock:
+            self.apply(event)
+
+    def subscribe(self) -> None:
+        for event_class in self.event_classes:
+            DomainEvents.subscribe(event_class, self.handle)
+
+    def unsubscribe(self) -> None:
+        for event_class in self.event_classes:
+            DomainEvents.unsubscribe(event_class, self.handle)
+
+    def __enter__(self) -> 'Projection':
+        self.subscribe()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unsubscribe()
@@ -0,0 +1,265 @@
+import os
+import struct
+import threading
+from typing import Callable, Iterable, Iterator, List, Tuple
+import zlib
+
+
+# a record is its payload length, a crc32 of its offset and payload, its
+# offset, then the payload; offsets grow by one per appended record and are
+# kept when a segment is compacted, so compacted segments have gaps
+RECORD = struct.Struct('<IIQ')
+SEGMENT_SUFFIX = '.log'
+COMPACTING_SUFFIX = '.compacting'
+# lists the segments a compaction replaced, until they are all deleted
+COMPACTION_MARKER = 'COMPACTION'
+
+Record = Tuple[int, bytes]
+
+
+def _segment_name(base_offset: int) -> str:
+    return f'{base_offset:020d}{SEGMENT_SUFFIX}'
+
+
+def _fsync_directory(directory: str) -> None:
+    if os.name == 'posix':
+        descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+def _checksum(offset: int, payload: bytes) -> int:
+    return zlib.crc32(payload, zlib.crc32(offset.to_bytes(8, 'little')))
+
+
+def _read_records(path: str, strict: bool) -> Iterator[Tuple[int, Record]]:
+    # yields (position after the record, record); a short or corrupt record
+    # ends a segment being written to, and is an error in a sealed one
+    with open(path, 'rb') as stream:
+        position = 0
+        while True:
+            header = stream.read(RECORD.size)
+            if not header:
+                return
+            payload = b''
+            if len(header) == RECORD.size:
+                length, checksum, offset = RECORD.unpack(header)
+                payload = stream.read(length)
+            if len(header) < RECORD.size or len(payload) < length \
+                    or _checksum(offset, payload) != checksum:
+                if strict:
+                    raise ValueError(
+                        f'Corrupt record at byte {position} of {path}')
+                return
+            position += RECORD.size + length
+            yield position, (offset, payload)
+
+
+class SegmentedLog:
+    # an append-only log of binary records split into segment files named
+    # after their first offset. Appends are buffered; commit() makes them
+    # durable, and threads committing at the same time share one fsync
+    # (group commit). Opening a log drops a torn record left at the end of
+    # its last segment by a crash
+
+    def __init__(self, directory: str, segment_bytes: int = 64 << 20) -> None:
+        if segment_bytes < 1:
+            raise ValueError('Segment size must be at least 1 byte')
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+        self.__finish_compaction()
+        self._segments = sorted(
+            int(name[:-len(SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(SEGMENT_SUFFIX)
+            and name[:-len(SEGMENT_SUFFIX)].isdigit()
+        )
+        self._next_offset = self.__recover()
+        self._durable_offset = self._next_offset
+        self._stream = open(self._path(self._segments[-1]), 'ab')
+
+    def __finish_compaction(self) -> None:
+        names = os.listdir(self.directory)
+        marker = os.path.join(self.directory, COMPACTION_MARKER)
+        compacting = [
+            name for name in names if name.endswith(COMPACTING_SUFFIX)]
+        if compacting:
+            # interrupted before the compacted segment replaced anything
+            for name in compacting:
+                os.unlink(os.path.join(self.directory, name))
+        elif COMPACTION_MARKER in names:
+            with open(marker, encoding='ascii') as stream:
+                for name in stream.read().split():
+                    if name in names:
+                        os.unlink(os.path.join(self.directory, name))
+        if COMPACTION_MARKER in names:
+            os.unlink(marker)
+        _fsync_directory(self.directory)
+
+    def __recover(self) -> int:
+        if not self._segments:
+            self._segments.append(0)
+            return 0
+        next_offset, size = self._segments[-1], 0
+        path = self._path(self._segments[-1])
+        for size, (offset, _) in _read_records(path, strict=False):
+            next_offset = offset + 1
+        if size < os.path.getsize(path):
+            with open(path, 'r+b') as stream:
+                stream.truncate(size)
+                os.fsync(stream.fileno())
+        return next_offset
+
+    @property
+    def next_offset(self) -> int:
+        return self._next_offset
+
+    @property
+    def durable_offset(self) -> int:
+        return self._durable_offset
+
+    def append(self, payload: bytes) -> int:
+        with self._lock:
+            offset = self._next_offset
+            self._write(offset, payload)
+            self._next_offset = offset + 1
+            if self._stream.tell() >= self.segment_bytes:
+                self.__roll()
+            return offset
+
+    # returns the offset every record before which is durable
+    def commit(self) -> int:
+        target = self._next_offset
+        with self._commit_lock:
+            # another thread may have synced this one's records meanwhile
+            if self._durable_offset >= target:
+                return self._durable_offset
+            with self._lock:
+                target = self._next_offset
+                self._stream.flush()
+                # a roll may close the stream while this syncs it
+                descriptor = os.dup(self._stream.fileno())
+            try:
+                os.fsync(descriptor)
+            finally:
+                os.close(descriptor)
+            self._durable_offset = target
+            return target
+
+    def roll(self) -> None:
+        with self._lock:
+            self.__roll()
+
+    # a compaction may delete segments while they are read, after moving
+    # what survives of them into the oldest one, which this reader may
+    # already be past; it then lists the segments again and goes on from
+    # the offset after the last one it yielded. Offsets only grow, so any
+    # record at or before that offset is skipped
+    def read(self, start: int = 0) -> Iterator[Record]:
+        listed = None
+        while True:
+            with self._lock:
+                self._stream.flush()
+                segments = list(self._segments)
+            if segments == listed:
+                raise ValueError(
+                    f'A segment of {self.directory} is missing')
+            listed = segments
+            try:
+                for index, base in enumerate(segments):
+                    if index + 1 < len(segments) \
+                            and segments[index + 1] <= start:
+                        continue
+                    records = _read_records(
+                        self._path(base), strict=index + 1 < len(segments))
+                    for _, (offset, payload) in records:
+                        if offset >= start:
+                            start = offset + 1
+                            yield offset, payload
+                return
+            except FileNotFoundError:
+                continue
+
+    # rewrites every sealed segment as one, keeping only the records
+    # `fold` returns for them, in offset order
+    def compact(
+        self,
+        fold: Callable[[Iterator[Record]], Iterable[Record]]
+    ) -> int:
+        self.roll()
+        with self._lock:
+            sealed = self._segments[:-1]
+        if not sealed:
+            return 0
+
+        # the compacted segment takes the place of the oldest one; the marker
+        # lets reopening the log finish deleting the others after a crash
+        records = sorted(fold(self.__read_sealed(sealed)))
+        path = self._path(sealed[0])
+        marker = os.path.join(self.directory, COMPACTION_MARKER)
+        self.__write_synced(path + COMPACTING_SUFFIX, (
+            part for offset, payload in records for part in (
+                RECORD.pack(len(payload), _checksum(offset, payload), offset),
+                payload)
+        ))
+        self.__write_synced(marker, [' '.join(
+            _segment_name(base) for base in sealed[1:]).encode('ascii')])
+        _fsync_directory(self.directory)
+        os.replace(path + COMPACTING_SUFFIX, path)
+        _fsync_directory(self.directory)
+
+        with self._lock:
+            self._segments = [sealed[0]] + self._segments[len(sealed):]
+        for base in sealed[1:]:
+            os.unlink(self._path(base))
+        os.unlink(marker)
+        _fsync_directory(self.directory)
+        return len(records)
+
+    def close(self) -> None:
+        if self._stream.closed:
+            return
+        self.commit()
+        self._stream.close()
+
+    def __enter__(self) -> 'SegmentedLog':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def __write_synced(path: str, parts: Iterable[bytes]) -> None:
+        with open(path, 'wb') as stream:
+            for part in parts:
+                stream.write(part)
+            stream.flush()
+            os.fsync(stream.fileno())
+
+    def __read_sealed(self, sealed: List[int]) -> Iterator[Record]:
+        for base in sealed:
+            for _, record in _read_records(self._path(base), strict=True):
+                yield record
+
+    def __roll(self) -> None:
+        if self._stream.tell() == 0:
+            return
+        self._stream.flush()
+        os.fsync(self._stream.fileno())
+        self._stream.close()
+        self._segments.append(self._next_offset)
+        self._stream = open(self._path(self._next_offset), 'ab')
+        _fsync_directory(self.directory)
+
+    def _write(self, offset: int, payload: bytes) -> None:
+        self._stream.write(RECORD.pack(
+            len(payload), _checksum(offset, payload), offset))
+        self._stream.write(payload)
+
+    def _path(self, base_offset: int) -> str:
+        return os.path.join(self.directory, _segment_name(base_offset))
@@ -0,0 +1,162 @@
+from array import array
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from typing import List, Optional, Sequence, Union
+import zlib
+
+
+# a snapshot is a header, a table of sections and the sections themselves,
+# each one starting on an 8 byte boundary. Everything is little-endian and
+# the checksum covers all the bytes after the header:
+#
+#   magic 8s | version u16 | section count u16 | row count u64 | crc32 u32
+#   section count * (offset u64 | length u64)
+#   sections
+HEADER = struct.Struct('<8sHHQI4x')
+SECTION = struct.Struct('<QQ')
+ALIGNMENT = 8
+
+Section = Union[bytes, bytearray, memoryview, array]
+
+
+def write_snapshot(
+    path: str,
+    magic: bytes,
+    version: int,
+    count: int,
+    sections: Sequence[Section]
+) -> int:
+    if len(magic) != 8:
+        raise ValueError('A snapshot magic must be 8 bytes long')
+    sections = [_to_bytes(section) for section in sections]
+
+    table = bytearray()
+    offset = _aligned(HEADER.size + SECTION.size * len(sections))
+    for section in sections:
+        table += SECTION.pack(offset, len(section))
+        offset = _aligned(offset + len(section))
+
+    # sections are written to a temporary file that replaces `path` once
+    # complete, so readers never map a half written snapshot
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as stream:
+            stream.write(bytes(HEADER.size))
+            checksum = zlib.crc32(table)
+            stream.write(table)
+            for section in sections:
+                padding = bytes(-stream.tell() % ALIGNMENT)
+                checksum = zlib.crc32(section, zlib.crc32(padding, checksum))
+                stream.write(padding)
+                stream.write(section)
+            size = stream.tell()
+            stream.seek(0)
+            stream.write(HEADER.pack(
+                magic, version, len(sections), count, checksum))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return size
+
+
+class Snapshot:
+    # a read only, memory mapped snapshot: sections are views into the
+    # mapping, so pages are only read from disk when they are touched
+
+    def __init__(
+        self,
+        path: str,
+        magic: bytes,
+        version: int,
+        verify: bool = True
+    ) -> None:
+        with open(path, 'rb') as stream:
+            self._mmap = mmap.mmap(
+                stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        try:
+            self._sections = self.__read_header(magic, version, verify)
+        except BaseException:
+            self.close()
+            raise
+
+    def __read_header(self, magic: bytes, version: int, verify: bool):
+        if len(self._mmap) < HEADER.size:
+            raise ValueError('Not a snapshot: the file is too short')
+        found_magic, found_version, section_count, self.count, checksum = \
+            HEADER.unpack_from(self._mmap)
+        if found_magic != magic:
+            raise ValueError(f'Not a {magic!r} snapshot')
+        if found_version != version:
+            raise ValueError(
+                f'Unsupported snapshot version {found_version}, '
+                f'expected {version}')
+
+        size = len(self._mmap)
+        if verify and zlib.crc32(self.__view(HEADER.size)) != checksum:
+            raise ValueError('Snapshot checksum does not match')
+
+        sections = [
+            SECTION.unpack_from(self._mmap, HEADER.size + SECTION.size * index)
+            for index in range(section_count)
+        ]
+        if any(offset + length > size for offset, length in sections):
+            raise ValueError('Snapshot is truncated')
+        return sections
+
+    def __len__(self) -> int:
+        return len(self._sections)
+
+    def section(self, index: int, format: str = 'B') -> Sequence:
+        offset, length = self._sections[index]
+        view = self.__view(offset, offset + length)
+        if format == 'B':
+            return view
+        if sys.byteorder == 'little':
+            view = view.cast(format)
+            self._views.append(view)
+            return view
+        values = array(format)
+        values.frombytes(view)
+        values.byteswap()
+        return values
+
+    def close(self) -> None:
+        # the mapping can only be closed once no view exports it
+        while self._views:
+            self._views.pop().release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __view(
+        self,
+        start: int = 0,
+        stop: Optional[int] = None
+    ) -> memoryview:
+        view = memoryview(self._mmap)
+        self._views.append(view)
+        view = view[start:stop]
+        self._views.append(view)
+        return view
+
+
+def _aligned(offset: int) -> int:
+    return offset + -offset % ALIGNMENT
+
+
+def _to_bytes(section: Section) -> memoryview:
+    if isinstance(section, array) and sys.byteorder == 'big' \
+            and section.itemsize > 1:
+        section = array(section.typecode, section)
+        section.byteswap()
+    return memoryview(section).cast('B')
@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from itertools import count
+import queue
+import sqlite3
+import threading
+from typing import Iterator, List, Optional
+
+
+_memory_databases = count()
+
+
+class ConnectionPool:
+    # hands each thread a connection of its own for the duration of a
+    # `with` block; connections are opened lazily up to `size` and reused,
+    # so sqlite's per-connection statement cache keeps statements prepared
+
+    PRAGMAS = (
+        'PRAGMA journal_mode = WAL',
+        'PRAGMA synchronous = NORMAL',
+        'PRAGMA foreign_keys = ON',
+    )
+
+    def __init__(
+        self,
+        database: str,
+        size: int = 5,
+        timeout: float = 30.0,
+        cached_statements: int = 256
+    ) -> None:
+        if size < 1:
+            raise ValueError('Pool size must be at least 1')
+        self.uri = database.startswith('file:')
+        if database == ':memory:':
+            # a private in-memory database shared by the pool's connections
+            database = f'file:memory-{next(_memory_databases)}' \
+                '?mode=memory&cache=shared'
+            self.uri = True
+        self.database = database
+        self.size = size
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        # keeps shared in-memory databases alive while the pool is open
+        self._keeper: Optional[sqlite3.Connection] = \
+            self._connect() if 'mode=memory' in database else None
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.database,
+            timeout=self.timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            uri=self.uri
+        )
+        for pragma in self.PRAGMAS:
+            connection.execute(pragma)
+        return connection
+
+    def _acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError('Connection pool is closed')
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._connections) < self.size:
+                connection = self._connect()
+                self._connections.append(connection)
+                return connection
+        return self._idle.get(timeout=self.timeout)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            if connection.in_transaction:
+                connection.rollback()
+            self._idle.put(connection)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+            except BaseException:
+                connection.rollback()
+                raise
+            connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+            if self._keeper is not None:
+                self._keeper.close()
+                self._keeper = None
@@ -0,0 +1,100 @@
+import csv
+from itertools import islice
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, TextIO, \
+    Tuple, TypeVar
+
+
+T = TypeVar('T')
+Record = Dict[str, Any]
+# a range of bytes of a file, from the first to one past the last
+Shard = Tuple[int, int]
+
+
+# every helper here is a generator or consumes one, so a pipeline only
+# holds one chunk at a time and reads more only when the consumer asks
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    if size < 1:
+        raise ValueError('Chunk size must be at least 1')
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_jsonl(stream: Iterable[str]) -> Iterator[Record]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as ex:
+            raise ValueError(f'Invalid JSON on line {line_number}') from ex
+        if not isinstance(record, dict):
+            raise ValueError(f'Expected an object on line {line_number}')
+        yield record
+
+
+def read_csv(stream: Iterable[str]) -> Iterator[Record]:
+    return iter(csv.DictReader(stream))
+
+
+# cuts the file at `path` into ranges of about `shard_bytes` that each end
+# on a line break, so separate processes can read and parse a range each
+def split_lines(path: str, shard_bytes: int) -> List[Shard]:
+    if shard_bytes < 1:
+        raise ValueError('Shard size must be at least 1')
+    size = os.path.getsize(path)
+    shards = []
+    with open(path, 'rb') as stream:
+        begin = 0
+        while begin < size:
+            stream.seek(begin + shard_bytes - 1)
+            stream.readline()
+            end = min(stream.tell(), size)
+            shards.append((begin, end))
+            begin = end
+    return shards
+
+
+def read_lines(path: str, shard: Shard) -> List[str]:
+    begin, end = shard
+    with open(path, 'rb') as stream:
+        stream.seek(begin)
+        # not splitlines, which also breaks on characters json leaves
+        # unescaped inside strings, such as U+2028
+        return str(stream.read(end - begin), 'utf-8').split('\n')
+
+
+def write_jsonl(
+    stream: TextIO,
+    records: Iterable[Record],
+    chunk_size: int = 1000
+) -> int:
+    written = 0
+    for chunk in chunked(records, chunk_size):
+        stream.write(''.join(
+            json.dumps(record, ensure_ascii=False) + '\n' for record in chunk
+        ))
+        written += len(chunk)
+    return written
+
+
+def write_csv(
+    stream: TextIO,
+    records: Iterable[Record],
+    fieldnames: Sequence[str],
+    chunk_size: int = 1000
+) -> int:
+    writer = csv.DictWriter(stream, fieldnames=fieldnames)
+    writer.writeheader()
+    written = 0
+    for chunk in chunked(records, chunk_size):
+        writer.writerows(chunk)
+        written += len(chunk)
+    return written
@@ -0,0 +1,131 @@
+import heapq
+from itertools import islice, takewhile
+import math
+import re
+import unicodedata
+from typing import Dict, Hashable, Iterator, List, Mapping, Optional, Tuple
+
+from __seedwork.infra.indexes import SortedIndex
+
+
+_TOKEN = re.compile(r'\w+')
+
+
+def normalize(text: str) -> str:
+    # case and accent insensitive: "Ação" and "acao" are the same term
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    ).casefold()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN.findall(normalize(text)) if text else []
+
+
+class InvertedIndex:
+    # term -> {document: weight} postings, plus a sorted index of terms so
+    # a query token is looked up as a prefix; every query token must match
+    # and documents rank by weight times idf, exact terms above prefixes
+
+    PREFIX_PENALTY = 0.5
+
+    def __init__(
+        self,
+        weights: Mapping[str, float],
+        max_expansions: int = 64
+    ) -> None:
+        self.weights = dict(weights)
+        self.max_expansions = max_expansions
+        self._postings: Dict[str, Dict[Hashable, float]] = {}
+        self._terms = SortedIndex()
+        self._documents: Dict[Hashable, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._documents
+
+    def add(self, key: Hashable, fields: Mapping[str, Optional[str]]) -> None:
+        terms: Dict[str, float] = {}
+        for field_name, text in fields.items():
+            weight = self.weights.get(field_name, 1.0)
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        if key in self._documents:
+            if self._documents[key] == terms:
+                return
+            self.remove(key)
+        self._documents[key] = terms
+        for term, weight in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._terms.add(term)
+            postings[key] = weight
+
+    def remove(self, key: Hashable) -> None:
+        for term in self._documents.pop(key, {}):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                self._terms.remove(term)
+
+    def expand(self, token: str) -> Iterator[str]:
+        return islice(
+            takewhile(lambda term: term.startswith(token),
+                      self._terms.irange(token)),
+            self.max_expansions)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[int, List[Tuple[Hashable, float]]]:
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return 0, []
+
+        total_documents = len(self._documents)
+        matches = []
+        for token in tokens:
+            scores: Dict[Hashable, float] = {}
+            for term in self.expand(token):
+                postings = self._postings[term]
+                factor = math.log(1 + total_documents / len(postings))
+                if term != token:
+                    factor *= self.PREFIX_PENALTY
+                if not scores:
+                    scores = {
+                        key: weight * factor
+                        for key, weight in postings.items()
+                    }
+                    continue
+                for key, weight in postings.items():
+                    score = weight * factor
+                    if score > scores.get(key, 0.0):
+                        scores[key] = score
+            if not scores:
+                return 0, []
+            matches.append(scores)
+
+        # intersect starting from the most selective token
+        matches.sort(key=len)
+        ranked = matches[0]
+        for scores in matches[1:]:
+            ranked = {
+                key: score + scores[key]
+                for key, score in ranked.items() if key in scores
+            }
+
+        # ties keep their insertion order, so pages are stable
+        if limit is None:
+            keys = sorted(ranked, key=ranked.__getitem__, reverse=True)
+        else:
+            keys = heapq.nlargest(
+                offset + limit, ranked, key=ranked.__getitem__)
+        return len(ranked), [(key, ranked[key]) for key in keys[offset:]]
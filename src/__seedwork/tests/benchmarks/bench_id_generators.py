@@ -0,0 +1,57 @@
+# python -m __seedwork.tests.benchmarks.bench_id_generators (from src/)
+import sqlite3
+import time
+
+from __seedwork.domain.value_objects import IdGenerator, RandomIdGenerator, \
+    TimeOrderedIdGenerator
+from __seedwork.infra.indexes import SortedIndex
+
+
+def sorted_index_inserts(ids: list) -> float:
+    index = SortedIndex()
+    start = time.perf_counter()
+    for raw in ids:
+        index.add(raw)
+    return time.perf_counter() - start
+
+
+def sqlite_inserts(ids: list, batch_size: int = 1_000) -> float:
+    connection = sqlite3.connect(':memory:')
+    connection.execute(
+        'CREATE TABLE ids (id BLOB PRIMARY KEY) WITHOUT ROWID')
+    start = time.perf_counter()
+    for offset in range(0, len(ids), batch_size):
+        with connection:
+            connection.executemany(
+                'INSERT INTO ids (id) VALUES (?)',
+                ((raw,) for raw in ids[offset:offset + batch_size]))
+    elapsed = time.perf_counter() - start
+    connection.close()
+    return elapsed
+
+
+def generate(generator: IdGenerator, count: int) -> list:
+    return [generator() for _ in range(count)]
+
+
+def main(count: int = 500_000) -> None:
+    generators = {
+        'uuid4 (random)': RandomIdGenerator(),
+        'uuid7 (time ordered)': TimeOrderedIdGenerator()
+    }
+    print(f'{count} ids per run')
+    print(f'{"generator":<22}{"generate":>12}{"SortedIndex":>14}'
+          f'{"sqlite pk":>12}')
+    for name, generator in generators.items():
+        start = time.perf_counter()
+        ids = generate(generator, count)
+        generated = time.perf_counter() - start
+        timings = [generated, sorted_index_inserts(ids), sqlite_inserts(ids)]
+        print(f'{name:<22}' + ''.join(
+            f'{timing / count * 1e9:>{width - 3}.0f} ns'
+            for timing, width in zip(timings, (12, 14, 12))
+        ))
+
+
+if __name__ == '__main__':
+    main()
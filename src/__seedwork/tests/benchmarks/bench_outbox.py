@@ -0,0 +1,45 @@
+# python -m __seedwork.tests.benchmarks.bench_outbox (from src/)
+import os
+import tempfile
+import time
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+from __seedwork.infra.outbox import InMemorySink, JsonlFileSink, Outbox
+
+
+def publish(count: int) -> float:
+    events = [DomainEvent(aggregate_id=str(index)) for index in range(count)]
+    start = time.perf_counter()
+    for event in events:
+        DomainEvents.publish(event)
+    return time.perf_counter() - start
+
+
+def run(name: str, sink, max_batch_size: int, count: int) -> None:
+    # publish time is the write path; throughput runs until the last
+    # batch has reached the sink
+    outbox = Outbox(sink, max_batch_size=max_batch_size)
+    start = time.perf_counter()
+    with outbox:
+        write_path = publish(count)
+    drained = time.perf_counter() - start
+    sink.close()
+    print(f'{name:<12}{max_batch_size:>7}'
+          f'{write_path / count * 1e9:>14.0f} ns'
+          f'{count / drained:>14.0f}/s{outbox.batches:>9}')
+
+
+def main(count: int = 200_000) -> None:
+    print(f'no handler   {publish(count) / count * 1e9:>19.0f} ns')
+    print(f'{"sink":<12}{"batch":>7}{"publish":>17}{"throughput":>16}'
+          f'{"batches":>9}')
+    with tempfile.TemporaryDirectory() as directory:
+        for max_batch_size in (1, 50, 500, 5000):
+            run('memory', InMemorySink(), max_batch_size, count)
+            run('jsonl file',
+                JsonlFileSink(os.path.join(directory, 'events.jsonl')),
+                max_batch_size, count // 4)
+
+
+if __name__ == '__main__':
+    main()
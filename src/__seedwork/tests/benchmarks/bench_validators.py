@@ -0,0 +1,61 @@
+# python -m __seedwork.tests.benchmarks.bench_validators (from src/)
+import timeit
+
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.validators import FieldRules, ValidationSchema, \
+    ValidatorRules
+
+
+SCHEMA = ValidationSchema(
+    FieldRules('name').required().string().max_length(255),
+    FieldRules('description').string(),
+    FieldRules('is_active').boolean()
+)
+
+VALID = ('Movie', 'some description', True)
+INVALID = ('a'*256, 5, 5)
+
+
+def chained_rules(name, description, is_active, errors=None):
+    ValidatorRules.values(name, 'name', errors) \
+        .required().string().max_length(255)
+    ValidatorRules.values(description, 'description', errors).string()
+    ValidatorRules.values(is_active, 'is_active', errors).boolean()
+
+
+def raising(validate, values):
+    try:
+        validate(*values)
+    except ValidationException:
+        pass
+
+
+def measure(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) \
+        / number * 1e9
+
+
+def main(number: int = 200_000) -> None:
+    cases = [
+        ('valid',
+         lambda: chained_rules(*VALID),
+         lambda: SCHEMA.validate(*VALID)),
+        ('invalid (raise)',
+         lambda: raising(chained_rules, INVALID),
+         lambda: raising(SCHEMA.validate, INVALID)),
+        ('invalid (collect)',
+         lambda: chained_rules(*INVALID, {}),
+         lambda: SCHEMA.collect(*INVALID, {})),
+    ]
+
+    print(f'{"case":<20}{"ValidatorRules":>16}{"ValidationSchema":>18}'
+          f'{"speedup":>10}')
+    for case, chained, compiled in cases:
+        chained_ns = measure(chained, number)
+        compiled_ns = measure(compiled, number)
+        print(f'{case:<20}{chained_ns:>13.0f} ns{compiled_ns:>15.0f} ns'
+              f'{chained_ns / compiled_ns:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+import argparse
+from dataclasses import asdict, dataclass
+import gc
+import json
+import os
+import re
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Benchmark:
+    name: str
+    function: Callable[[], object]
+    # operations per timed sample; latency percentiles are taken across
+    # samples, since timing a single fast op mostly measures the clock
+    batch: int = 100
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    p50_ns: float
+    p95_ns: float
+    p99_ns: float
+    allocations_per_op: float
+    bytes_per_op: float
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(
+    benchmark: Benchmark,
+    samples: int = 200,
+    warmup: int = 20
+) -> BenchmarkResult:
+    function, batch = benchmark.function, range(benchmark.batch)
+    for _ in range(warmup):
+        for _ in batch:
+            function()
+
+    timings = []
+    perf_counter_ns = time.perf_counter_ns
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            start = perf_counter_ns()
+            for _ in batch:
+                function()
+            timings.append((perf_counter_ns() - start) / benchmark.batch)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    timings.sort()
+
+    allocations, allocated = measure_allocations(function, benchmark.batch)
+    return BenchmarkResult(
+        name=benchmark.name,
+        ops_per_sec=1e9 / (sum(timings) / len(timings)),
+        p50_ns=percentile(timings, 0.50),
+        p95_ns=percentile(timings, 0.95),
+        p99_ns=percentile(timings, 0.99),
+        allocations_per_op=allocations,
+        bytes_per_op=allocated
+    )
+
+
+def measure_allocations(
+    function: Callable[[], object],
+    number: int
+) -> Tuple[float, float]:
+    # tracing starts before anything is read, so none of tracemalloc's own
+    # bookkeeping is counted. The allocations are the blocks an op leaves
+    # allocated (the objects it returns), from snapshot diffs; the bytes are
+    # the peak above what was allocated before the op while it runs, which
+    # counts its temporaries too. Objects reused from free lists are not
+    # allocated, so neither number counts them
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    tracemalloc.start()
+    try:
+        allocated = _peak(function, number) - _peak(_nothing, number)
+        results: List[object] = [None] * number
+        first = tracemalloc.take_snapshot()
+        second = tracemalloc.take_snapshot()
+        for index in range(number):
+            results[index] = function()
+        third = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        if gc_was_enabled:
+            gc.enable()
+    # what taking a snapshot itself leaves allocated is taken off
+    allocations = _blocks(third, second) - _blocks(second, first)
+    return max(allocations / number, 0.0), max(allocated, 0.0)
+
+
+def compare(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, dict],
+    threshold: float
+) -> List[Regression]:
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        if result.ops_per_sec < previous['ops_per_sec'] * (1 - threshold):
+            regressions.append(Regression(
+                result.name, 'ops_per_sec',
+                previous['ops_per_sec'], result.ops_per_sec))
+        # tail latency is noisier, so it gets twice the slack
+        if result.p99_ns > previous['p99_ns'] * (1 + threshold * 2):
+            regressions.append(Regression(
+                result.name, 'p99_ns', previous['p99_ns'], result.p99_ns))
+        # allocations are deterministic, so any growth above half an
+        # allocation per op is a regression
+        if result.allocations_per_op \
+                > previous['allocations_per_op'] + 0.5:
+            regressions.append(Regression(
+                result.name, 'allocations_per_op',
+                previous['allocations_per_op'], result.allocations_per_op))
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def save_baseline(path: str, results: Sequence[BenchmarkResult]) -> None:
+    baseline = load_baseline(path)
+    baseline.update({result.name: asdict(result) for result in results})
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(baseline, file, indent=2, sort_keys=True)
+
+
+def report(result: BenchmarkResult) -> str:
+    return (f'{result.name:<36}{result.ops_per_sec:>14,.0f}'
+            f'{result.p50_ns:>10,.0f}{result.p95_ns:>10,.0f}'
+            f'{result.p99_ns:>10,.0f}{result.allocations_per_op:>9.1f}'
+            f'{result.bytes_per_op:>10,.0f}')
+
+
+def main(
+    benchmarks: Sequence[Benchmark],
+    argv: Optional[Sequence[str]] = None
+) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--baseline', default='.benchmarks/baseline.json')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown before failing, 0.2 = 20%%')
+    parser.add_argument('--samples', type=int, default=200)
+    parser.add_argument('--filter', default='',
+                        help='only run benchmarks matching this regex')
+    args = parser.parse_args(argv)
+
+    selected = [
+        benchmark for benchmark in benchmarks
+        if re.search(args.filter, benchmark.name)
+    ]
+    print(f'{"benchmark":<36}{"ops/s":>14}{"p50 ns":>10}{"p95 ns":>10}'
+          f'{"p99 ns":>10}{"allocs":>9}{"bytes":>10}')
+    results = []
+    for benchmark in selected:
+        results.append(run(benchmark, samples=args.samples))
+        print(report(results[-1]), flush=True)
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f'baseline saved to {args.baseline}')
+        return 0
+
+    regressions = compare(
+        results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression.name} {regression.metric}: '
+              f'{regression.baseline:,.1f} -> {regression.current:,.1f} '
+              f'({regression.change:+.0%})')
+    return 1 if regressions else 0
+
+
+def _nothing() -> None:
+    return None
+
+
+def _peak(function: Callable[[], object], number: int) -> float:
+    total = 0
+    get_traced_memory = tracemalloc.get_traced_memory
+    for _ in range(number):
+        tracemalloc.reset_peak()
+        before, _ = get_traced_memory()
+        function()
+        _, peak = get_traced_memory()
+        total += peak - before
+    return total / number
+
+
+def _blocks(
+    snapshot: tracemalloc.Snapshot,
+    previous: tracemalloc.Snapshot
+) -> int:
+    return sum(
+        statistic.count_diff
+        for statistic in snapshot.compare_to(previous, 'filename'))
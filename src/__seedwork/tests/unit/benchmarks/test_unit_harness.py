@@ -0,0 +1,85 @@
+from dataclasses import asdict, replace
+import unittest
+
+from __seedwork.tests.benchmarks.harness import BenchmarkResult, \
+    Regression, compare, measure_allocations, percentile
+
+
+class TestPercentile(unittest.TestCase):
+
+    def test_percentile(self):
+        ordered = list(range(1, 101))
+
+        self.assertEqual(percentile(ordered, 0.0), 1)
+        self.assertEqual(percentile(ordered, 0.50), 51)
+        self.assertEqual(percentile(ordered, 0.95), 96)
+        self.assertEqual(percentile(ordered, 0.99), 100)
+        self.assertEqual(percentile(ordered, 1.0), 100)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertEqual(percentile([1, 2], 0.50), 2)
+
+
+class TestCompare(unittest.TestCase):
+
+    def setUp(self):
+        self.result = BenchmarkResult(
+            name='op', ops_per_sec=1000.0, p50_ns=900.0, p95_ns=950.0,
+            p99_ns=1000.0, allocations_per_op=2.0, bytes_per_op=100.0)
+        self.baseline = {'op': asdict(self.result)}
+
+    def regressions(self, **changes):
+        return compare(
+            [replace(self.result, **changes)], self.baseline, threshold=0.2)
+
+    def test_within_threshold(self):
+        self.assertEqual(self.regressions(), [])
+        self.assertEqual(self.regressions(
+            ops_per_sec=801.0, p99_ns=1399.0, allocations_per_op=2.5,
+            bytes_per_op=10 ** 6, p50_ns=10 ** 6), [])
+        self.assertEqual(
+            self.regressions(ops_per_sec=10 ** 6, p99_ns=1.0), [])
+
+    def test_regressions(self):
+        self.assertEqual(self.regressions(ops_per_sec=799.0), [
+            Regression('op', 'ops_per_sec', 1000.0, 799.0)])
+        # tail latency gets twice the threshold
+        self.assertEqual(self.regressions(p99_ns=1401.0), [
+            Regression('op', 'p99_ns', 1000.0, 1401.0)])
+        self.assertEqual(self.regressions(allocations_per_op=2.6), [
+            Regression('op', 'allocations_per_op', 2.0, 2.6)])
+        self.assertEqual(
+            [regression.metric for regression in self.regressions(
+                ops_per_sec=1.0, p99_ns=10 ** 6, allocations_per_op=9.0)],
+            ['ops_per_sec', 'p99_ns', 'allocations_per_op'])
+
+    def test_without_baseline(self):
+        self.assertEqual(
+            compare([self.result], {}, threshold=0.2), [])
+        self.assertEqual(compare(
+            [replace(self.result, name='new', ops_per_sec=1.0)],
+            self.baseline, threshold=0.2), [])
+
+    def test_change(self):
+        self.assertAlmostEqual(
+            Regression('op', 'p99_ns', 1000.0, 1500.0).change, 0.5)
+        self.assertEqual(Regression('op', 'p99_ns', 0.0, 1.0).change, 0.0)
+
+
+class TestMeasureAllocations(unittest.TestCase):
+
+    def test_counts_what_an_op_keeps_and_its_peak(self):
+        allocations, allocated = measure_allocations(lambda: None, 100)
+        self.assertEqual(allocations, 0.0)
+        self.assertLess(allocated, 64)
+
+        allocations, allocated = measure_allocations(
+            lambda: bytearray(10_000), 100)
+        # the bytearray object and its buffer
+        self.assertEqual(round(allocations), 2)
+        self.assertGreaterEqual(allocated, 10_000)
+
+    def test_counts_temporaries_in_the_peak(self):
+        allocations, allocated = measure_allocations(
+            lambda: bool(bytearray(100_000)), 100)
+        self.assertLess(allocations, 0.5)
+        self.assertGreaterEqual(allocated, 100_000)
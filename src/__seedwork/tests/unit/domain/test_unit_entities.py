@@ -1,4 +1,5 @@
 from abc import ABC
+from copy import copy
 from dataclasses import dataclass, is_dataclass
 import unittest
 
@@ -47,3 +48,134 @@ class TestEntityUnit(unittest.TestCase):
 
         self.assertEqual(entity.attribute_1, "value_changed_1")
         self.assertEqual(entity.attribute_2, "value_changed_2")
+
+    def test_notify_observers_on_set(self):
+        changes = []
+
+        def observer(entity, name, old_value, new_value):
+            changes.append((entity, name, old_value, new_value))
+
+        StubEntity.observe(observer)
+        try:
+            entity = StubEntity(attribute_1="value_1", attribute_2="value_2")
+            entity._set("attribute_1", "value_changed_1")
+        finally:
+            StubEntity.unobserve(observer)
+        entity._set("attribute_2", "value_changed_2")
+
+        self.assertEqual(changes, [
+            (entity, "attribute_1", "value_1", "value_changed_1")
+        ])
+
+    def test_observers_are_held_weakly(self):
+        changes = []
+
+        class Listener:
+            def on_change(self, entity, name, old_value, new_value):
+                changes.append(name)
+
+        listener = Listener()
+        StubEntity.observe(listener.on_change)
+        entity = StubEntity(attribute_1="value_1", attribute_2="value_2")
+        entity._set("attribute_1", "value_changed_1")
+
+        del listener
+        entity._set("attribute_2", "value_changed_2")
+
+        self.assertEqual(changes, ["attribute_1"])
+        self.assertNotIn(StubEntity, Entity._observers)
+
+    def test_copy(self):
+        @dataclass(frozen=True, kw_only=True)
+        class ValidatingStubEntity(StubEntity):
+            def __new__(cls, **kwargs):
+                if 'attribute_1' not in kwargs:
+                    raise ValueError()
+                return super().__new__(cls)
+
+        entity = ValidatingStubEntity(
+            attribute_1="value_1", attribute_2="value_2")
+        clone = copy(entity)
+
+        self.assertIsNot(clone, entity)
+        self.assertEqual(clone, entity)
+        clone._set("attribute_1", "value_changed_1")
+        self.assertEqual(entity.attribute_1, "value_1")
+
+    def test_track_changed_fields(self):
+        entity = StubEntity(attribute_1="value_1", attribute_2="value_2")
+        self.assertTrue(entity.is_dirty)
+        self.assertEqual(entity.changed_fields(),
+                         ('unique_entity_id', 'attribute_1', 'attribute_2'))
+
+        entity.clear_changes()
+        self.assertFalse(entity.is_dirty)
+        self.assertEqual(entity.changed_fields(), ())
+
+        entity._set("attribute_2", "value_changed_2")
+        self.assertTrue(entity.is_dirty)
+        self.assertEqual(entity.changed_fields(), ('attribute_2',))
+        self.assertNotIn('_changes', entity.to_dict())
+        self.assertNotIn('_version', entity.to_dict())
+        self.assertEqual(entity.version, 0)
+
+    def test_skip_no_op_set(self):
+        changes = []
+
+        def observer(*change):
+            changes.append(change)
+
+        StubEntity.observe(observer)
+        self.addCleanup(StubEntity.unobserve, observer)
+
+        entity = StubEntity(attribute_1="value_1", attribute_2=True)
+        entity.clear_changes()
+        entity._set("attribute_1", "value_1")
+        entity._set("attribute_2", True)
+        self.assertFalse(entity.is_dirty)
+        self.assertEqual(changes, [])
+
+        entity._set("attribute_2", 1)
+        self.assertEqual(entity.changed_fields(), ('attribute_2',))
+
+    def test_from_persistence(self):
+        unique_entity_id = UniqueEntityId()
+        entity = StubEntity.from_persistence(
+            attribute_2='value_2',
+            unique_entity_id=unique_entity_id,
+            attribute_1='value_1'
+        )
+
+        self.assertIs(entity.unique_entity_id, unique_entity_id)
+        self.assertEqual(entity.attribute_1, 'value_1')
+        self.assertEqual(entity.attribute_2, 'value_2')
+        self.assertFalse(entity.is_dirty)
+
+        with self.assertRaises(TypeError):
+            StubEntity.from_persistence(
+                unique_entity_id=unique_entity_id, attribute_1='value_1')
+
+    def test_rehydrate_many(self):
+        @dataclass(frozen=True, slots=True, kw_only=True)
+        class SlottedStubEntity(Entity):
+            attribute_1: str
+            attribute_2: str = 'default'
+
+            def __new__(cls, **kwargs):
+                raise AssertionError('__new__ must not run')
+
+        ids = [UniqueEntityId(), UniqueEntityId()]
+        entities = SlottedStubEntity.rehydrate_many(
+            [(ids[0], 'a', 'b'), (ids[1], 'c', 'd')])
+
+        self.assertEqual(
+            [(entity.unique_entity_id, entity.attribute_1,
+              entity.attribute_2) for entity in entities],
+            [(ids[0], 'a', 'b'), (ids[1], 'c', 'd')])
+        self.assertFalse(any(entity.is_dirty for entity in entities))
+        self.assertEqual([entity.version for entity in entities], [0, 0])
+        entities[0]._set('attribute_1', 'changed')
+        self.assertEqual(entities[0].changed_fields(), ('attribute_1',))
+
+        with self.assertRaises(ValueError):
+            SlottedStubEntity.rehydrate_many([(ids[0], 'a')])
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from datetime import datetime
+import unittest
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StubEvent(DomainEvent):
+    value: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class OtherStubEvent(DomainEvent):
+    pass
+
+
+class TestDomainEventUnit(unittest.TestCase):
+
+    def test_to_dict(self):
+        occurred_on = datetime(2022, 6, 1)
+        event = StubEvent(aggregate_id='id', occurred_on=occurred_on, value=1)
+
+        self.assertEqual(event.event_name, 'StubEvent')
+        self.assertEqual(event.to_dict(), {
+            'event_name': 'StubEvent',
+            'aggregate_id': 'id',
+            'occurred_on': occurred_on,
+            'value': 1
+        })
+        self.assertEqual(event.to_dict(json_ready=True)['occurred_on'],
+                         '2022-06-01T00:00:00')
+
+
+class TestDomainEventsUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.received = []
+
+    def handler(self, event):
+        self.received.append(event)
+
+    def test_publish_to_subscribers_of_the_class_and_its_bases(self):
+        all_events = []
+
+        def on_any(event):
+            all_events.append(event)
+
+        DomainEvents.subscribe(StubEvent, self.handler)
+        DomainEvents.subscribe(DomainEvent, on_any)
+        self.addCleanup(DomainEvents.unsubscribe, StubEvent, self.handler)
+        self.addCleanup(DomainEvents.unsubscribe, DomainEvent, on_any)
+
+        stub_event = StubEvent(aggregate_id='1')
+        other_event = OtherStubEvent(aggregate_id='2')
+        DomainEvents.publish(stub_event)
+        DomainEvents.publish(other_event)
+
+        self.assertEqual(self.received, [stub_event])
+        self.assertEqual(all_events, [stub_event, other_event])
+
+    def test_unsubscribe(self):
+        DomainEvents.subscribe(StubEvent, self.handler)
+        DomainEvents.unsubscribe(StubEvent, self.handler)
+        DomainEvents.publish(StubEvent(aggregate_id='1'))
+
+        self.assertEqual(self.received, [])
+        self.assertNotIn(StubEvent, DomainEvents._handlers)
+
+    def test_handlers_are_held_weakly(self):
+        received = []
+
+        class Listener:
+            def on_event(self, event):
+                received.append(event)
+
+        listener = Listener()
+        DomainEvents.subscribe(StubEvent, listener.on_event)
+        DomainEvents.publish(StubEvent(aggregate_id='1'))
+        del listener
+        DomainEvents.publish(StubEvent(aggregate_id='2'))
+
+        self.assertEqual(len(received), 1)
+        self.assertNotIn(StubEvent, DomainEvents._handlers)
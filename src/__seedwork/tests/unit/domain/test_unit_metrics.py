@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from typing import Optional
+import unittest
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.metrics import Counter, Histogram, Instrumentation, \
+    MetricsRegistry
+from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True, slots=True)
+class StubEntity(Entity):
+    prop1: Optional[str] = None
+
+
+class TestMetricsRegistryUnit(unittest.TestCase):
+
+    def test_counter(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('calls_total', 'Calls', ('path',))
+        counter.inc(('a',))
+        counter.inc(('a',), 2)
+
+        self.assertIsInstance(counter, Counter)
+        self.assertIs(registry.counter('calls_total', 'Calls', ('path',)),
+                      counter)
+        self.assertEqual(counter.value(('a',)), 3)
+        self.assertEqual(counter.value(('b',)), 0)
+
+    def test_register_conflict(self):
+        registry = MetricsRegistry()
+        registry.counter('calls_total', 'Calls')
+        with self.assertRaises(ValueError):
+            registry.histogram('calls_total', 'Calls')
+        with self.assertRaises(ValueError):
+            registry.counter('calls_total', 'Calls', ('path',))
+
+    def test_histogram(self):
+        histogram = MetricsRegistry().histogram(
+            'latency_seconds', 'Latency', buckets=(1, 0.1))
+        for value in (0.05, 0.1, 0.5, 2):
+            histogram.observe(value)
+
+        self.assertIsInstance(histogram, Histogram)
+        self.assertEqual(histogram.buckets, (0.1, 1))
+        self.assertEqual(histogram.count(), 4)
+        self.assertAlmostEqual(histogram.sum(), 2.65)
+
+    def test_to_prometheus(self):
+        registry = MetricsRegistry()
+        self.assertEqual(registry.to_prometheus(), '')
+
+        registry.counter('calls_total', 'Calls', ('path',)) \
+            .inc(('say "hi"',))
+        histogram = registry.histogram(
+            'latency_seconds', 'Latency', ('path',), buckets=(0.1, 1))
+        histogram.observe(0.05, ('a',))
+        histogram.observe(0.5, ('a',))
+        histogram.observe(2, ('a',))
+
+        self.assertEqual(registry.to_prometheus(), '\n'.join([
+            '# HELP calls_total Calls',
+            '# TYPE calls_total counter',
+            'calls_total{path="say \\"hi\\""} 1',
+            '# HELP latency_seconds Latency',
+            '# TYPE latency_seconds histogram',
+            'latency_seconds_bucket{path="a",le="0.1"} 1',
+            'latency_seconds_bucket{path="a",le="1"} 2',
+            'latency_seconds_bucket{path="a",le="+Inf"} 3',
+            'latency_seconds_sum{path="a"} 2.55',
+            'latency_seconds_count{path="a"} 3',
+        ]) + '\n')
+
+        registry.reset()
+        self.assertNotIn('calls_total{', registry.to_prometheus())
+
+
+class TestInstrumentationUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.instrumentation = Instrumentation()
+        self.addCleanup(self.instrumentation.disable)
+
+    def test_enable_and_disable_restore_originals(self):
+        originals = (ValidatorRules.required, UniqueEntityId.__init__,
+                     UniqueEntityId.__dict__['trusted'], Entity.to_dict,
+                     StubEntity.__init__)
+
+        self.instrumentation.enable(StubEntity)
+        self.assertTrue(self.instrumentation.enabled)
+        self.assertIsNot(ValidatorRules.required, originals[0])
+        with self.assertRaises(RuntimeError):
+            Instrumentation().enable()
+
+        self.instrumentation.disable()
+        self.assertFalse(self.instrumentation.enabled)
+        self.assertEqual(
+            (ValidatorRules.required, UniqueEntityId.__init__,
+             UniqueEntityId.__dict__['trusted'], Entity.to_dict,
+             StubEntity.__init__),
+            originals)
+        self.assertEqual(StubEntity(prop1='a').prop1, 'a')
+
+    def test_rules(self):
+        with self.instrumentation as instrumentation:
+            ValidatorRules.values('Movie', 'name').required().string() \
+                .max_length(10)
+            with self.assertRaises(ValidationException):
+                ValidatorRules.values(5, 'name').required().string()
+            errors = {}
+            ValidatorRules.values('a'*11, 'name', errors) \
+                .required().max_length(10).string()
+
+        executions = instrumentation.rule_executions
+        self.assertEqual(executions.value(('required',)), 3)
+        self.assertEqual(executions.value(('string',)), 2)
+        self.assertEqual(executions.value(('max_length',)), 2)
+        self.assertEqual(instrumentation.rule_seconds.count(('string',)), 2)
+
+        failures = instrumentation.validation_failures
+        self.assertEqual(failures.values, {
+            ('name', 'string'): 1, ('name', 'max_length'): 1})
+
+    def test_ids_and_to_dict(self):
+        with self.instrumentation.enable(StubEntity) as instrumentation:
+            entity = StubEntity(prop1='a')
+            UniqueEntityId('5490020a-e866-4229-9adc-aa44b83234c4')
+            UniqueEntityId.trusted('5490020a-e866-4229-9adc-aa44b83234c4')
+            self.assertEqual(entity.to_dict()['prop1'], 'a')
+
+        self.assertEqual(instrumentation.id_creations.values, {
+            ('generated',): 1, ('parsed',): 1, ('trusted',): 1})
+        self.assertEqual(
+            instrumentation.to_dict_calls.value(('StubEntity',)), 1)
+        self.assertEqual(instrumentation.to_dict_seconds.count(
+            ('StubEntity',)), 1)
+        self.assertEqual(instrumentation.constructions.value(
+            ('StubEntity', 'ok')), 1)
+        self.assertEqual(instrumentation.construction_seconds.count(
+            ('StubEntity', 'init')), 1)
+
+        entity.to_dict()
+        self.assertEqual(
+            instrumentation.to_dict_calls.value(('StubEntity',)), 1)
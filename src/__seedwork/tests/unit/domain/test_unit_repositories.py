@@ -0,0 +1,183 @@
+from abc import ABC
+from datetime import datetime
+import unittest
+
+from __seedwork.domain.exceptions import InvalidCursorException
+from __seedwork.domain.repositories import Cursor, CursorPage, \
+    CursorParams, RepositoryInterface, SearchableRepositoryInterface, \
+    SearchParams, SearchResult
+
+
+class TestRepositoryInterface(unittest.TestCase):
+
+    def test_throw_error_when_methods_not_implemented(self):
+        with self.assertRaises(TypeError):
+            RepositoryInterface()
+
+        with self.assertRaises(TypeError):
+            SearchableRepositoryInterface()
+
+    def test_if_is_a_abstract_class(self):
+        self.assertTrue(issubclass(SearchableRepositoryInterface, ABC))
+        self.assertTrue(issubclass(
+            SearchableRepositoryInterface, RepositoryInterface))
+
+
+class TestSearchParams(unittest.TestCase):
+
+    def test_default_values(self):
+        params = SearchParams()
+        self.assertEqual(params.page, 1)
+        self.assertEqual(params.per_page, 15)
+        self.assertIsNone(params.sort)
+        self.assertIsNone(params.sort_dir)
+        self.assertIsNone(params.filter)
+
+    def test_page_and_per_page_normalization(self):
+        arrange = [
+            (None, 1), ('', 1), ('fake', 1), (0, 1), (-1, 1), ('0', 1),
+            (5.5, 5), (True, 1), (False, 1), ({}, 1), (1, 1), (2, 2)
+        ]
+        for value, expected in arrange:
+            self.assertEqual(SearchParams(page=value).page, expected,
+                             msg=f'page: {value}')
+
+        self.assertEqual(SearchParams(per_page=0).per_page, 15)
+        self.assertEqual(SearchParams(per_page='fake').per_page, 15)
+        self.assertEqual(SearchParams(per_page='10').per_page, 10)
+
+    def test_sort_and_sort_dir_normalization(self):
+        self.assertIsNone(SearchParams(sort='').sort)
+        self.assertEqual(SearchParams(sort=5).sort, '5')
+        self.assertIsNone(SearchParams(sort_dir='desc').sort_dir)
+
+        arrange = [(None, 'asc'), ('', 'asc'), ('fake', 'asc'),
+                   ('ASC', 'asc'), ('DESC', 'desc'), ('desc', 'desc')]
+        for value, expected in arrange:
+            self.assertEqual(
+                SearchParams(sort='name', sort_dir=value).sort_dir,
+                expected, msg=f'sort_dir: {value}')
+
+    def test_filter_normalization(self):
+        self.assertIsNone(SearchParams(filter='').filter)
+        self.assertEqual(SearchParams(filter='test').filter, 'test')
+
+
+class TestSearchResult(unittest.TestCase):
+
+    def test_constructor(self):
+        result = SearchResult(
+            items=['entity1', 'entity2'],
+            total=4,
+            current_page=1,
+            per_page=2,
+            sort='name',
+            sort_dir='asc',
+            filter='test'
+        )
+
+        self.assertDictEqual(result.to_dict(), {
+            'items': ['entity1', 'entity2'],
+            'total': 4,
+            'current_page': 1,
+            'per_page': 2,
+            'last_page': 2,
+            'sort': 'name',
+            'sort_dir': 'asc',
+            'filter': 'test'
+        })
+
+    def test_last_page_when_total_is_not_a_multiple_of_per_page(self):
+        result = SearchResult(items=[], total=101, current_page=1,
+                              per_page=20)
+        self.assertEqual(result.last_page, 6)
+
+
+class TestCursor(unittest.TestCase):
+
+    def test_encode_and_decode(self):
+        for cursor in (
+            Cursor((datetime(2022, 6, 1, 12, 30), 'id')),
+            Cursor((None, 1, 1.5, True), backward=True),
+            Cursor(())
+        ):
+            with self.subTest(cursor=cursor):
+                token = cursor.encode()
+                self.assertNotIn('=', token)
+                self.assertEqual(Cursor.decode(token), cursor)
+
+    def test_decode_invalid_token(self):
+        for token in ('', 'not a cursor', Cursor(('id',)).encode()[:-2],
+                      'WyJ4Il0'):
+            with self.subTest(token=token):
+                with self.assertRaises(InvalidCursorException):
+                    Cursor.decode(token)
+
+    def test_encode_unsupported_value(self):
+        with self.assertRaises(TypeError):
+            Cursor((object(),)).encode()
+
+
+class TestCursorParams(unittest.TestCase):
+
+    def test_normalize(self):
+        params = CursorParams(cursor='', per_page='fake', sort_dir='ASC',
+                              filter='')
+        self.assertIsNone(params.cursor)
+        self.assertEqual(params.per_page, 15)
+        self.assertEqual(params.sort_dir, 'asc')
+        self.assertIsNone(params.filter)
+        self.assertFalse(params.descending)
+
+        params = CursorParams(per_page=0, sort_dir='fake')
+        self.assertEqual(params.per_page, 15)
+        self.assertEqual(params.sort_dir, 'desc')
+
+    def test_decode_cursor(self):
+        cursor = Cursor(('id',), backward=True)
+        params = CursorParams(cursor=cursor.encode())
+        self.assertEqual(params.cursor, cursor)
+        self.assertTrue(params.backward)
+        self.assertFalse(params.descending)
+
+
+class TestCursorPage(unittest.TestCase):
+
+    def key(self, item):
+        return item,
+
+    def test_first_page(self):
+        page = CursorPage.from_window(
+            [1, 2, 3], CursorParams(per_page=2), self.key)
+        self.assertEqual(page.items, [1, 2])
+        self.assertEqual(page.next_cursor, Cursor((2,)).encode())
+        self.assertIsNone(page.previous_cursor)
+
+    def test_last_page(self):
+        params = CursorParams(per_page=2, cursor=Cursor((2,)))
+        page = CursorPage.from_window([3], params, self.key)
+        self.assertEqual(page.items, [3])
+        self.assertIsNone(page.next_cursor)
+        self.assertEqual(page.previous_cursor, Cursor((3,), True).encode())
+
+    def test_backward_page(self):
+        params = CursorParams(per_page=2, cursor=Cursor((4,), True))
+        page = CursorPage.from_window([3, 2, 1], params, self.key)
+        self.assertEqual(page.items, [2, 3])
+        self.assertEqual(page.next_cursor, Cursor((3,)).encode())
+        self.assertEqual(page.previous_cursor, Cursor((2,), True).encode())
+
+        page = CursorPage.from_window([1], params, self.key)
+        self.assertIsNone(page.previous_cursor)
+
+    def test_to_dict(self):
+        page = CursorPage.from_window(
+            [1], CursorParams(sort_dir='asc'), self.key)
+        self.assertDictEqual(page.to_dict(), {
+            'items': [1],
+            'per_page': 15,
+            'next_cursor': None,
+            'previous_cursor': None,
+            'sort_dir': 'asc',
+            'filter': None
+        })
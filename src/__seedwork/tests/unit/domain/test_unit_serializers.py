@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional
+import unittest
+import uuid
+
+from __seedwork.domain.entities import Entity
+from __seedwork.domain.serializers import EntitySerializer, to_builtin
+from __seedwork.domain.value_objects import UniqueEntityId
+
+
+@dataclass(frozen=True)
+class StubValueObject:
+    value: str
+    created_at: datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class StubEntity(Entity):
+    name: str
+    created_at: Optional[datetime] = None
+    tags: List[str] = field(default_factory=list)
+    extra: Any = None
+    _internal: int = 0
+
+
+class TestEntitySerializerUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.created_at = datetime(2022, 6, 1, 12, 30)
+        self.entity = StubEntity(
+            unique_entity_id=UniqueEntityId(
+                '08976216-4179-40bd-ba77-d357c95b9bba'),
+            name='name',
+            created_at=self.created_at,
+            tags=['a', 'b'],
+            extra=StubValueObject('value', self.created_at)
+        )
+
+    def test_serializer_is_built_once_per_class(self):
+        serializer = EntitySerializer.for_class(StubEntity)
+
+        self.assertIs(EntitySerializer.for_class(StubEntity), serializer)
+        self.assertEqual(serializer.fields, (
+            'unique_entity_id', 'name', 'created_at', 'tags', 'extra'))
+        self.assertEqual(serializer.keys, (
+            'name', 'created_at', 'tags', 'extra', 'id'))
+
+    def test_to_dict(self):
+        entity_dict = self.entity.to_dict()
+
+        self.assertDictEqual(entity_dict, {
+            'id': '08976216-4179-40bd-ba77-d357c95b9bba',
+            'name': 'name',
+            'created_at': self.created_at,
+            'tags': ['a', 'b'],
+            'extra': {'value': 'value', 'created_at': self.created_at}
+        })
+        self.assertEqual(list(entity_dict)[-1], 'id')
+        self.assertIsNot(entity_dict['tags'], self.entity.tags)
+
+    def test_to_json_ready_dict(self):
+        self.assertDictEqual(self.entity.to_dict(json_ready=True), {
+            'id': '08976216-4179-40bd-ba77-d357c95b9bba',
+            'name': 'name',
+            'created_at': '2022-06-01T12:30:00',
+            'tags': ['a', 'b'],
+            'extra': {'value': 'value', 'created_at': '2022-06-01T12:30:00'}
+        })
+        self.assertIsNone(
+            StubEntity(name='name').to_dict(json_ready=True)['created_at'])
+
+    def test_to_dicts_and_to_columns(self):
+        other = StubEntity(name='other')
+        entities = [self.entity, other]
+
+        self.assertEqual(StubEntity.to_dicts(entities),
+                         [self.entity.to_dict(), other.to_dict()])
+        self.assertEqual(StubEntity.to_dicts(iter(entities), True),
+                         [self.entity.to_dict(True), other.to_dict(True)])
+
+        columns = StubEntity.to_columns(iter(entities), json_ready=True)
+        self.assertEqual(list(columns),
+                         ['name', 'created_at', 'tags', 'extra', 'id'])
+        self.assertEqual(columns['name'], ['name', 'other'])
+        self.assertEqual(columns['created_at'],
+                         ['2022-06-01T12:30:00', None])
+        self.assertEqual(columns['id'], [self.entity.id, other.id])
+
+
+class TestToBuiltinUnit(unittest.TestCase):
+
+    def test_convert_nested_values(self):
+        value = uuid.uuid4()
+        created_at = datetime(2022, 6, 1)
+
+        self.assertEqual(
+            to_builtin({'items': (created_at, value)}),
+            {'items': (created_at, value)})
+        self.assertEqual(
+            to_builtin({'items': (created_at, value)}, json_ready=True),
+            {'items': ['2022-06-01T00:00:00', str(value)]})
@@ -1,8 +1,10 @@
 from dataclasses import fields
+from datetime import datetime, timezone
 from typing import Any
 import unittest
 
-from __seedwork.domain.validators import ValidatorFieldsInterface, ValidatorRules
+from __seedwork.domain.validators import FieldRules, ValidationSchema, \
+    ValidatorFieldsInterface, ValidatorRules
 from __seedwork.domain.exceptions import ValidationException
 
 
@@ -140,6 +142,123 @@ class TestValidatorRules(unittest.TestCase):
                 ValidatorRules
             )
 
+    def test_naive_datetime_rule(self):
+        for value in [datetime.now(timezone.utc), '2022-06-01', 5]:
+            with self.assertRaises(ValidationException, msg=value) \
+                    as assert_error:
+                ValidatorRules.values(value, 'attribute').naive_datetime()
+            self.assertEqual(
+                assert_error.exception.args[0],
+                'The "attribute" must be a datetime without a time zone.')
+
+        for value in [None, datetime(2022, 6, 1)]:
+            self.assertIsInstance(
+                ValidatorRules.values(value, 'attribute').naive_datetime(),
+                ValidatorRules)
+
+    def test_collect_errors_instead_of_raising(self):
+        errors = {}
+
+        ValidatorRules.values(None, 'name', errors) \
+            .required().string().max_length(4)
+        ValidatorRules.values(5, 'description', errors) \
+            .required().string().max_length(4)
+        ValidatorRules.values('t'*5, 'title', errors) \
+            .required().string().max_length(4)
+        ValidatorRules.values('t', 'valid', errors) \
+            .required().string().max_length(4)
+        ValidatorRules.values(5, 'is_active', errors).boolean()
+
+        self.assertDictEqual(errors, {
+            'name': ['The "name" is required.'],
+            'description': ['The "description" must be a string.'],
+            'title': ['The "title" must be less than 4 characters.'],
+            'is_active': ['The "is_active" must be a boolean.']
+        })
+
+
+class TestValidationSchema(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = ValidationSchema(
+            FieldRules('name').required().string().max_length(4),
+            FieldRules('description').string(),
+            FieldRules('is_active').boolean()
+        )
+        self.values = [None, '', 't', 't'*4, 't'*5, 0, 5, True, False, {}]
+
+    def chained_rules(self, name, description, is_active, errors=None):
+        ValidatorRules.values(name, 'name', errors) \
+            .required().string().max_length(4)
+        ValidatorRules.values(description, 'description', errors).string()
+        ValidatorRules.values(is_active, 'is_active', errors).boolean()
+
+    def test_field_rules_are_immutable_declarations(self):
+        rules = FieldRules('name')
+        required = rules.required()
+
+        self.assertEqual(rules.rules, ())
+        self.assertEqual(required.max_length(4).rules, (
+            ('required', {}), ('max_length', {'max_length': 4})
+        ))
+        self.assertEqual(self.schema.attributes,
+                         ('name', 'description', 'is_active'))
+
+    def test_validate_raises_the_same_errors_as_validator_rules(self):
+        for name in self.values:
+            for value in self.values:
+                message = f"name: {name}, value: {value}"
+                try:
+                    self.chained_rules(name, value, value)
+                    expected = None
+                except ValidationException as exception:
+                    expected = exception.args[0]
+
+                try:
+                    self.schema.validate(name, value, value)
+                    compiled = None
+                except ValidationException as exception:
+                    compiled = exception.args[0]
+
+                self.assertEqual(compiled, expected, msg=message)
+
+    def test_collect_fills_the_same_errors_as_validator_rules(self):
+        for name in self.values:
+            for value in self.values:
+                expected, compiled = {}, {}
+                self.chained_rules(name, value, value, expected)
+                self.schema.collect(name, value, value, compiled)
+
+                self.assertDictEqual(
+                    compiled, expected, msg=f"name: {name}, value: {value}")
+
+    def test_naive_datetime_schema(self):
+        schema = ValidationSchema(
+            FieldRules('created_at').naive_datetime())
+        for value in [None, datetime(2022, 6, 1), datetime.now(timezone.utc),
+                      '2022-06-01', 5]:
+            expected, compiled = {}, {}
+            ValidatorRules.values(value, 'created_at', expected) \
+                .naive_datetime()
+            schema.collect(value, compiled)
+            self.assertDictEqual(compiled, expected, msg=value)
+            if expected:
+                with self.assertRaises(ValidationException):
+                    schema.validate(value)
+            else:
+                schema.validate(value)
+
+    def test_subset(self):
+        subset = self.schema.subset('is_active', 'name')
+        self.assertEqual(subset.attributes, ('is_active', 'name'))
+        subset.validate(True, 'name')
+        with self.assertRaises(ValidationException) as assert_error:
+            subset.validate(True, 'names')
+        self.assertEqual(assert_error.exception.args[0],
+                         'The "name" must be less than 4 characters.')
+        with self.assertRaises(KeyError):
+            self.schema.subset('title')
+
 
 class TestValidatorFieldsInterface(unittest.TestCase):
 
@@ -1,11 +1,16 @@
 from abc import ABC
-from dataclasses import FrozenInstanceError, dataclass, is_dataclass
+import copy
+from dataclasses import FrozenInstanceError, dataclass, fields, \
+    is_dataclass
+import pickle
+import time
 import unittest
 from unittest.mock import patch
 import uuid
 
 from __seedwork.domain.exceptions import InvalidUuidException
-from __seedwork.domain.value_objects import UniqueEntityId, ValueObject
+from __seedwork.domain.value_objects import RandomIdGenerator, \
+    TimeOrderedIdGenerator, UniqueEntityId, UniqueEntityIdPool, ValueObject
 
 
 @dataclass(frozen=True)
@@ -46,6 +51,77 @@ class TestValueObjectUnit(unittest.TestCase):
             '{"attribute_1": "value1", "attribute_2": "value2"}', str(value_object_2))
 
 
+    def test_equality_and_hashing(self):
+        value_object = StubTwoAttributes(
+            attribute_1="value1", attribute_2="value2")
+        same = StubTwoAttributes(attribute_1="value1", attribute_2="value2")
+        other = StubTwoAttributes(attribute_1="value1", attribute_2="other")
+
+        self.assertEqual(value_object, same)
+        self.assertNotEqual(value_object, other)
+        self.assertNotEqual(value_object, ("value1", "value2"))
+        self.assertEqual(hash(value_object), hash(same))
+        self.assertEqual({value_object: 1}[same], 1)
+        self.assertEqual(
+            StubOneAttribute("value1"), StubOneAttribute("value1"))
+        self.assertNotEqual(
+            StubOneAttribute("value1"), StubOneAttribute("value2"))
+        self.assertEqual(hash(StubOneAttribute("value1")), hash("value1"))
+
+    def test_methods_are_specialized_on_first_call(self):
+        @dataclass(frozen=True, slots=True)
+        class StubSlots(ValueObject):
+            attribute_1: int
+            attribute_2: int
+
+        stub_eq = StubSlots.__eq__
+        value_object = StubSlots(1, 2)
+        self.assertEqual(value_object, StubSlots(1, 2))
+        self.assertIsNot(StubSlots.__eq__, stub_eq)
+        self.assertEqual(
+            str(value_object), '{"attribute_1": 1, "attribute_2": 2}')
+        self.assertIs(str(value_object), str(value_object))
+        self.assertEqual(hash(value_object), hash((1, 2)))
+
+    def test_keep_methods_defined_by_the_class(self):
+        @dataclass(frozen=True)
+        class StubCaseInsensitive(ValueObject):
+            attribute_1: str
+
+            def __eq__(self, other):
+                return self.attribute_1.lower() == other.attribute_1.lower()
+
+            def __hash__(self):
+                return hash(self.attribute_1.lower())
+
+        self.assertEqual(
+            StubCaseInsensitive('Value'), StubCaseInsensitive('VALUE'))
+        self.assertEqual(hash(StubCaseInsensitive('Value')),
+                         hash(StubCaseInsensitive('VALUE')))
+        self.assertEqual(str(StubCaseInsensitive('Value')), 'Value')
+
+    def test_memoized_str_is_not_a_field(self):
+        value_object = StubTwoAttributes(
+            attribute_1="value1", attribute_2="value2")
+        str(value_object)
+        self.assertEqual(
+            [field.name for field in fields(value_object)],
+            ['attribute_1', 'attribute_2'])
+        self.assertEqual(
+            value_object,
+            StubTwoAttributes(attribute_1="value1", attribute_2="value2"))
+
+    def test_copy_and_pickle_after_str(self):
+        value_object = StubTwoAttributes(
+            attribute_1="value1", attribute_2="value2")
+        expected = str(value_object)
+        for clone in [copy.copy(value_object), copy.deepcopy(value_object),
+                      pickle.loads(pickle.dumps(value_object))]:
+            self.assertEqual(clone, value_object)
+            self.assertEqual(hash(clone), hash(value_object))
+            self.assertEqual(str(clone), expected)
+
+
 class TestUniqueEntityIdUnit(unittest.TestCase):
 
     def test_if_is_a_dataclass(self):
@@ -108,3 +184,150 @@ class TestUniqueEntityIdUnit(unittest.TestCase):
     def test_convert_to_str(self):
         value_object = UniqueEntityId()
         self.assertEqual(value_object.id, str(value_object))
+        self.assertIs(str(value_object), str(value_object))
+
+    def test_pickle_without_the_formatted_id(self):
+        value_object = UniqueEntityId()
+        restored = pickle.loads(pickle.dumps(value_object))
+        self.assertEqual(restored, value_object)
+        self.assertEqual(restored.id, value_object.id)
+        self.assertEqual(
+            [field.name for field in fields(UniqueEntityId)], ['raw'])
+
+    def test_store_the_id_as_raw_bytes(self):
+        uuid_value = uuid.uuid4()
+        value_object = UniqueEntityId(str(uuid_value))
+
+        self.assertEqual(value_object.raw, uuid_value.bytes)
+        self.assertEqual(value_object.to_uuid(), uuid_value)
+        self.assertEqual(UniqueEntityId(uuid_value.bytes).id, str(uuid_value))
+        self.assertEqual(uuid.UUID(UniqueEntityId().id).version, 4)
+
+    def test_normalize_non_canonical_representations(self):
+        canonical = '08976216-4179-40bd-ba77-d357c95b9bba'
+        for value in [canonical.upper(), canonical.replace('-', ''),
+                      f'{{{canonical}}}']:
+            value_object = UniqueEntityId(value)
+            self.assertEqual(value_object.id, canonical)
+            self.assertEqual(value_object, UniqueEntityId(canonical))
+            self.assertEqual(hash(value_object),
+                             hash(UniqueEntityId(canonical)))
+
+    def test_throw_exception_when_value_is_not_a_string(self):
+        for value in [5, b'short', object()]:
+            with self.assertRaises(InvalidUuidException):
+                UniqueEntityId(value)
+
+    def test_trusted_constructor_skips_validation(self):
+        uuid_value = uuid.uuid4()
+        with patch.object(
+            UniqueEntityId,
+            '_UniqueEntityId__validate',
+            autospec=True
+        ) as mock_validate:
+            from_str = UniqueEntityId.trusted(str(uuid_value))
+            from_bytes = UniqueEntityId.trusted(uuid_value.bytes)
+            from_uuid = UniqueEntityId.trusted(uuid_value)
+            mock_validate.assert_not_called()
+
+        self.assertEqual(from_str, from_bytes)
+        self.assertEqual(from_bytes, from_uuid)
+        self.assertEqual(str(from_bytes), str(uuid_value))
+
+    def test_repr(self):
+        value_object = UniqueEntityId('08976216-4179-40bd-ba77-d357c95b9bba')
+        self.assertEqual(
+            repr(value_object),
+            "UniqueEntityId(id='08976216-4179-40bd-ba77-d357c95b9bba')")
+
+    def test_use_the_configured_generator(self):
+        generator = TimeOrderedIdGenerator()
+        with patch.object(UniqueEntityId, 'generator', generator):
+            value_object = UniqueEntityId()
+
+        self.assertEqual(uuid.UUID(value_object.id).version, 7)
+        self.assertIsInstance(UniqueEntityId.generator, RandomIdGenerator)
+
+
+class TestIdGeneratorsUnit(unittest.TestCase):
+
+    def test_random_generator_builds_uuid4(self):
+        value = uuid.UUID(bytes=RandomIdGenerator()())
+        self.assertEqual(value.version, 4)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_time_ordered_generator_builds_uuid7(self):
+        generator = TimeOrderedIdGenerator()
+        before_ms = time.time_ns() // 1_000_000
+        raw = generator()
+        after_ms = time.time_ns() // 1_000_000
+
+        value = uuid.UUID(bytes=raw)
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(
+            before_ms <= TimeOrderedIdGenerator.timestamp_ms(raw) <= after_ms)
+        UniqueEntityId(str(value))
+
+    def test_time_ordered_ids_are_strictly_increasing(self):
+        generator = TimeOrderedIdGenerator()
+        ids = [generator() for _ in range(10_000)]
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(
+            [str(uuid.UUID(bytes=raw)) for raw in ids],
+            sorted(str(uuid.UUID(bytes=raw)) for raw in ids))
+
+    def test_time_ordered_ids_increase_when_the_clock_goes_back(self):
+        generator = TimeOrderedIdGenerator()
+        with patch('time.time_ns', return_value=2_000_000_000):
+            first = generator()
+        with patch('time.time_ns', return_value=1_000_000_000):
+            second = generator()
+
+        self.assertLess(first, second)
+        self.assertEqual(TimeOrderedIdGenerator.timestamp_ms(second), 2_000)
+
+    def test_time_ordered_counter_overflow_moves_to_next_millisecond(self):
+        generator = TimeOrderedIdGenerator()
+        with patch('time.time_ns', return_value=1_000_000_000):
+            first = generator()
+            generator._counter = (1 << TimeOrderedIdGenerator.COUNTER_BITS) - 1
+            second = generator()
+
+        self.assertLess(first, second)
+        self.assertEqual(TimeOrderedIdGenerator.timestamp_ms(second), 1_001)
+
+
+class TestUniqueEntityIdPoolUnit(unittest.TestCase):
+
+    def test_share_one_object_per_id(self):
+        pool = UniqueEntityIdPool()
+        uuid_value = uuid.uuid4()
+
+        value_object = pool.intern(str(uuid_value))
+        self.assertIs(pool.intern(str(uuid_value)), value_object)
+        self.assertIs(pool.intern(uuid_value), value_object)
+        self.assertIs(pool.intern(UniqueEntityId(uuid_value)), value_object)
+        self.assertEqual(len(pool), 1)
+
+        pool.clear()
+        self.assertIsNot(pool.intern(str(uuid_value)), value_object)
+
+    def test_validate_unless_trusted(self):
+        with self.assertRaises(InvalidUuidException):
+            UniqueEntityIdPool().intern('Fake ID')
+
+        pool = UniqueEntityIdPool(trusted=True)
+        uuid_value = uuid.uuid4()
+        self.assertEqual(pool.intern(uuid_value.bytes).id, str(uuid_value))
+
+    def test_stop_interning_when_full(self):
+        pool = UniqueEntityIdPool(max_size=1)
+        first = pool.intern(uuid.uuid4())
+        second_value = uuid.uuid4()
+
+        self.assertIs(pool.intern(first), first)
+        self.assertIsNot(pool.intern(second_value), pool.intern(second_value))
+        self.assertEqual(len(pool), 1)
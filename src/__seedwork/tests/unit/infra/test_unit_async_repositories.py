@@ -0,0 +1,58 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from __seedwork.domain.repositories import SearchParams
+from __seedwork.infra.async_repositories import AsyncRepositoryAdapter
+
+
+class TestAsyncRepositoryAdapterUnit(unittest.IsolatedAsyncioTestCase):
+
+    async def test_delegates_every_method(self):
+        repository = MagicMock()
+        adapter = AsyncRepositoryAdapter(repository)
+        entity, params = object(), SearchParams()
+
+        await adapter.insert(entity)
+        repository.insert.assert_called_once_with(entity)
+        await adapter.update(entity)
+        repository.update.assert_called_once_with(entity)
+        await adapter.delete('id')
+        repository.delete.assert_called_once_with('id')
+        self.assertIs(await adapter.find_by_id('id'),
+                      repository.find_by_id.return_value)
+        self.assertIs(await adapter.find_all(),
+                      repository.find_all.return_value)
+        self.assertIs(await adapter.search(params),
+                      repository.search.return_value)
+        self.assertEqual(await adapter.insert_many([entity, entity]), 2)
+        self.assertEqual(repository.insert.call_count, 3)
+
+    async def test_blocking_calls_run_on_the_executor(self):
+        threads = []
+        repository = MagicMock()
+        repository.find_by_id.side_effect = \
+            lambda _: threads.append(threading.get_ident())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await AsyncRepositoryAdapter(repository, executor) \
+                .find_by_id('id')
+        await AsyncRepositoryAdapter(repository, blocking=False) \
+            .find_by_id('id')
+
+        self.assertNotEqual(threads[0], threading.get_ident())
+        self.assertEqual(threads[1], threading.get_ident())
+
+    async def test_concurrent_blocking_reads_overlap(self):
+        barrier = threading.Barrier(4, timeout=5)
+        repository = MagicMock()
+        repository.find_by_id.side_effect = lambda _: barrier.wait()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            adapter = AsyncRepositoryAdapter(repository, executor)
+            await asyncio.gather(
+                *(adapter.find_by_id(str(i)) for i in range(4)))
+
+        self.assertEqual(repository.find_by_id.call_count, 4)
@@ -0,0 +1,85 @@
+import unittest
+
+from __seedwork.infra.caches import CacheStats, LRUCache
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCacheUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_read_and_counters(self):
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertIn('a', cache)
+        self.assertEqual(cache.stats(), CacheStats(
+            hits=1, misses=1, evictions=0, expirations=0, invalidations=0,
+            entries=1, size=0))
+        self.assertEqual(cache.stats().hit_ratio, 0.5)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_ttl(self):
+        cache = LRUCache(ttl=10, clock=self.clock)
+        cache.put('a', 1)
+        cache.put('b', 2, ttl=30)
+
+        self.clock.now = 10
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.clock.now = 30
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.stats().expirations, 1)
+
+    def test_size_limit(self):
+        cache = LRUCache(max_size=10, sizeof=len)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxx')
+        cache.put('c', 'xxxx')
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats().size, 8)
+        self.assertNotIn('a', cache)
+
+        cache.put('d', 'x' * 11)
+        self.assertNotIn('d', cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.put('b', 'x')
+        self.assertEqual(cache.stats().size, 5)
+
+    def test_invalidate_and_clear(self):
+        cache = LRUCache()
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        self.assertTrue(cache.invalidate('a'))
+        self.assertFalse(cache.invalidate('a'))
+        self.assertEqual(cache.stats().invalidations, 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_max_entries(self):
+        with self.assertRaises(ValueError):
+            LRUCache(max_entries=0)
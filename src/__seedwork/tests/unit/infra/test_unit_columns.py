@@ -0,0 +1,86 @@
+import unittest
+
+from __seedwork.infra.columns import BitColumn, FixedBytesColumn, \
+    Int64Column, StringColumn, mask_from_flags, mask_positions
+
+
+class TestMasksUnit(unittest.TestCase):
+
+    def test_mask_from_flags(self):
+        self.assertEqual(mask_from_flags([]), 0)
+        self.assertEqual(mask_from_flags([True, False, True]), 0b101)
+        self.assertEqual(list(mask_positions(0b101001)), [0, 3, 5])
+
+
+class TestBitColumnUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.values = [True, False, None, True, False, True, None, True, False]
+        self.column = BitColumn(self.values)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.column), 9)
+        self.assertEqual([self.column[i] for i in range(9)], self.values)
+
+    def test_mask(self):
+        for value in (True, False, None):
+            self.assertEqual(
+                list(mask_positions(self.column.mask(value))),
+                [i for i, item in enumerate(self.values) if item is value])
+
+    def test_slice_and_take(self):
+        column = self.column.slice(2, 8)
+        self.assertEqual([column[i] for i in range(len(column))],
+                         self.values[2:8])
+
+        column = self.column.take([8, 2, 0])
+        self.assertEqual([column[i] for i in range(3)], [False, None, True])
+
+
+class TestInt64ColumnUnit(unittest.TestCase):
+
+    def test_values_nulls_and_mask(self):
+        column = Int64Column([5, None, -3, 10])
+        self.assertEqual([column[i] for i in range(4)], [5, None, -3, 10])
+        self.assertEqual(column.mask(lambda value: value <= 5), 0b0101)
+
+        self.assertEqual([column.slice(1, 3)[i] for i in range(2)],
+                         [None, -3])
+        self.assertEqual([column.take([3, 1])[i] for i in range(2)],
+                         [10, None])
+
+
+class TestFixedBytesColumnUnit(unittest.TestCase):
+
+    def test_values(self):
+        column = FixedBytesColumn(2, [b'ab', b'cd', b'ef'])
+        self.assertEqual(len(column), 3)
+        self.assertEqual(column[1], b'cd')
+        self.assertEqual(column.slice(1, 3)[1], b'ef')
+        self.assertEqual(column.take([2, 0])[1], b'ab')
+        with self.assertRaises(ValueError):
+            column.append(b'abc')
+
+
+class TestStringColumnUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.values = ['Movie', None, '', 'Música', 'Musical']
+        self.column = StringColumn(self.values)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.column), 5)
+        self.assertEqual([self.column[i] for i in range(5)], self.values)
+
+    def test_mask_prefix(self):
+        self.assertEqual(self.column.mask_prefix('Mu'), 0b10000)
+        self.assertEqual(self.column.mask_prefix('Mú'), 0b01000)
+        self.assertEqual(self.column.mask_prefix(''), 0b11101)
+
+    def test_slice_and_take(self):
+        column = self.column.slice(1, 4)
+        self.assertEqual([column[i] for i in range(3)], self.values[1:4])
+
+        column = self.column.take([4, 1, 3])
+        self.assertEqual([column[i] for i in range(3)],
+                         ['Musical', None, 'Música'])
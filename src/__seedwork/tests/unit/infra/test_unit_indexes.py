@@ -0,0 +1,119 @@
+import random
+import unittest
+
+from __seedwork.infra.indexes import HIGHEST, Bitmap, BitmapIndex, \
+    SortedIndex, prefix_bounds
+
+
+class TestSortedIndexUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.values = list(range(1000))
+        random.Random(7).shuffle(self.values)
+        self.index = SortedIndex(load=8)
+        for value in self.values:
+            self.index.add(value)
+
+    def test_keeps_keys_sorted_across_buckets(self):
+        self.assertEqual(len(self.index), 1000)
+        self.assertEqual(list(self.index), sorted(self.values))
+        self.assertEqual(list(reversed(self.index)),
+                         sorted(self.values, reverse=True))
+
+    def test_bulk_update(self):
+        index = SortedIndex([5, 3, 1], load=2)
+        index.update([4, 2])
+        self.assertEqual(list(index), [1, 2, 3, 4, 5])
+        self.assertEqual(len(index), 5)
+
+    def test_remove(self):
+        for value in range(0, 1000, 2):
+            self.index.remove(value)
+
+        self.assertEqual(list(self.index), list(range(1, 1000, 2)))
+        self.assertNotIn(2, self.index)
+        self.assertIn(3, self.index)
+        with self.assertRaises(KeyError):
+            self.index.remove(2)
+        with self.assertRaises(KeyError):
+            self.index.remove(5000)
+
+    def test_irange_and_count(self):
+        self.assertEqual(list(self.index.irange(10, 15)),
+                         [10, 11, 12, 13, 14, 15])
+        self.assertEqual(list(self.index.irange(10, 15, reverse=True)),
+                         [15, 14, 13, 12, 11, 10])
+        self.assertEqual(list(self.index.irange(995)),
+                         [995, 996, 997, 998, 999])
+        self.assertEqual(list(self.index.irange(maximum=2)), [0, 1, 2])
+        self.assertEqual(self.index.count(10, 15), 6)
+        self.assertEqual(self.index.count(), 1000)
+        self.assertEqual(self.index.count(2000, 3000), 0)
+
+    def test_irange_with_offset(self):
+        self.assertEqual(list(self.index.irange(10, 20, offset=8)),
+                         [18, 19, 20])
+        self.assertEqual(
+            list(self.index.irange(10, 20, reverse=True, offset=8)),
+            [12, 11, 10])
+        self.assertEqual(list(self.index.irange(offset=2000)), [])
+
+    def test_tuple_keys_with_bounds(self):
+        index = SortedIndex([('b', 2), ('a', 1), ('b', 1), ('ba', 3)])
+        self.assertEqual(list(index.irange(('b',), ('b', HIGHEST))),
+                         [('b', 1), ('b', 2)])
+        self.assertEqual(list(index.irange(*prefix_bounds('b'))),
+                         [('b', 1), ('b', 2), ('ba', 3)])
+
+
+class TestPrefixBoundsUnit(unittest.TestCase):
+
+    def test_bounds(self):
+        self.assertEqual(prefix_bounds('ab'), (('ab',), ('ac',)))
+        self.assertEqual(prefix_bounds('a\U0010ffff'),
+                         (('a\U0010ffff',), ('b',)))
+        self.assertEqual(prefix_bounds('\U0010ffff'), (('\U0010ffff',), None))
+
+
+class TestBitmapUnit(unittest.TestCase):
+
+    def test_add_discard_and_contains(self):
+        bitmap = Bitmap([1, 9, 100])
+        bitmap.add(9)
+
+        self.assertEqual(len(bitmap), 3)
+        self.assertIn(100, bitmap)
+        self.assertNotIn(2, bitmap)
+        self.assertNotIn(10_000, bitmap)
+
+        bitmap.discard(9)
+        bitmap.discard(9)
+        bitmap.discard(10_000)
+        self.assertEqual(len(bitmap), 2)
+        self.assertEqual(list(bitmap), [1, 100])
+
+    def test_set_operations(self):
+        first = Bitmap([1, 2, 3, 64])
+        second = Bitmap([2, 3, 4])
+
+        self.assertEqual(list(first & second), [2, 3])
+        self.assertEqual(list(first | second), [1, 2, 3, 4, 64])
+        self.assertEqual(list(first - second), [1, 64])
+        self.assertEqual(len(first - second), 2)
+
+
+class TestBitmapIndexUnit(unittest.TestCase):
+
+    def test_positions_by_value(self):
+        index = BitmapIndex()
+        index.add(0, True)
+        index.add(1, False)
+        index.add(2, True)
+
+        self.assertEqual(list(index.get(True)), [0, 2])
+        self.assertEqual(index.count(False), 1)
+        self.assertEqual(index.count(None), 0)
+        self.assertEqual(len(index.get(None)), 0)
+
+        index.discard(1, False)
+        self.assertEqual(index.values(), [True])
@@ -0,0 +1,135 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+from __seedwork.infra.outbox import InMemorySink, JsonlFileSink, Outbox
+
+
+def events(count: int):
+    return [DomainEvent(aggregate_id=str(index)) for index in range(count)]
+
+
+class TestOutboxUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.sink = InMemorySink()
+
+    def test_flush_in_batches(self):
+        outbox = Outbox(self.sink, max_batch_size=2)
+        for event in events(5):
+            outbox.append(event)
+
+        self.assertEqual(len(outbox), 5)
+        self.assertEqual(self.sink.batches, [])
+        self.assertEqual(outbox.flush(), 5)
+        self.assertEqual([len(batch) for batch in self.sink.batches],
+                         [2, 2, 1])
+        self.assertEqual([event.aggregate_id for event in self.sink.events],
+                         ['0', '1', '2', '3', '4'])
+        self.assertEqual((outbox.dispatched, outbox.batches), (5, 3))
+
+    def test_keep_events_the_sink_failed_to_write(self):
+        sink = MagicMock()
+        sink.write.side_effect = [OSError(), None]
+        outbox = Outbox(sink)
+        for event in events(3):
+            outbox.append(event)
+
+        self.assertEqual(outbox.flush(), 0)
+        self.assertEqual((len(outbox), outbox.failures), (3, 1))
+        self.assertEqual(outbox.flush(), 3)
+        self.assertEqual(len(outbox), 0)
+
+    def test_dispatch_when_the_batch_is_full(self):
+        written = threading.Event()
+        sink = MagicMock()
+        sink.write.side_effect = lambda batch: written.set()
+        outbox = Outbox(sink, max_batch_size=3, max_delay=60).start()
+        self.addCleanup(outbox.stop)
+
+        for event in events(3):
+            outbox.append(event)
+
+        self.assertTrue(written.wait(5))
+        self.assertEqual(len(sink.write.call_args.args[0]), 3)
+
+    def test_dispatch_after_max_delay(self):
+        written = threading.Event()
+        sink = MagicMock()
+        sink.write.side_effect = lambda batch: written.set()
+        outbox = Outbox(sink, max_batch_size=100, max_delay=0.01).start()
+        self.addCleanup(outbox.stop)
+
+        outbox.append(DomainEvent(aggregate_id='1'))
+        self.assertTrue(written.wait(5))
+
+    def test_back_off_while_the_sink_fails(self):
+        recovered = threading.Event()
+        sink = MagicMock()
+
+        def write(batch):
+            if not recovered.is_set():
+                raise OSError()
+
+        sink.write.side_effect = write
+        outbox = Outbox(sink, max_batch_size=2, max_delay=0.01,
+                        max_retry_delay=0.04).start()
+        self.addCleanup(outbox.stop)
+        for event in events(5):
+            outbox.append(event)
+
+        # waits of 0.01, 0.02, then 0.04 seconds: about ten attempts
+        time.sleep(0.3)
+        self.assertGreaterEqual(outbox.failures, 2)
+        self.assertLess(outbox.failures, 20)
+        self.assertEqual(len(outbox), 5)
+
+        recovered.set()
+        deadline = time.monotonic() + 5
+        while len(outbox) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual((len(outbox), outbox.dispatched), (0, 5))
+
+    def test_stop_flushes_pending_events(self):
+        outbox = Outbox(self.sink, max_delay=60).start()
+        for event in events(3):
+            outbox.append(event)
+        outbox.stop()
+
+        self.assertEqual(len(self.sink.events), 3)
+
+    def test_context_manager_subscribes_to_domain_events(self):
+        with Outbox(self.sink, max_delay=60):
+            DomainEvents.publish(DomainEvent(aggregate_id='1'))
+        DomainEvents.publish(DomainEvent(aggregate_id='2'))
+
+        self.assertEqual([event.aggregate_id for event in self.sink.events],
+                         ['1'])
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            Outbox(self.sink, max_batch_size=0)
+
+
+class TestJsonlFileSinkUnit(unittest.TestCase):
+
+    def test_append_json_lines(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'events.jsonl')
+
+        sink = JsonlFileSink(path)
+        sink.write(events(2))
+        sink.write(events(1))
+        sink.close()
+
+        with open(path, encoding='utf-8') as file:
+            lines = [json.loads(line) for line in file]
+        self.assertEqual([line['aggregate_id'] for line in lines],
+                         ['0', '1', '0'])
+        self.assertEqual(lines[0]['event_name'], 'DomainEvent')
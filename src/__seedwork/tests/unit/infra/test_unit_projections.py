@@ -0,0 +1,60 @@
+import unittest
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+from __seedwork.infra.projections import BucketCounts, Projection
+
+
+class TestBucketCountsUnit(unittest.TestCase):
+
+    def test_add_and_query_ranges(self):
+        counts = BucketCounts()
+        for bucket in [5, 7, 7, 3, 10, 7]:
+            counts.add(bucket)
+
+        self.assertEqual(len(counts), 4)
+        self.assertEqual(counts[7], 3)
+        self.assertEqual(counts[4], 0)
+        self.assertEqual(counts.total(), 6)
+        self.assertEqual(counts.total(4, 7), 4)
+        self.assertEqual(counts.total(last=5), 2)
+        self.assertEqual(counts.total(8), 1)
+        self.assertEqual(counts.items(), [(3, 1), (5, 1), (7, 3), (10, 1)])
+        self.assertEqual(counts.items(6, 9), [(7, 3)])
+
+    def test_drop_empty_buckets(self):
+        counts = BucketCounts()
+        counts.add(1, 2)
+        counts.add(2)
+        counts.add(1, -2)
+        counts.add(3, 0)
+
+        self.assertEqual(counts.items(), [(2, 1)])
+        counts.clear()
+        self.assertEqual(counts.total(), 0)
+
+
+class StubEvent(DomainEvent):
+    pass
+
+
+class StubProjection(Projection):
+    event_classes = (StubEvent,)
+
+    def reset(self):
+        self.events = []
+
+    def apply(self, event):
+        self.events.append(event)
+
+
+class TestProjectionUnit(unittest.TestCase):
+
+    def test_apply_subscribed_events(self):
+        projection = StubProjection()
+        event = StubEvent(aggregate_id='1')
+        with projection:
+            DomainEvents.publish(event)
+            DomainEvents.publish(DomainEvent(aggregate_id='2'))
+        DomainEvents.publish(event)
+
+        self.assertEqual(projection.events, [event])
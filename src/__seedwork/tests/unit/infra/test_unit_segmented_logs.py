@@ -0,0 +1,207 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from __seedwork.infra.segmented_logs import COMPACTION_MARKER, \
+    COMPACTING_SUFFIX, RECORD, SegmentedLog
+
+
+class TestSegmentedLog(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def open(self, segment_bytes=64 << 20):
+        log = SegmentedLog(self.directory.name, segment_bytes)
+        self.addCleanup(log.close)
+        return log
+
+    def segments(self):
+        return sorted(
+            name for name in os.listdir(self.directory.name)
+            if name.endswith('.log'))
+
+    def test_append_and_read(self):
+        log = self.open()
+        self.assertEqual(log.next_offset, 0)
+        self.assertEqual([log.append(b'a'), log.append(b''),
+                          log.append(b'ccc')], [0, 1, 2])
+        self.assertEqual(list(log.read()), [(0, b'a'), (1, b''), (2, b'ccc')])
+        self.assertEqual(list(log.read(2)), [(2, b'ccc')])
+        self.assertEqual(list(log.read(3)), [])
+
+    def test_reopen_keeps_offsets(self):
+        log = self.open()
+        log.append(b'a')
+        log.append(b'b')
+        log.close()
+
+        log = self.open()
+        self.assertEqual(log.next_offset, 2)
+        self.assertEqual(log.durable_offset, 2)
+        self.assertEqual(log.append(b'c'), 2)
+        self.assertEqual([offset for offset, _ in log.read()], [0, 1, 2])
+
+    def test_roll_into_segments(self):
+        log = self.open(segment_bytes=2 * (RECORD.size + 4))
+        for index in range(5):
+            log.append(b'%04d' % index)
+        self.assertEqual(self.segments(), [
+            '00000000000000000000.log', '00000000000000000002.log',
+            '00000000000000000004.log'])
+        log.roll()
+        log.roll()
+        self.assertEqual(len(self.segments()), 4)
+        self.assertEqual(list(log.read(3)), [(3, b'0003'), (4, b'0004')])
+
+    def test_recover_a_torn_tail(self):
+        log = self.open()
+        log.append(b'first')
+        log.append(b'second')
+        log.close()
+        path = os.path.join(self.directory.name, self.segments()[-1])
+        size = os.path.getsize(path)
+        with open(path, 'r+b') as stream:
+            stream.truncate(size - 3)
+
+        log = self.open()
+        self.assertEqual(list(log.read()), [(0, b'first')])
+        self.assertEqual(log.append(b'again'), 1)
+        self.assertEqual(list(log.read()), [(0, b'first'), (1, b'again')])
+
+    def test_corrupt_sealed_segment(self):
+        log = self.open()
+        log.append(b'first')
+        log.roll()
+        log.append(b'second')
+        path = os.path.join(self.directory.name, self.segments()[0])
+        with open(path, 'r+b') as stream:
+            stream.seek(RECORD.size)
+            stream.write(b'F')
+
+        with self.assertRaises(ValueError) as assert_error:
+            list(log.read())
+        self.assertIn('Corrupt record at byte 0', str(assert_error.exception))
+        self.assertEqual(list(log.read(1)), [(1, b'second')])
+
+    def test_commit(self):
+        log = self.open()
+        self.assertEqual(log.commit(), 0)
+        log.append(b'a')
+        log.append(b'b')
+        self.assertEqual(log.durable_offset, 0)
+        self.assertEqual(log.commit(), 2)
+        self.assertEqual(log.durable_offset, 2)
+
+    def test_commit_from_many_threads(self):
+        log = self.open(segment_bytes=256)
+
+        def write():
+            for _ in range(100):
+                log.append(b'payload')
+                log.commit()
+
+        threads = [threading.Thread(target=write) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(log.durable_offset, 400)
+        self.assertEqual(
+            [offset for offset, _ in log.read()], list(range(400)))
+
+    def test_compact_keeps_offsets(self):
+        log = self.open()
+        for payload in [b'a1', b'b1', b'a2']:
+            log.append(payload)
+        log.roll()
+        log.append(b'b2')
+        log.append(b'c1')
+
+        def last_per_key(records):
+            return {payload[:1]: (offset, payload)
+                    for offset, payload in records}.values()
+
+        # the segment being written to is rolled and compacted too
+        self.assertEqual(log.compact(last_per_key), 3)
+        self.assertEqual(list(log.read()), [
+            (2, b'a2'), (3, b'b2'), (4, b'c1')])
+        log.append(b'a3')
+        self.assertEqual(log.compact(last_per_key), 3)
+        self.assertEqual(list(log.read()), [
+            (3, b'b2'), (4, b'c1'), (5, b'a3')])
+        self.assertEqual(len(self.segments()), 2)
+        self.assertEqual(list(log.read(4)), [(4, b'c1'), (5, b'a3')])
+        self.assertEqual(log.append(b'd1'), 6)
+
+        log.close()
+        log = self.open()
+        self.assertEqual(log.next_offset, 7)
+        self.assertEqual([offset for offset, _ in log.read()], [3, 4, 5, 6])
+
+    def test_read_while_compacting(self):
+        log = self.open(segment_bytes=4 * (RECORD.size + 1))
+        for index in range(20):
+            log.append(bytes([index % 4]))
+        self.assertEqual(len(self.segments()), 6)
+
+        def last_per_key(records):
+            return {payload: (offset, payload)
+                    for offset, payload in records}.values()
+
+        # the reader is inside the oldest segment when it is compacted
+        reader = log.read()
+        first = next(reader)
+        self.assertEqual(log.compact(last_per_key), 4)
+        log.append(b'\x00')
+        self.assertEqual([first[0]] + [offset for offset, _ in reader],
+                         [0, 1, 2, 3, 16, 17, 18, 19, 20])
+        self.assertEqual([offset for offset, _ in log.read()],
+                         [16, 17, 18, 19, 20])
+
+    def test_read_a_missing_segment(self):
+        log = self.open(segment_bytes=RECORD.size + 1)
+        for payload in [b'a', b'b', b'c']:
+            log.append(payload)
+        os.unlink(os.path.join(self.directory.name, self.segments()[1]))
+        with self.assertRaises(ValueError):
+            list(log.read())
+
+    def test_compact_nothing_sealed(self):
+        log = self.open()
+        self.assertEqual(log.compact(list), 0)
+        self.assertEqual(log.compact(list), 0)
+        self.assertEqual(len(self.segments()), 1)
+
+    def test_finish_an_interrupted_compaction(self):
+        log = self.open()
+        for payload in [b'a', b'b', b'c']:
+            log.append(payload)
+            log.roll()
+        log.close()
+        first, second, third, _ = self.segments()
+
+        # crashed while writing the compacted segment
+        compacting = os.path.join(
+            self.directory.name, first + COMPACTING_SUFFIX)
+        with open(compacting, 'wb') as stream:
+            stream.write(b'partial')
+        log = self.open()
+        self.assertEqual([payload for _, payload in log.read()],
+                         [b'a', b'b', b'c'])
+        self.assertFalse(os.path.exists(compacting))
+        log.close()
+
+        # crashed after replacing the oldest segment
+        with open(os.path.join(self.directory.name, COMPACTION_MARKER),
+                  'w', encoding='ascii') as stream:
+            stream.write(f'{second} {third}')
+        log = self.open()
+        self.assertEqual(list(log.read()), [(0, b'a')])
+        self.assertNotIn(COMPACTION_MARKER, os.listdir(self.directory.name))
+
+    def test_invalid_segment_size(self):
+        with self.assertRaises(ValueError):
+            SegmentedLog(self.directory.name, 0)
@@ -0,0 +1,79 @@
+from array import array
+import os
+import tempfile
+import unittest
+
+from __seedwork.infra.snapshots import HEADER, Snapshot, write_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.snapshot')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, *sections, count=3):
+        return write_snapshot(self.path, b'TESTSNAP', 1, count, sections)
+
+    def test_round_trip(self):
+        size = self.write(b'abc', array('q', [1, -2, 3]), b'',
+                          array('I', [7, 8, 9]))
+        self.assertEqual(size, os.path.getsize(self.path))
+        self.assertEqual(os.listdir(self.directory.name), ['test.snapshot'])
+
+        with Snapshot(self.path, b'TESTSNAP', 1) as snapshot:
+            self.assertEqual(snapshot.count, 3)
+            self.assertEqual(len(snapshot), 4)
+            self.assertEqual(bytes(snapshot.section(0)), b'abc')
+            self.assertEqual(list(snapshot.section(1, 'q')), [1, -2, 3])
+            self.assertEqual(len(snapshot.section(2)), 0)
+            self.assertEqual(list(snapshot.section(3, 'I')), [7, 8, 9])
+
+    def test_sections_are_aligned(self):
+        self.write(b'a', array('q', [1]))
+        with Snapshot(self.path, b'TESTSNAP', 1) as snapshot:
+            offsets = [offset for offset, _ in snapshot._sections]
+        self.assertTrue(all(offset % 8 == 0 for offset in offsets))
+
+    def test_close_releases_views(self):
+        self.write(array('q', [1]))
+        snapshot = Snapshot(self.path, b'TESTSNAP', 1)
+        values = snapshot.section(0, 'q')
+        snapshot.close()
+        with self.assertRaises(ValueError):
+            values[0]
+
+    def test_invalid_magic_or_version(self):
+        self.write(b'abc')
+        with self.assertRaisesRegex(ValueError, 'Not a'):
+            Snapshot(self.path, b'OTHERSNP', 1)
+        with self.assertRaisesRegex(ValueError, 'Unsupported'):
+            Snapshot(self.path, b'TESTSNAP', 2)
+        with self.assertRaises(ValueError):
+            write_snapshot(self.path, b'SHORT', 1, 0, [])
+
+    def test_corrupted_file(self):
+        self.write(b'abcdef')
+        with open(self.path, 'r+b') as stream:
+            stream.seek(-1, os.SEEK_END)
+            stream.write(b'x')
+
+        with self.assertRaisesRegex(ValueError, 'checksum'):
+            Snapshot(self.path, b'TESTSNAP', 1)
+        with Snapshot(self.path, b'TESTSNAP', 1, verify=False) as snapshot:
+            self.assertEqual(bytes(snapshot.section(0)), b'abcdex')
+
+    def test_truncated_file(self):
+        self.write(b'abcdef')
+        with open(self.path, 'r+b') as stream:
+            stream.truncate(os.path.getsize(self.path) - 2)
+        with self.assertRaisesRegex(ValueError, 'truncated'):
+            Snapshot(self.path, b'TESTSNAP', 1, verify=False)
+
+        with open(self.path, 'r+b') as stream:
+            stream.truncate(HEADER.size - 1)
+        with self.assertRaisesRegex(ValueError, 'too short'):
+            Snapshot(self.path, b'TESTSNAP', 1)
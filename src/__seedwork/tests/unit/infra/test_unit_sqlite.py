@@ -0,0 +1,82 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from __seedwork.infra.sqlite import ConnectionPool
+
+
+class TestConnectionPoolUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ConnectionPool(':memory:', size=2)
+        self.addCleanup(self.pool.close)
+        with self.pool.connection() as connection:
+            connection.execute('CREATE TABLE items (value INTEGER)')
+
+    def count(self):
+        with self.pool.connection() as connection:
+            return connection.execute(
+                'SELECT COUNT(*) FROM items').fetchone()[0]
+
+    def test_reuses_connections(self):
+        with self.pool.connection() as first:
+            pass
+        with self.pool.connection() as second:
+            self.assertIs(first, second)
+
+    def test_connections_share_the_memory_database(self):
+        with self.pool.connection() as first:
+            with self.pool.connection() as second:
+                self.assertIsNot(first, second)
+                first.execute('INSERT INTO items VALUES (1)')
+                self.assertEqual(
+                    second.execute('SELECT value FROM items').fetchall(),
+                    [(1,)])
+
+        other_pool = ConnectionPool(':memory:')
+        self.addCleanup(other_pool.close)
+        with other_pool.connection() as connection:
+            with self.assertRaises(sqlite3.OperationalError):
+                connection.execute('SELECT * FROM items')
+
+    def test_transaction_commits_or_rolls_back(self):
+        with self.pool.transaction() as connection:
+            connection.executemany(
+                'INSERT INTO items VALUES (?)', [(1,), (2,)])
+        self.assertEqual(self.count(), 2)
+
+        with self.assertRaises(ValueError):
+            with self.pool.transaction() as connection:
+                connection.execute('INSERT INTO items VALUES (3)')
+                raise ValueError()
+        self.assertEqual(self.count(), 2)
+
+    def test_file_database(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        pool = ConnectionPool(os.path.join(directory.name, 'test.db'))
+        with pool.transaction() as connection:
+            connection.execute('CREATE TABLE items (value INTEGER)')
+            connection.execute('INSERT INTO items VALUES (1)')
+        pool.close()
+
+        pool = ConnectionPool(os.path.join(directory.name, 'test.db'))
+        with pool.connection() as connection:
+            self.assertEqual(
+                connection.execute('PRAGMA journal_mode').fetchone(),
+                ('wal',))
+            self.assertEqual(
+                connection.execute('SELECT value FROM items').fetchall(),
+                [(1,)])
+        pool.close()
+
+    def test_closed_pool(self):
+        self.pool.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            with self.pool.connection():
+                pass
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(':memory:', size=0)
@@ -0,0 +1,87 @@
+import io
+import os
+import tempfile
+import unittest
+
+from __seedwork.infra.streams import chunked, read_csv, read_jsonl, \
+    read_lines, split_lines, write_csv, write_jsonl
+
+
+class TestStreamsUnit(unittest.TestCase):
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(list(chunked([], 2)), [])
+        with self.assertRaises(ValueError):
+            next(chunked(range(5), 0))
+
+    def test_chunked_is_lazy(self):
+        consumed = []
+
+        def items():
+            for item in range(100):
+                consumed.append(item)
+                yield item
+
+        chunks = chunked(items(), 10)
+        self.assertEqual(next(chunks), list(range(10)))
+        self.assertEqual(len(consumed), 10)
+
+    def test_jsonl_round_trip(self):
+        stream = io.StringIO()
+        records = [{'name': 'Movie'}, {'name': 'Música', 'is_active': None}]
+
+        self.assertEqual(write_jsonl(stream, iter(records), chunk_size=1), 2)
+        self.assertEqual(
+            stream.getvalue(),
+            '{"name": "Movie"}\n{"name": "Música", "is_active": null}\n')
+        stream.seek(0)
+        self.assertEqual(list(read_jsonl(stream)), records)
+
+    def test_read_jsonl_skips_blank_lines_and_reports_bad_lines(self):
+        self.assertEqual(list(read_jsonl(['{"a": 1}\n', '\n'])), [{'a': 1}])
+
+        with self.assertRaises(ValueError) as assert_error:
+            list(read_jsonl(['{"a": 1}\n', '{"a":\n']))
+        self.assertEqual(str(assert_error.exception),
+                         'Invalid JSON on line 2')
+
+        with self.assertRaises(ValueError) as assert_error:
+            list(read_jsonl(['[1, 2]\n']))
+        self.assertEqual(str(assert_error.exception),
+                         'Expected an object on line 1')
+
+    def test_csv_round_trip(self):
+        stream = io.StringIO(newline='')
+        records = [{'a': '1', 'b': 'x'}, {'a': '2', 'b': ''}]
+
+        self.assertEqual(write_csv(stream, records, ['a', 'b']), 2)
+        stream.seek(0)
+        self.assertEqual(list(read_csv(stream)), records)
+
+    def test_split_lines(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'records.jsonl')
+        lines = [f'{{"name": "Category {index}\u2028"}}'
+                 for index in range(20)]
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.write('\n'.join(lines) + '\n')
+
+        for shard_bytes in (1, 30, 100, 10 ** 6):
+            with self.subTest(shard_bytes=shard_bytes):
+                shards = split_lines(path, shard_bytes)
+                self.assertEqual(shards[0][0], 0)
+                self.assertEqual(shards[-1][1], os.path.getsize(path))
+                read = []
+                for begin, end in shards:
+                    self.assertGreater(end, begin)
+                    read.extend(filter(None, read_lines(path, (begin, end))))
+                self.assertEqual(read, lines)
+        self.assertEqual(len(split_lines(path, 1)), 20)
+
+        with self.assertRaises(ValueError):
+            split_lines(path, 0)
+        empty = os.path.join(directory.name, 'empty.jsonl')
+        open(empty, 'w').close()
+        self.assertEqual(split_lines(empty, 10), [])
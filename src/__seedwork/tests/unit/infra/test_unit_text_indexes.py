@@ -0,0 +1,72 @@
+import unittest
+
+from __seedwork.infra.text_indexes import InvertedIndex, normalize, tokenize
+
+
+class TestTokenizeUnit(unittest.TestCase):
+
+    def test_normalize(self):
+        self.assertEqual(normalize('Ação e Ficção'), 'acao e ficcao')
+        self.assertEqual(normalize('STRASSE'), 'strasse')
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize('Sci-Fi, Ação!'), ['sci', 'fi', 'acao'])
+        self.assertEqual(tokenize(None), [])
+        self.assertEqual(tokenize(''), [])
+
+
+class TestInvertedIndexUnit(unittest.TestCase):
+
+    def setUp(self):
+        self.index = InvertedIndex({'name': 3.0, 'description': 1.0})
+        self.index.add(1, {'name': 'Action movies', 'description': None})
+        self.index.add(2, {'name': 'Animation',
+                           'description': 'Movies for kids'})
+        self.index.add(3, {'name': 'Documentary',
+                           'description': 'Real action'})
+
+    def keys(self, query, **kwargs):
+        return [key for key, _ in self.index.search(query, **kwargs)[1]]
+
+    def test_rank_by_field_weight(self):
+        self.assertEqual(self.keys('action'), [1, 3])
+        self.assertEqual(self.keys('movies'), [1, 2])
+
+    def test_prefix_and_accents(self):
+        self.assertEqual(self.keys('AÇ'), [1, 3])
+        self.assertEqual(self.keys('doc'), [3])
+        self.assertEqual(self.keys('zzz'), [])
+        self.assertEqual(self.keys(''), [])
+
+    def test_exact_terms_rank_above_prefixes(self):
+        self.index.add(4, {'name': 'Act', 'description': None})
+        self.assertEqual(self.keys('act')[0], 4)
+
+    def test_every_token_must_match(self):
+        self.assertEqual(self.keys('movies kid'), [2])
+        self.assertEqual(self.keys('movies documentary'), [])
+
+    def test_pagination(self):
+        total, hits = self.index.search('a', limit=2, offset=1)
+        self.assertEqual(total, 3)
+        self.assertEqual(len(hits), 2)
+        self.assertEqual(self.keys('a', limit=2) + [hits[1][0]],
+                         self.keys('a'))
+
+    def test_update_and_remove(self):
+        self.index.add(1, {'name': 'Comedy', 'description': None})
+        self.assertEqual(self.keys('action'), [3])
+        self.assertEqual(self.keys('comedy'), [1])
+
+        self.index.remove(3)
+        self.index.remove(3)
+        self.assertEqual(self.keys('action'), [])
+        self.assertEqual(list(self.index.expand('act')), [])
+        self.assertNotIn(3, self.index)
+        self.assertEqual(len(self.index), 2)
+
+    def test_max_expansions(self):
+        index = InvertedIndex({}, max_expansions=2)
+        for key, name in enumerate(['aa', 'ab', 'ac']):
+            index.add(key, {'name': name})
+        self.assertEqual(list(index.expand('a')), ['aa', 'ab'])
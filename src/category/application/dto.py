@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Type, TypeVar
+
+from category.domain.entities import Category
+
+
+@dataclass(slots=True, frozen=True)
+class CategoryOutput:
+    id: str
+    name: str
+    description: Optional[str]
+    is_active: Optional[bool]
+    created_at: Optional[datetime]
+
+
+Output = TypeVar('Output', bound=CategoryOutput)
+
+
+class CategoryOutputMapper:
+
+    @staticmethod
+    def to_output(
+        category: Category,
+        output_class: Type[Output] = CategoryOutput
+    ) -> Output:
+        return output_class(
+            id=category.id,
+            name=category.name,
+            description=category.description,
+            is_active=category.is_active,
+            created_at=category.created_at
+        )
+
+    @classmethod
+    def to_outputs(
+        cls,
+        categories: List[Category],
+        output_class: Type[Output] = CategoryOutput
+    ) -> List[Output]:
+        return [cls.to_output(category, output_class)
+                for category in categories]
@@ -0,0 +1,177 @@
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, List, Optional
+
+from __seedwork.application.dto import PaginationOutput, SearchInput
+from __seedwork.application.use_cases import UseCase, run_in_executor
+from __seedwork.domain.validators import ErrorFields
+from category.application.dto import CategoryOutput, CategoryOutputMapper
+from category.domain.entities import Category
+from category.domain.repositories import CategoryAsyncRepository, \
+    CategoryFilter
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        category = Category.create(
+            name=input_param.name,
+            description=input_param.description,
+            is_active=input_param.is_active
+        )
+        await self.category_repo.insert(category)
+        return CategoryOutputMapper.to_output(category, self.Output)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        name: str
+        description: Optional[str] = None
+        is_active: Optional[bool] = True
+
+    @dataclass(slots=True, frozen=True)
+    class Output(CategoryOutput):
+        pass
+
+
+@dataclass(slots=True, frozen=True)
+class CreateCategoriesUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    executor: Optional[Executor] = None
+
+    # below this many rows building the entities in place is cheaper than
+    # the hop to the executor
+    offload_threshold: ClassVar[int] = 1000
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        if len(input_param.rows) < self.offload_threshold:
+            categories, rejected = Category.create_many(input_param.rows)
+            items = CategoryOutputMapper.to_outputs(categories)
+        else:
+            categories, rejected, items = await run_in_executor(
+                self._create_many, input_param.rows, executor=self.executor)
+        await self.category_repo.insert_many(categories)
+        return self.Output(items=items, rejected=rejected)
+
+    @staticmethod
+    def _create_many(rows: List[dict]):
+        categories, rejected = Category.create_many(rows)
+        items = CategoryOutputMapper.to_outputs(categories)
+        return categories, rejected, items
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        rows: List[dict]
+
+    @dataclass(slots=True, frozen=True)
+    class Output:
+        items: List[CategoryOutput]
+        rejected: Dict[int, ErrorFields] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class GetCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        category = await self.category_repo.find_by_id(input_param.id)
+        return CategoryOutputMapper.to_output(category, self.Output)
+
+    async def execute_many(self, ids: List[str]) -> List['Output']:
+        return list(await asyncio.gather(
+            *(self.execute(self.Input(id=entity_id)) for entity_id in ids)))
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+
+    @dataclass(slots=True, frozen=True)
+    class Output(CategoryOutput):
+        pass
+
+
+@dataclass(slots=True, frozen=True)
+class ListCategoriesUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+    executor: Optional[Executor] = None
+
+    offload_threshold: ClassVar[int] = 1000
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        search_params = self.category_repo.SearchParams(
+            page=input_param.page,
+            per_page=input_param.per_page,
+            sort=input_param.sort,
+            sort_dir=input_param.sort_dir,
+            filter=input_param.filter
+        )
+        result = await self.category_repo.search(search_params)
+        if len(result.items) < self.offload_threshold:
+            items = CategoryOutputMapper.to_outputs(result.items)
+        else:
+            items = await run_in_executor(
+                CategoryOutputMapper.to_outputs, result.items,
+                executor=self.executor)
+        return self.Output(
+            items=items,
+            total=result.total,
+            current_page=result.current_page,
+            last_page=result.last_page,
+            per_page=result.per_page
+        )
+
+    @dataclass(slots=True, frozen=True)
+    class Input(SearchInput[CategoryFilter]):
+        pass
+
+    @dataclass(slots=True, frozen=True)
+    class Output(PaginationOutput[CategoryOutput]):
+        pass
+
+
+@dataclass(slots=True, frozen=True)
+class UpdateCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: 'Input') -> 'Output':
+        category = await self.category_repo.find_by_id(input_param.id)
+        category.update(input_param.name, input_param.description)
+        if input_param.is_active is True:
+            category.activate()
+        elif input_param.is_active is False:
+            category.deactivate()
+        await self.category_repo.update(category)
+        return CategoryOutputMapper.to_output(category, self.Output)
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
+        name: str
+        description: Optional[str] = None
+        is_active: Optional[bool] = None
+
+    @dataclass(slots=True, frozen=True)
+    class Output(CategoryOutput):
+        pass
+
+
+@dataclass(slots=True, frozen=True)
+class DeleteCategoryUseCase(UseCase):
+
+    category_repo: CategoryAsyncRepository
+
+    async def execute(self, input_param: 'Input') -> None:
+        category = await self.category_repo.find_by_id(input_param.id)
+        await self.category_repo.delete(category.unique_entity_id)
+        category.delete()
+
+    @dataclass(slots=True, frozen=True)
+    class Input:
+        id: str
@@ -1,9 +1,13 @@
 from datetime import datetime
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple
 
 from __seedwork.domain.entities import Entity
-from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.events import DomainEvents
+from __seedwork.domain.validators import ErrorFields, FieldRules, \
+    ValidationSchema
+from category.domain.events import CategoryActivated, CategoryCreated, \
+    CategoryDeactivated, CategoryDeleted, CategoryUpdated
 
 
 @dataclass(kw_only=True, frozen=True, slots=True)
@@ -16,27 +20,118 @@ class Category(Entity):
         default_factory=lambda: datetime.now()
     )
 
+    validation_schema: ClassVar[ValidationSchema] = ValidationSchema(
+        FieldRules('name').required().string().max_length(255),
+        FieldRules('description').string(),
+        FieldRules('is_active').boolean(),
+        # stores keep created_at as naive epoch microseconds
+        FieldRules('created_at').naive_datetime()
+    )
+    # what changing the description alone of stored categories must satisfy
+    description_schema: ClassVar[ValidationSchema] = \
+        validation_schema.subset('description')
+
     def __new__(cls, **kwargs):
         cls.validate(
             name=kwargs.get('name'),
             description=kwargs.get('description'),
-            is_active=kwargs.get('is_active')
+            is_active=kwargs.get('is_active'),
+            created_at=kwargs.get('created_at')
         )
         return super(Category, cls).__new__(cls)
 
+    @classmethod
+    def create(cls, **kwargs) -> 'Category':
+        category = cls(**kwargs)
+        category._raise_created()
+        return category
+
     def update(self, name: str, description: str):
         self.validate(name, description)
+        if name == self.name and description == self.description:
+            return
         self._set('name', name)
         self._set('description', description)
+        DomainEvents.publish(CategoryUpdated(
+            aggregate_id=self.id, name=name, description=description))
 
     def activate(self):
-        self._set('is_active', True)
+        if self.is_active is not True:
+            self._set('is_active', True)
+            DomainEvents.publish(CategoryActivated(aggregate_id=self.id))
 
     def deactivate(self):
-        self._set('is_active', False)
+        if self.is_active is not False:
+            self._set('is_active', False)
+            DomainEvents.publish(CategoryDeactivated(aggregate_id=self.id))
+
+    def delete(self):
+        DomainEvents.publish(CategoryDeleted(
+            aggregate_id=self.id,
+            name=self.name,
+            is_active=self.is_active,
+            created_at=self.created_at
+        ))
+
+    def _raise_created(self):
+        DomainEvents.publish(CategoryCreated(
+            aggregate_id=self.id,
+            name=self.name,
+            description=self.description,
+            is_active=self.is_active,
+            created_at=self.created_at
+        ))
+
+    @classmethod
+    def validate(
+        cls,
+        name: str,
+        description: str,
+        is_active: bool = None,
+        created_at: datetime = None,
+        errors: ErrorFields = None
+    ):
+        if errors is None:
+            cls.validation_schema.validate(
+                name, description, is_active, created_at)
+        else:
+            cls.validation_schema.collect(
+                name, description, is_active, created_at, errors)
 
     @classmethod
-    def validate(cls, name: str, description: str, is_active: bool = None):
-        ValidatorRules.values(name, 'name').required().string().max_length(255)
-        ValidatorRules.values(description, 'description').string()
-        ValidatorRules.values(is_active, 'is_active').boolean()
+    def create_many(
+        cls,
+        rows: Iterable[dict],
+        validate: bool = True
+    ) -> Tuple[List['Category'], Dict[int, ErrorFields]]:
+        # `validate=False` is for rows that were already validated
+        # elsewhere, such as by the workers of a sharded import
+        # a row with a key __init__ does not take would raise TypeError and
+        # abort the whole batch, so it is rejected like an invalid row
+        known = frozenset(item.name for item in fields(cls) if item.init)
+        categories = []
+        rejected = {}
+        for index, row in enumerate(rows):
+            errors = {}
+            if not known.issuperset(row):
+                for key in row:
+                    if key not in known:
+                        errors[key] = [f'The "{key}" is not a known field.']
+            if validate:
+                cls.validate(
+                    name=row.get('name'),
+                    description=row.get('description'),
+                    is_active=row.get('is_active'),
+                    created_at=row.get('created_at'),
+                    errors=errors
+                )
+            if errors:
+                rejected[index] = errors
+                continue
+
+            # the row is already validated, so skip the validating __new__
+            category = super(Category, cls).__new__(cls)
+            category.__init__(**row)
+            category._raise_created()
+            categories.append(category)
+        return categories, rejected
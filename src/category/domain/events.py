@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from __seedwork.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryCreated(DomainEvent):
+    name: str
+    description: Optional[str]
+    is_active: Optional[bool]
+    created_at: Optional[datetime]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryUpdated(DomainEvent):
+    name: str
+    description: Optional[str]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryActivated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryDeactivated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryDeleted(DomainEvent):
+    name: str
+    is_active: Optional[bool]
+    created_at: Optional[datetime]
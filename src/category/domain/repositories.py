@@ -0,0 +1,123 @@
+import abc
+from abc import ABC
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from __seedwork.domain.exceptions import InvalidCursorException, \
+    InvalidUuidException
+from __seedwork.domain.repositories import \
+    AsyncSearchableRepositoryInterface, Cursor, \
+    SearchableRepositoryInterface, \
+    CursorPage as DefaultCursorPage, \
+    CursorParams as DefaultCursorParams, \
+    SearchParams as DefaultSearchParams, \
+    SearchResult as DefaultSearchResult
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CategoryFilter:
+    name_prefix: Optional[str] = None
+    is_active: Optional[bool] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+class _SearchParams(DefaultSearchParams[CategoryFilter]):
+    pass
+
+
+class _SearchResult(DefaultSearchResult[Category, CategoryFilter]):
+    pass
+
+
+class _CursorParams(DefaultCursorParams[CategoryFilter]):
+    pass
+
+
+class _CursorPage(DefaultCursorPage[Category, CategoryFilter]):
+    pass
+
+
+# categories are paged by cursor in (created_at, id) order
+def cursor_key(category: Category) -> Tuple[Optional[datetime], str]:
+    return category.created_at, category.id
+
+
+def cursor_position(
+    cursor: Cursor
+) -> Tuple[Optional[datetime], UniqueEntityId]:
+    match cursor.key:
+        case (datetime() | None as created_at, str(entity_id)):
+            try:
+                return created_at, UniqueEntityId(entity_id)
+            except InvalidUuidException as ex:
+                raise InvalidCursorException() from ex
+    raise InvalidCursorException()
+
+
+class CategoryRepository(
+    SearchableRepositoryInterface[Category, CategoryFilter],
+    ABC
+):
+    sortable_fields = ['name', 'created_at']
+
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+    CursorParams = _CursorParams
+    CursorPage = _CursorPage
+
+    # set-based changes of every category matching `category_filter`, with
+    # the same outcome and events as changing each one through its entity
+    # method and saving it; they return the ids of the categories changed
+    @abc.abstractmethod
+    def activate_where(self, category_filter: CategoryFilter) -> List[str]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def deactivate_where(self, category_filter: CategoryFilter) -> List[str]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def update_description_where(
+        self,
+        category_filter: CategoryFilter,
+        description: Optional[str]
+    ) -> List[str]:
+        raise NotImplementedError()
+
+
+class CategoryAsyncRepository(
+    AsyncSearchableRepositoryInterface[Category, CategoryFilter],
+    ABC
+):
+    sortable_fields = ['name', 'created_at']
+
+    SearchParams = _SearchParams
+    SearchResult = _SearchResult
+    CursorParams = _CursorParams
+    CursorPage = _CursorPage
+
+    @abc.abstractmethod
+    async def activate_where(
+        self,
+        category_filter: CategoryFilter
+    ) -> List[str]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def deactivate_where(
+        self,
+        category_filter: CategoryFilter
+    ) -> List[str]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def update_description_where(
+        self,
+        category_filter: CategoryFilter,
+        description: Optional[str]
+    ) -> List[str]:
+        raise NotImplementedError()
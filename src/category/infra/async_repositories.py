@@ -0,0 +1,35 @@
+from typing import List, Optional
+
+from __seedwork.infra.async_repositories import AsyncRepositoryAdapter
+from category.domain.entities import Category
+from category.domain.repositories import CategoryAsyncRepository, \
+    CategoryFilter
+
+
+class CategoryAsyncRepositoryAdapter(
+    AsyncRepositoryAdapter[Category, CategoryFilter],
+    CategoryAsyncRepository
+):
+
+    async def activate_where(
+        self,
+        category_filter: CategoryFilter
+    ) -> List[str]:
+        return await self._call(
+            self.repository.activate_where, category_filter)
+
+    async def deactivate_where(
+        self,
+        category_filter: CategoryFilter
+    ) -> List[str]:
+        return await self._call(
+            self.repository.deactivate_where, category_filter)
+
+    async def update_description_where(
+        self,
+        category_filter: CategoryFilter,
+        description: Optional[str]
+    ) -> List[str]:
+        return await self._call(
+            self.repository.update_description_where, category_filter,
+            description)
@@ -0,0 +1,120 @@
+from typing import Iterable, Iterator, List, Optional
+
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.columns import BitColumn, FixedBytesColumn, \
+    Int64Column, StringColumn, all_rows, from_epoch_micros, mask_positions, \
+    to_epoch_micros
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+
+
+class CategoryBatch:
+    # struct-of-arrays storage for categories: a row costs its 16 id bytes,
+    # two bits, an int64 and the utf-8 text plus two int64 offsets, instead
+    # of a Category, a UniqueEntityId, a datetime and their strings
+
+    def __init__(self) -> None:
+        self.ids = FixedBytesColumn(16)
+        self.names = StringColumn()
+        self.descriptions = StringColumn()
+        self.is_active = BitColumn()
+        self.created_at = Int64Column()
+
+    @classmethod
+    def from_categories(cls, categories: Iterable[Category]) -> 'CategoryBatch':
+        batch = cls()
+        for category in categories:
+            batch.append(category)
+        return batch
+
+    def append(self, category: Category) -> None:
+        created_at = to_epoch_micros(category.created_at)
+        self.ids.append(category.unique_entity_id.raw)
+        self.names.append(category.name)
+        self.descriptions.append(category.description)
+        self.is_active.append(category.is_active)
+        self.created_at.append(created_at)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> Category:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('batch index out of range')
+
+        # rows come from categories that were valid when appended
+        return Category.from_persistence(
+            unique_entity_id=UniqueEntityId.trusted(self.ids[index]),
+            name=self.names[index],
+            description=self.descriptions[index],
+            is_active=self.is_active[index],
+            created_at=from_epoch_micros(self.created_at[index])
+        )
+
+    def __iter__(self) -> Iterator[Category]:
+        return map(self.__getitem__, range(len(self)))
+
+    def to_categories(self) -> List[Category]:
+        trusted = UniqueEntityId.trusted
+        ids, names, descriptions, is_active, created_at = \
+            self.ids, self.names, self.descriptions, self.is_active, \
+            self.created_at
+        return Category.rehydrate_many(
+            (trusted(ids[index]), names[index], descriptions[index],
+             is_active[index], from_epoch_micros(created_at[index]))
+            for index in range(len(self))
+        )
+
+    def mask(self, category_filter: Optional[CategoryFilter] = None) -> int:
+        mask = all_rows(len(self))
+        if category_filter is None:
+            return mask
+
+        if category_filter.is_active is not None:
+            mask &= self.is_active.mask(category_filter.is_active)
+        if mask and (category_filter.created_from is not None
+                     or category_filter.created_to is not None):
+            mask &= self.created_at.mask(self.__created_between(
+                to_epoch_micros(category_filter.created_from),
+                to_epoch_micros(category_filter.created_to)))
+        if mask and category_filter.name_prefix is not None:
+            mask &= self.names.mask_prefix(category_filter.name_prefix)
+        return mask
+
+    def count(self, category_filter: Optional[CategoryFilter] = None) -> int:
+        return self.mask(category_filter).bit_count()
+
+    def filter(self, category_filter: CategoryFilter) -> 'CategoryBatch':
+        return self.take(self.mask(category_filter))
+
+    def take(self, mask: int) -> 'CategoryBatch':
+        positions = list(mask_positions(mask & all_rows(len(self))))
+        return self.__derive(lambda column: column.take(positions))
+
+    def slice(self, start: int, stop: Optional[int] = None) -> 'CategoryBatch':
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        return self.__derive(lambda column: column.slice(start, stop))
+
+    def nbytes(self) -> int:
+        return sum(column.nbytes() for column in self.__columns())
+
+    def __columns(self):
+        return (self.ids, self.names, self.descriptions, self.is_active,
+                self.created_at)
+
+    def __derive(self, transform) -> 'CategoryBatch':
+        batch = CategoryBatch()
+        batch.ids, batch.names, batch.descriptions, batch.is_active, \
+            batch.created_at = map(transform, self.__columns())
+        return batch
+
+    @staticmethod
+    def __created_between(minimum: Optional[int], maximum: Optional[int]):
+        if minimum is None:
+            return lambda value: value <= maximum
+        if maximum is None:
+            return lambda value: value >= minimum
+        return lambda value: minimum <= value <= maximum
@@ -0,0 +1,42 @@
+from typing import List, Optional
+
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.cached_repositories import CachedRepository
+from __seedwork.infra.caches import LRUCache
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+
+
+class CategoryCachedRepository(
+    CachedRepository[Category, CategoryFilter],
+    CategoryRepository
+):
+
+    def __init__(
+        self,
+        repository: CategoryRepository,
+        cache: Optional[LRUCache] = None
+    ) -> None:
+        super().__init__(repository, Category, cache)
+
+    def activate_where(self, category_filter: CategoryFilter) -> List[str]:
+        return self._invalidate_ids(
+            self.repository.activate_where(category_filter))
+
+    def deactivate_where(self, category_filter: CategoryFilter) -> List[str]:
+        return self._invalidate_ids(
+            self.repository.deactivate_where(category_filter))
+
+    def update_description_where(
+        self,
+        category_filter: CategoryFilter,
+        description: Optional[str]
+    ) -> List[str]:
+        return self._invalidate_ids(self.repository.update_description_where(
+            category_filter, description))
+
+    # the rows changed in the store never went through `Entity._set`
+    def _invalidate_ids(self, ids: List[str]) -> List[str]:
+        for entity_id in ids:
+            self._invalidate(UniqueEntityId(entity_id).raw)
+        return ids
@@ -0,0 +1,290 @@
+import struct
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.repositories import RepositoryInterface
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.columns import from_epoch_micros, to_epoch_micros
+from __seedwork.infra.segmented_logs import Record, SegmentedLog
+from category.domain.entities import Category
+from category.domain.events import CategoryActivated, CategoryCreated, \
+    CategoryDeactivated, CategoryDeleted, CategoryUpdated
+from category.infra.snapshots import CREATED_AT_NULL, DESCRIPTION_NULL, \
+    IS_ACTIVE, IS_ACTIVE_NULL
+
+
+# a payload is an operation and a raw id, then what the operation needs:
+# STATE is a whole category (flags, created_at, name and description
+# lengths, then both in utf-8) and UPDATE a new name and description
+HEADER = struct.Struct('<B16s')
+STATE = struct.Struct('<BqII')
+UPDATE = struct.Struct('<BII')
+CREATED, UPDATED, ACTIVATED, DEACTIVATED, DELETED = range(1, 6)
+
+# name, description, is_active, created_at
+State = Tuple[str, Optional[str], Optional[bool], Optional[datetime]]
+
+
+def _texts(
+    name: str,
+    description: Optional[str]
+) -> Tuple[int, bytes, bytes]:
+    encoded = b'' if description is None else description.encode('utf-8')
+    return (DESCRIPTION_NULL if description is None else 0,
+            name.encode('utf-8'), encoded)
+
+
+def encode_state(raw_id: bytes, state: State) -> bytes:
+    name, description, is_active, created_at = state
+    flags, name, description = _texts(name, description)
+    if is_active is None:
+        flags |= IS_ACTIVE_NULL
+    elif is_active:
+        flags |= IS_ACTIVE
+    if created_at is None:
+        flags |= CREATED_AT_NULL
+    return b''.join((
+        HEADER.pack(CREATED, raw_id),
+        STATE.pack(flags, to_epoch_micros(created_at) or 0,
+                   len(name), len(description)),
+        name, description
+    ))
+
+
+def encode_event(event: DomainEvent) -> bytes:
+    event_class = type(event)
+    raw_id = UniqueEntityId(event.aggregate_id).raw
+    if event_class is CategoryCreated:
+        return encode_state(raw_id, (
+            event.name, event.description, event.is_active,
+            event.created_at))
+    if event_class is CategoryUpdated:
+        flags, name, description = _texts(event.name, event.description)
+        return b''.join((
+            HEADER.pack(UPDATED, raw_id),
+            UPDATE.pack(flags, len(name), len(description)),
+            name, description
+        ))
+    if event_class is CategoryActivated:
+        return HEADER.pack(ACTIVATED, raw_id)
+    if event_class is CategoryDeactivated:
+        return HEADER.pack(DEACTIVATED, raw_id)
+    if event_class is CategoryDeleted:
+        return HEADER.pack(DELETED, raw_id)
+    raise ValueError(f'Unsupported event {event_class.__name__}')
+
+
+def _decode_texts(
+    payload: bytes,
+    position: int,
+    flags: int,
+    name_length: int,
+    description_length: int
+) -> Tuple[str, Optional[str]]:
+    end = position + name_length
+    return (
+        str(payload[position:end], 'utf-8'),
+        None if flags & DESCRIPTION_NULL
+        else str(payload[end:end + description_length], 'utf-8')
+    )
+
+
+def decode_state(payload: bytes) -> State:
+    flags, created_at, name_length, description_length = \
+        STATE.unpack_from(payload, HEADER.size)
+    name, description = _decode_texts(
+        payload, HEADER.size + STATE.size, flags, name_length,
+        description_length)
+    return (
+        name, description,
+        None if flags & IS_ACTIVE_NULL else bool(flags & IS_ACTIVE),
+        None if flags & CREATED_AT_NULL else from_epoch_micros(created_at)
+    )
+
+
+# applies a record that changes only part of a category
+def _change(state: State, operation: int, payload: bytes) -> State:
+    if operation == ACTIVATED:
+        return state[:2] + (True, state[3])
+    if operation == DEACTIVATED:
+        return state[:2] + (False, state[3])
+    flags, name_length, description_length = \
+        UPDATE.unpack_from(payload, HEADER.size)
+    return _decode_texts(
+        payload, HEADER.size + UPDATE.size, flags, name_length,
+        description_length) + state[2:]
+
+
+class _Folded:
+    # what a run of records leaves of one category: its whole state, a
+    # deletion, or, when the run does not start with the category being
+    # created, the partial changes to apply to a state read elsewhere
+
+    __slots__ = ('offset', 'state', 'deleted', 'changes')
+
+    def __init__(self) -> None:
+        self.offset = -1
+        self.state: Optional[State] = None
+        self.deleted = False
+        self.changes: List[Record] = []
+
+
+def _fold(records: Iterable[Record]) -> Dict[bytes, _Folded]:
+    folded: Dict[bytes, _Folded] = {}
+    for offset, payload in records:
+        operation, raw_id = HEADER.unpack_from(payload)
+        entry = folded.get(raw_id)
+        if entry is None:
+            entry = folded[raw_id] = _Folded()
+        entry.offset = offset
+        if operation == CREATED:
+            entry.state, entry.deleted = decode_state(payload), False
+            entry.changes.clear()
+        elif operation == DELETED:
+            entry.state, entry.deleted = None, True
+            entry.changes.clear()
+        elif entry.state is not None:
+            entry.state = _change(entry.state, operation, payload)
+        elif not entry.deleted:
+            entry.changes.append((offset, payload))
+    return folded
+
+
+class CategoryChangeLog:
+    # an append-only, segmented log of category changes, fed by the
+    # category events as they are published. A background thread commits
+    # what was appended every `commit_interval` seconds, so a burst of
+    # changes costs one fsync. A replica restores its last snapshot, then
+    # replays the log from the offset it was taken at, and from the offset
+    # `replay` returns on its next catch up. Compaction keeps the last state
+    # of each category (and a tombstone for each deleted one) at the offset
+    # of its last change, so replaying from any offset stays correct
+
+    event_classes = (CategoryCreated, CategoryUpdated, CategoryActivated,
+                     CategoryDeactivated, CategoryDeleted)
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 << 20,
+        commit_interval: float = 0.01
+    ) -> None:
+        self.log = SegmentedLog(directory, segment_bytes)
+        self.commit_interval = commit_interval
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def next_offset(self) -> int:
+        return self.log.next_offset
+
+    def append(self, event: DomainEvent) -> int:
+        return self.log.append(encode_event(event))
+
+    def commit(self) -> int:
+        return self.log.commit()
+
+    def records(self, start: int = 0) -> Iterator[Record]:
+        return self.log.read(start)
+
+    # applies every change from offset `start` to `repository`, each
+    # category at most once, and returns the offset to resume from
+    def replay(
+        self,
+        repository: RepositoryInterface[Category],
+        start: int = 0
+    ) -> int:
+        next_offset = start
+
+        def records() -> Iterator[Record]:
+            nonlocal next_offset
+            for record in self.log.read(start):
+                next_offset = record[0] + 1
+                yield record
+
+        rows = []
+        for raw_id, entry in _fold(records()).items():
+            entity_id = UniqueEntityId.trusted(raw_id)
+            if entry.deleted:
+                try:
+                    repository.delete(entity_id)
+                except NotFoundException:
+                    pass
+                continue
+            state = entry.state
+            if state is None:
+                try:
+                    base = repository.find_by_id(entity_id)
+                except NotFoundException:
+                    continue
+                state = (base.name, base.description, base.is_active,
+                         base.created_at)
+                for _, payload in entry.changes:
+                    state = _change(state, payload[0], payload)
+            rows.append((entity_id,) + state)
+
+        # rows come from categories that were valid when logged
+        for category in Category.rehydrate_many(rows):
+            repository.save(category)
+        return next_offset
+
+    def compact(self) -> int:
+        return self.log.compact(self._compacted)
+
+    def subscribe(self) -> None:
+        for event_class in self.event_classes:
+            DomainEvents.subscribe(event_class, self.append)
+
+    def unsubscribe(self) -> None:
+        for event_class in self.event_classes:
+            DomainEvents.unsubscribe(event_class, self.append)
+
+    def start(self) -> 'CategoryChangeLog':
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._commit_periodically, name='change-log-commit',
+                daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+        self.commit()
+
+    def close(self) -> None:
+        self.stop()
+        self.log.close()
+
+    def __enter__(self) -> 'CategoryChangeLog':
+        self.subscribe()
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.unsubscribe()
+        self.close()
+
+    def _commit_periodically(self) -> None:
+        while not self._stopping.wait(self.commit_interval):
+            if self.log.durable_offset < self.log.next_offset:
+                self.log.commit()
+
+    @staticmethod
+    def _compacted(records: Iterator[Record]) -> List[Record]:
+        compacted = []
+        for raw_id, entry in _fold(records).items():
+            if entry.state is not None:
+                compacted.append(
+                    (entry.offset, encode_state(raw_id, entry.state)))
+            elif entry.deleted:
+                compacted.append(
+                    (entry.offset, HEADER.pack(DELETED, raw_id)))
+            else:
+                compacted.extend(entry.changes)
+        return compacted
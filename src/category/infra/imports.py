@@ -0,0 +1,256 @@
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+import os
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, \
+    Optional, Tuple, TypeVar
+
+from __seedwork.domain.validators import ErrorFields
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.streams import Record, Shard, chunked, read_jsonl, \
+    read_lines, split_lines
+from category.domain.entities import Category
+from category.infra.streams import FIELDS, ImportChunk, to_row
+
+
+# a batch travels to the workers as one list per FIELDS name, so keys are
+# not pickled once per record; Ellipsis (which pickles as itself) stands
+# for a missing key
+Columns = Tuple[list, ...]
+_MISSING = ...
+
+T = TypeVar('T')
+# a function for a worker to run, followed by its arguments
+Task = Tuple[Any, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatedBatch:
+    # the position of the batch's first record in the whole input
+    start: int
+    size: int
+    # keyed by the position of the record in the whole input
+    rejected: Dict[int, ErrorFields] = field(default_factory=dict)
+    # 16 raw bytes per record: its parsed id, zeros when it had none or
+    # was rejected
+    ids: bytes = b''
+
+    @property
+    def accepted(self) -> int:
+        return self.size - len(self.rejected)
+
+    def raw_id(self, position: int) -> bytes:
+        return self.ids[position * 16:position * 16 + 16]
+
+
+def validate_columns(start: int, columns: Columns) -> ValidatedBatch:
+    validate = Category.validate
+    rejected = {}
+    ids = bytearray(16 * len(columns[0]))
+    for position, (entity_id, name, description, is_active, created_at) \
+            in enumerate(zip(*columns)):
+        errors = {}
+        row = {}
+        if entity_id is not _MISSING and entity_id is not None \
+                or created_at is not _MISSING and created_at is not None:
+            row = to_row({
+                'id': None if entity_id is _MISSING else entity_id,
+                'created_at': None if created_at is _MISSING else created_at
+            }, errors)
+        validate(
+            None if name is _MISSING else name,
+            None if description is _MISSING else description,
+            None if is_active is _MISSING else is_active,
+            row.get('created_at'),
+            errors
+        )
+        unique_entity_id = row.get('unique_entity_id')
+        if errors:
+            rejected[start + position] = errors
+        elif unique_entity_id is not None:
+            ids[position * 16:position * 16 + 16] = unique_entity_id.raw
+    return ValidatedBatch(start, len(columns[0]), rejected, bytes(ids))
+
+
+def validate_jsonl_shard(path: str, shard: Shard) -> ValidatedBatch:
+    try:
+        records = list(read_jsonl(read_lines(path, shard)))
+    except ValueError as ex:
+        raise ValueError(f'{ex} of the shard at byte {shard[0]}') from ex
+    return validate_columns(0, _to_columns(records))
+
+
+class ShardedCategoryImporter:
+    # validating is single core, cpu bound work, so records are cut into
+    # batches and validated by a pool of `workers` processes; results come
+    # back in input order, holding only the rejected positions and the
+    # parsed ids, and at most `max_pending` batches are in flight so memory
+    # stays bounded on huge inputs. `workers=0` validates in the calling
+    # process.
+    # Records already in memory go out in batches of `batch_size` rows,
+    # and taking their columns apart and pickling them stays in the calling
+    # process, which caps the speedup at well under 2x whatever the number
+    # of workers. A jsonl file is instead cut into shards of about
+    # `shard_bytes` that each worker reads and parses itself, so only a
+    # path and two offsets are sent and the validation scales with the
+    # workers
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        batch_size: int = 10_000,
+        max_pending: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        shard_bytes: int = 4 << 20
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError('Batch size must be at least 1')
+        if shard_bytes < 1:
+            raise ValueError('Shard size must be at least 1')
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size
+        self.shard_bytes = shard_bytes
+        self.max_pending = max_pending or 2 * max(self.workers, 1)
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> 'ShardedCategoryImporter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    def validate(
+        self,
+        records: Iterable[Record]
+    ) -> Iterator[ValidatedBatch]:
+        for _, validated in self.__validate(records):
+            yield validated
+
+    def import_categories(
+        self,
+        records: Iterable[Record]
+    ) -> Iterator[ImportChunk]:
+        for batch, validated in self.__validate(records):
+            yield self.__build(batch, validated)
+
+    def validate_jsonl(self, path: str) -> Iterator[ValidatedBatch]:
+        for _, validated in self.__validate_jsonl(path):
+            yield validated
+
+    # the calling process parses each shard again to build its categories,
+    # which json does in C; only the validation is spread over the workers
+    def import_jsonl(self, path: str) -> Iterator[ImportChunk]:
+        for shard, validated in self.__validate_jsonl(path):
+            yield self.__build(
+                list(read_jsonl(read_lines(path, shard))), validated)
+
+    def __validate(
+        self,
+        records: Iterable[Record]
+    ) -> Iterator[Tuple[List[Record], ValidatedBatch]]:
+        return self.__run(
+            chunked(records, self.batch_size),
+            lambda batch: (validate_columns, 0, _to_columns(batch)))
+
+    def __validate_jsonl(
+        self,
+        path: str
+    ) -> Iterator[Tuple[Shard, ValidatedBatch]]:
+        return self.__run(
+            split_lines(path, self.shard_bytes),
+            lambda shard: (validate_jsonl_shard, path, shard))
+
+    # runs the task of every item and yields the items with their batches
+    # in input order, each numbered after the records of those before it
+    def __run(
+        self,
+        items: Iterable[T],
+        task: Callable[[T], Task]
+    ) -> Iterator[Tuple[T, ValidatedBatch]]:
+        start = 0
+        for item, validated in self.__results(items, task):
+            yield item, _moved(validated, start)
+            start += validated.size
+
+    def __results(
+        self,
+        items: Iterable[T],
+        task: Callable[[T], Task]
+    ) -> Iterator[Tuple[T, ValidatedBatch]]:
+        if self.workers == 0 and self._executor is None:
+            for item in items:
+                function, *args = task(item)
+                yield item, function(*args)
+            return
+
+        executor = self.__executor()
+        pending: Deque[Tuple[T, Future]] = deque()
+        try:
+            for item in items:
+                pending.append((item, executor.submit(*task(item))))
+                if len(pending) >= self.max_pending:
+                    item, future = pending.popleft()
+                    yield item, future.result()
+            while pending:
+                item, future = pending.popleft()
+                yield item, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    def __executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    @staticmethod
+    def __build(
+        batch: List[Record],
+        validated: ValidatedBatch
+    ) -> ImportChunk:
+        rows = []
+        rejected, start = validated.rejected, validated.start
+        for position, record in enumerate(batch):
+            if start + position in rejected:
+                continue
+            row = {
+                name: record[name]
+                for name in ('name', 'description', 'is_active')
+                if name in record
+            }
+            if record.get('id') is not None:
+                row['unique_entity_id'] = UniqueEntityId.trusted(
+                    validated.raw_id(position))
+            created_at = record.get('created_at')
+            if isinstance(created_at, str):
+                row['created_at'] = datetime.fromisoformat(created_at)
+            elif 'created_at' in record:
+                row['created_at'] = created_at
+            rows.append(row)
+        categories, _ = Category.create_many(rows, validate=False)
+        return ImportChunk(categories, rejected)
+
+
+def _moved(validated: ValidatedBatch, start: int) -> ValidatedBatch:
+    if start == validated.start:
+        return validated
+    offset = start - validated.start
+    return ValidatedBatch(
+        start, validated.size,
+        {position + offset: errors
+         for position, errors in validated.rejected.items()},
+        validated.ids)
+
+
+def _to_columns(records: List[Record]) -> Columns:
+    return tuple(
+        [record.get(name, _MISSING) for record in records]
+        for name in FIELDS
+    )
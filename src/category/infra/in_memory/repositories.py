@@ -0,0 +1,392 @@
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.indexes import HIGHEST, BitmapIndex, SortedIndex, \
+    prefix_bounds
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, \
+    CategoryRepository, cursor_key, cursor_position
+from category.infra.async_repositories import \
+    CategoryAsyncRepositoryAdapter
+
+
+IndexedKeys = Tuple[Tuple[str, str], Tuple[datetime, str], Optional[bool]]
+Range = Tuple[Any, Any]
+
+
+class CategoryInMemoryRepository(CategoryRepository):
+
+    indexed_fields = ('name', 'created_at', 'is_active')
+
+    def __init__(self, categories: Iterable[Category] = ()) -> None:
+        self._items: List[Optional[Category]] = []
+        self._keys: List[Optional[IndexedKeys]] = []
+        self._free_slots: List[int] = []
+        self._slots: Dict[str, int] = {}
+        self._indexes: Dict[str, SortedIndex] = {
+            'name': SortedIndex(),
+            'created_at': SortedIndex()
+        }
+        # the sorted indexes are also partitioned by `is_active`, like a
+        # composite index, so a filtered page can seek straight to offset
+        self._partitions: Dict[str, Dict[Optional[bool], SortedIndex]] = {
+            'name': {},
+            'created_at': {}
+        }
+        self._by_is_active = BitmapIndex()
+
+        self._load(categories)
+        Category.observe(self._on_category_changed)
+
+    def insert(self, entity: Category) -> None:
+        if entity.id in self._slots:
+            self._remove(self._slots[entity.id])
+        self._add(entity)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        return self._items[self._get_slot(entity_id)]
+
+    def find_all(self) -> List[Category]:
+        return [item for item in self._items if item is not None]
+
+    def update(self, entity: Category) -> None:
+        slot = self._get_slot(entity.id)
+        if self._items[slot] is entity:
+            self._reindex(slot)
+        else:
+            self._remove(slot)
+            self._add(entity)
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        self._remove(self._get_slot(entity_id))
+
+    # the stored categories are the entities themselves, so changing them
+    # through their methods publishes the events and reindexes them
+    def activate_where(self, category_filter: CategoryFilter) -> List[str]:
+        categories = self._select(category_filter, skip_is_active=(True,))
+        for category in categories:
+            category.activate()
+        return [category.id for category in categories]
+
+    def deactivate_where(self, category_filter: CategoryFilter) -> List[str]:
+        categories = self._select(category_filter, skip_is_active=(False,))
+        for category in categories:
+            category.deactivate()
+        return [category.id for category in categories]
+
+    def update_description_where(
+        self,
+        category_filter: CategoryFilter,
+        description: Optional[str]
+    ) -> List[str]:
+        Category.description_schema.validate(description)
+        categories = [
+            category for category in self._select(category_filter)
+            if category.description != description
+        ]
+        for category in categories:
+            category.update(category.name, description)
+        return [category.id for category in categories]
+
+    def search(
+        self,
+        input_params: CategoryRepository.SearchParams
+    ) -> CategoryRepository.SearchResult:
+        category_filter = input_params.filter or CategoryFilter()
+        if input_params.sort in self.sortable_fields:
+            sort_field = input_params.sort
+            reverse = input_params.sort_dir == 'desc'
+        else:
+            sort_field, reverse = 'created_at', True
+
+        ranges = self._ranges(category_filter)
+        driving_range = ranges.pop(sort_field, (None, None))
+        offset = (input_params.page - 1) * input_params.per_page
+
+        if ranges:
+            (range_field, other_range), = ranges.items()
+            active = None if category_filter.is_active is None \
+                else self._by_is_active.get(category_filter.is_active)
+            total, slots = self._search_by_other_range(
+                range_field, other_range, sort_field, driving_range,
+                active, reverse, offset, input_params.per_page)
+        else:
+            total, slots = self._search_by_sort_index(
+                sort_field, driving_range, category_filter.is_active,
+                reverse, offset, input_params.per_page)
+
+        return CategoryRepository.SearchResult(
+            items=[self._items[slot] for slot in slots],
+            total=total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def paginate(
+        self,
+        input_params: CategoryRepository.CursorParams
+    ) -> CategoryRepository.CursorPage:
+        category_filter = input_params.filter or CategoryFilter()
+        index = self._indexes['created_at'] \
+            if category_filter.is_active is None \
+            else self._partition('created_at', category_filter.is_active)
+        minimum, maximum = self._ranges(category_filter).get(
+            'created_at', (None, None))
+
+        position = None
+        if input_params.cursor is not None:
+            created_at, unique_entity_id = cursor_position(
+                input_params.cursor)
+            position = (created_at or datetime.min, unique_entity_id.id)
+            if input_params.descending:
+                maximum = position if maximum is None \
+                    else min(maximum, position)
+            else:
+                minimum = position if minimum is None \
+                    else max(minimum, position)
+
+        # the index seeks straight to the cursor; the cursor's own row is
+        # skipped, so the bounds are effectively exclusive
+        prefix = category_filter.name_prefix
+        limit = input_params.per_page + 1
+        window = []
+        for key in index.irange(
+                minimum, maximum, reverse=input_params.descending):
+            if key == position:
+                continue
+            category = self._items[self._slots[key[1]]]
+            if prefix is not None and not category.name.startswith(prefix):
+                continue
+            window.append(category)
+            if len(window) == limit:
+                break
+        return self.CursorPage.from_window(window, input_params, cursor_key)
+
+    def _search_by_sort_index(
+        self,
+        sort_field: str,
+        driving_range: Range,
+        is_active: Optional[bool],
+        reverse: bool,
+        offset: int,
+        per_page: int
+    ) -> Tuple[int, List[int]]:
+        index = self._indexes[sort_field] if is_active is None \
+            else self._partition(sort_field, is_active)
+        keys = index.irange(*driving_range, reverse=reverse, offset=offset)
+        slots = self._slots
+        return index.count(*driving_range), [
+            slots[key[1]] for key in islice(keys, per_page)
+        ]
+
+    def _search_by_other_range(
+        self,
+        range_field: str,
+        other_range: Range,
+        sort_field: str,
+        driving_range: Range,
+        active,
+        reverse: bool,
+        offset: int,
+        per_page: int
+    ) -> Tuple[int, List[int]]:
+        sort_position = self.sortable_fields.index(sort_field)
+        minimum, maximum = driving_range
+        keys = self._keys
+        slots = self._slots
+
+        candidates = []
+        for key in self._indexes[range_field].irange(*other_range):
+            slot = slots[key[1]]
+            if active is not None and slot not in active:
+                continue
+            sort_key = keys[slot][sort_position]
+            if minimum is not None and sort_key < minimum:
+                continue
+            if maximum is not None and sort_key > maximum:
+                continue
+            candidates.append((sort_key, slot))
+
+        candidates.sort(reverse=reverse)
+        return len(candidates), [
+            slot for _, slot in candidates[offset:offset + per_page]
+        ]
+
+    # the categories matching a filter, read from the is_active bitmaps or,
+    # when it has a range, from the index of that range; a second range is
+    # checked against the indexed keys
+    def _select(
+        self,
+        category_filter: CategoryFilter,
+        skip_is_active: Tuple[Optional[bool], ...] = ()
+    ) -> List[Category]:
+        is_active = category_filter.is_active
+        if is_active in skip_is_active:
+            return []
+        ranges = self._ranges(category_filter)
+        keys = self._keys
+        if not ranges:
+            values = self._by_is_active.values() if is_active is None \
+                else [is_active]
+            slots = sorted(
+                slot for value in values if value not in skip_is_active
+                for slot in self._by_is_active.get(value))
+        else:
+            field_name = 'name' if 'name' in ranges else 'created_at'
+            index = self._indexes[field_name] if is_active is None \
+                else self._partition(field_name, is_active)
+            slots = [
+                self._slots[key[1]]
+                for key in index.irange(*ranges.pop(field_name))
+            ]
+            for field_name, (minimum, maximum) in ranges.items():
+                position = self.sortable_fields.index(field_name)
+                slots = [
+                    slot for slot in slots
+                    if (minimum is None or keys[slot][position] >= minimum)
+                    and (maximum is None or keys[slot][position] <= maximum)
+                ]
+            if skip_is_active:
+                slots = [
+                    slot for slot in slots
+                    if keys[slot][2] not in skip_is_active
+                ]
+        return [self._items[slot] for slot in slots]
+
+    def _ranges(self, category_filter: CategoryFilter) -> Dict[str, Range]:
+        ranges = {}
+        if category_filter.name_prefix is not None:
+            ranges['name'] = prefix_bounds(category_filter.name_prefix)
+        if category_filter.created_from is not None \
+                or category_filter.created_to is not None:
+            # a null created_at is keyed as datetime.min, and no range
+            # matches it, as in SQL
+            ranges['created_at'] = (
+                (datetime.min, HIGHEST) if category_filter.created_from is None
+                else (category_filter.created_from,),
+                None if category_filter.created_to is None
+                else (category_filter.created_to, HIGHEST)
+            )
+        return ranges
+
+    def _get_slot(self, entity_id: str | UniqueEntityId) -> int:
+        slot = self._slots.get(str(entity_id))
+        if slot is None:
+            raise NotFoundException(
+                f"Entity not found using ID '{entity_id}'")
+        return slot
+
+    def _partition(self, field_name: str, is_active: Optional[bool]):
+        partition = self._partitions[field_name].get(is_active)
+        if partition is None:
+            partition = self._partitions[field_name][is_active] = \
+                SortedIndex()
+        return partition
+
+    def _index_keys(self, entity: Category) -> IndexedKeys:
+        entity_id = entity.id
+        return (
+            (entity.name, entity_id),
+            (entity.created_at or datetime.min, entity_id),
+            entity.is_active
+        )
+
+    def _load(self, categories: Iterable[Category]) -> None:
+        categories = list(categories)
+        unique = {category.id: category for category in categories}
+        if len(unique) != len(categories):
+            categories = list(unique.values())
+
+        self._items = categories
+        self._keys = [self._index_keys(category) for category in categories]
+        self._slots = {
+            category.id: slot for slot, category in enumerate(categories)
+        }
+        for position, field_name in enumerate(self.sortable_fields):
+            self._indexes[field_name].update(
+                key[position] for key in self._keys)
+        for slot, key in enumerate(self._keys):
+            self._by_is_active.add(slot, key[2])
+        for is_active in self._by_is_active.values():
+            for position, field_name in enumerate(self.sortable_fields):
+                self._partition(field_name, is_active).update(
+                    self._keys[slot][position]
+                    for slot in self._by_is_active.get(is_active)
+                )
+
+    def _add(self, entity: Category) -> None:
+        keys = self._index_keys(entity)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._items[slot] = entity
+            self._keys[slot] = keys
+        else:
+            slot = len(self._items)
+            self._items.append(entity)
+            self._keys.append(keys)
+
+        self._slots[entity.id] = slot
+        for position, field_name in enumerate(self.sortable_fields):
+            self._indexes[field_name].add(keys[position])
+            self._partition(field_name, keys[2]).add(keys[position])
+        self._by_is_active.add(slot, keys[2])
+
+    def _remove(self, slot: int) -> None:
+        keys = self._keys[slot]
+        for position, field_name in enumerate(self.sortable_fields):
+            self._indexes[field_name].remove(keys[position])
+            self._partition(field_name, keys[2]).remove(keys[position])
+        self._by_is_active.discard(slot, keys[2])
+
+        del self._slots[keys[0][1]]
+        self._items[slot] = None
+        self._keys[slot] = None
+        self._free_slots.append(slot)
+
+    def _reindex(self, slot: int) -> None:
+        old_keys = self._keys[slot]
+        keys = self._index_keys(self._items[slot])
+        if keys == old_keys:
+            return
+
+        moved = keys[2] != old_keys[2]
+        for position, field_name in enumerate(self.sortable_fields):
+            if keys[position] != old_keys[position]:
+                self._indexes[field_name].remove(old_keys[position])
+                self._indexes[field_name].add(keys[position])
+            if moved or keys[position] != old_keys[position]:
+                self._partition(field_name, old_keys[2]).remove(
+                    old_keys[position])
+                self._partition(field_name, keys[2]).add(keys[position])
+        if moved:
+            self._by_is_active.discard(slot, old_keys[2])
+            self._by_is_active.add(slot, keys[2])
+        self._keys[slot] = keys
+
+    def _on_category_changed(
+        self,
+        entity: Category,
+        name: str,
+        old_value: Any,
+        new_value: Any
+    ) -> None:
+        if name not in self.indexed_fields:
+            return
+        slot = self._slots.get(entity.id)
+        if slot is not None and self._items[slot] is entity:
+            self._reindex(slot)
+
+
+class CategoryAsyncInMemoryRepository(CategoryAsyncRepositoryAdapter):
+
+    def __init__(self, categories: Iterable[Category] = ()) -> None:
+        # every call completes without awaiting, so each one is atomic
+        # with respect to the other coroutines on the loop
+        super().__init__(CategoryInMemoryRepository(categories),
+                         blocking=False)
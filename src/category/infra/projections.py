@@ -0,0 +1,143 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from __seedwork.domain.events import DomainEvent
+from __seedwork.infra.projections import BucketCounts, Projection
+from category.domain.entities import Category
+from category.domain.events import CategoryActivated, CategoryCreated, \
+    CategoryDeactivated, CategoryDeleted, CategoryUpdated
+
+
+PERIODS = ('day', 'hour')
+
+
+def day_bucket(value: date) -> int:
+    return value.toordinal()
+
+
+def hour_bucket(value: datetime) -> int:
+    return value.toordinal() * 24 + value.hour
+
+
+def _from_bucket(bucket: int, per: str) -> datetime:
+    if per == 'day':
+        return datetime.fromordinal(bucket)
+    return datetime.fromordinal(bucket // 24) + timedelta(hours=bucket % 24)
+
+
+class CategoryStatsProjection(Projection):
+    # dashboard counters: total, active and inactive categories, and
+    # creations per day and per hour of `created_at`. Each event costs O(1),
+    # as the projection remembers whether every category it counts is
+    # active; that also makes applying an event twice harmless
+
+    event_classes = (CategoryCreated, CategoryUpdated, CategoryActivated,
+                     CategoryDeactivated, CategoryDeleted)
+
+    def reset(self) -> None:
+        self._states: Dict[str, Tuple[Optional[bool], Optional[datetime]]] = {}
+        self.total = 0
+        self.active = 0
+        self.inactive = 0
+        self.per_day = BucketCounts()
+        self.per_hour = BucketCounts()
+
+    def rebuild(self, categories: Iterable[Category]) -> None:
+        with self._lock:
+            self.reset()
+            for category in categories:
+                self._add(category.id, category.is_active,
+                          category.created_at)
+
+    def apply(self, event: DomainEvent) -> None:
+        event_class = type(event)
+        if event_class is CategoryCreated:
+            self._add(event.aggregate_id, event.is_active, event.created_at)
+        elif event_class is CategoryActivated:
+            self._set_active(event.aggregate_id, True)
+        elif event_class is CategoryDeactivated:
+            self._set_active(event.aggregate_id, False)
+        elif event_class is CategoryDeleted:
+            self._remove(event.aggregate_id)
+        # a CategoryUpdated changes neither counter
+
+    def created(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        per: str = 'day'
+    ) -> int:
+        buckets, first, last = self._bounds(start, end, per)
+        return buckets.total(first, last)
+
+    # the non-empty buckets between `start` and `end` (both included, and
+    # widened to whole buckets), as (start of the bucket, creations)
+    def created_series(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        per: str = 'day'
+    ) -> List[Tuple[datetime, int]]:
+        buckets, first, last = self._bounds(start, end, per)
+        return [
+            (_from_bucket(bucket, per), count)
+            for bucket, count in buckets.items(first, last)
+        ]
+
+    def _bounds(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        per: str
+    ) -> Tuple[BucketCounts, Optional[int], Optional[int]]:
+        if per not in PERIODS:
+            raise ValueError(
+                f'Unsupported period {per!r}, expected one of {PERIODS}')
+        to_bucket = day_bucket if per == 'day' else hour_bucket
+        return (
+            self.per_day if per == 'day' else self.per_hour,
+            None if start is None else to_bucket(start),
+            None if end is None else to_bucket(end)
+        )
+
+    def _add(
+        self,
+        entity_id: str,
+        is_active: Optional[bool],
+        created_at: Optional[datetime]
+    ) -> None:
+        if entity_id in self._states:
+            return
+        self._states[entity_id] = (is_active, created_at)
+        self._count(is_active, created_at, 1)
+
+    def _remove(self, entity_id: str) -> None:
+        state = self._states.pop(entity_id, None)
+        if state is not None:
+            self._count(*state, -1)
+
+    def _set_active(self, entity_id: str, is_active: bool) -> None:
+        state = self._states.get(entity_id)
+        if state is None or state[0] is is_active:
+            return
+        self._states[entity_id] = (is_active, state[1])
+        self._count_active(state[0], -1)
+        self._count_active(is_active, 1)
+
+    def _count(
+        self,
+        is_active: Optional[bool],
+        created_at: Optional[datetime],
+        delta: int
+    ) -> None:
+        self.total += delta
+        self._count_active(is_active, delta)
+        if created_at is not None:
+            self.per_day.add(day_bucket(created_at), delta)
+            self.per_hour.add(hour_bucket(created_at), delta)
+
+    def _count_active(self, is_active: Optional[bool], delta: int) -> None:
+        if is_active is True:
+            self.active += delta
+        elif is_active is False:
+            self.inactive += delta
@@ -0,0 +1,153 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List
+
+from __seedwork.domain.exceptions import InvalidUuidException, \
+    NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.columns import from_epoch_micros, to_epoch_micros
+from __seedwork.infra.snapshots import Snapshot, write_snapshot
+from category.domain.entities import Category
+
+
+MAGIC = b'CATEGORY'
+VERSION = 1
+
+# sections, in file order: fixed-width columns of `count` rows, utf-8
+# names and descriptions in one heap (row `i` spans offsets[i]:offsets[i + 1])
+# and the rows sorted by id, to find one by binary search
+IDS, FLAGS, CREATED_AT, NAME_OFFSETS, DESCRIPTION_OFFSETS, HEAP, ID_INDEX = \
+    range(7)
+
+# bits of the FLAGS column
+IS_ACTIVE = 1
+IS_ACTIVE_NULL = 2
+DESCRIPTION_NULL = 4
+CREATED_AT_NULL = 8
+
+
+def write_category_snapshot(
+    path: str,
+    categories: Iterable[Category]
+) -> int:
+    raw_ids = []
+    flags = bytearray()
+    created_at = array('q')
+    name_offsets = array('Q', [0])
+    description_offsets = array('Q', [0])
+    names = bytearray()
+    descriptions = bytearray()
+
+    for category in categories:
+        row_flags = 0
+        raw_ids.append(category.unique_entity_id.raw)
+        names += category.name.encode('utf-8')
+        name_offsets.append(len(names))
+        if category.description is None:
+            row_flags |= DESCRIPTION_NULL
+        else:
+            descriptions += category.description.encode('utf-8')
+        description_offsets.append(len(descriptions))
+        if category.is_active is None:
+            row_flags |= IS_ACTIVE_NULL
+        elif category.is_active:
+            row_flags |= IS_ACTIVE
+        if category.created_at is None:
+            row_flags |= CREATED_AT_NULL
+            created_at.append(0)
+        else:
+            created_at.append(to_epoch_micros(category.created_at))
+        flags.append(row_flags)
+
+    count = len(raw_ids)
+    id_index = array('I', sorted(range(count), key=raw_ids.__getitem__))
+    for previous, row in zip(id_index, id_index[1:]):
+        if raw_ids[previous] == raw_ids[row]:
+            raise ValueError(
+                f"Duplicated ID '{UniqueEntityId.trusted(raw_ids[row])}'")
+
+    base = len(names)
+    description_offsets = array(
+        'Q', [offset + base for offset in description_offsets])
+    write_snapshot(path, MAGIC, VERSION, count, [
+        b''.join(raw_ids), flags, created_at, name_offsets,
+        description_offsets, names + descriptions, id_index
+    ])
+    return count
+
+
+class CategorySnapshot:
+    # categories read lazily from a memory mapped snapshot: opening one only
+    # reads its header (and checksums the file unless `verify=False`), then
+    # each category is built from its row when it is asked for
+
+    def __init__(self, path: str, verify: bool = True) -> None:
+        self._snapshot = Snapshot(path, MAGIC, VERSION, verify)
+        section = self._snapshot.section
+        self._ids = section(IDS)
+        self._flags = section(FLAGS)
+        self._created_at = section(CREATED_AT, 'q')
+        self._name_offsets = section(NAME_OFFSETS, 'Q')
+        self._description_offsets = section(DESCRIPTION_OFFSETS, 'Q')
+        self._heap = section(HEAP)
+        self._id_index = section(ID_INDEX, 'I')
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    def __getitem__(self, index: int) -> Category:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('snapshot index out of range')
+        # rows come from categories that were valid when written
+        return Category.rehydrate_many((self.__row(index),))[0]
+
+    def __iter__(self) -> Iterator[Category]:
+        return map(self.__getitem__, range(len(self)))
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        try:
+            raw = entity_id.raw if isinstance(entity_id, UniqueEntityId) \
+                else UniqueEntityId(entity_id).raw
+        except InvalidUuidException:
+            raw = None
+
+        if raw is not None:
+            id_index = self._id_index
+            position = bisect_left(id_index, raw, key=self.__raw_id)
+            if position < len(id_index) \
+                    and self.__raw_id(id_index[position]) == raw:
+                return self[id_index[position]]
+        raise NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    def to_categories(self) -> List[Category]:
+        return Category.rehydrate_many(map(self.__row, range(len(self))))
+
+    def close(self) -> None:
+        self._snapshot.close()
+
+    def __enter__(self) -> 'CategorySnapshot':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __raw_id(self, index: int) -> bytes:
+        return bytes(self._ids[index * 16:index * 16 + 16])
+
+    def __row(self, index: int) -> tuple:
+        flags = self._flags[index]
+        heap = self._heap
+        name_offsets = self._name_offsets
+        description_offsets = self._description_offsets
+        return (
+            UniqueEntityId.trusted(self.__raw_id(index)),
+            str(heap[name_offsets[index]:name_offsets[index + 1]], 'utf-8'),
+            None if flags & DESCRIPTION_NULL else str(
+                heap[description_offsets[index]:
+                     description_offsets[index + 1]], 'utf-8'),
+            None if flags & IS_ACTIVE_NULL else bool(flags & IS_ACTIVE),
+            None if flags & CREATED_AT_NULL
+            else from_epoch_micros(self._created_at[index])
+        )
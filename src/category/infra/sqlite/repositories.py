@@ -0,0 +1,353 @@
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+from __seedwork.domain.events import DomainEvents
+from __seedwork.domain.exceptions import InvalidUuidException, \
+    NotFoundException
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.columns import from_epoch_micros, to_epoch_micros
+from __seedwork.infra.indexes import prefix_bounds
+from __seedwork.infra.sqlite import ConnectionPool
+from __seedwork.infra.streams import chunked
+from category.domain.entities import Category
+from category.domain.events import CategoryActivated, \
+    CategoryDeactivated, CategoryUpdated
+from category.domain.repositories import CategoryFilter, \
+    CategoryRepository, cursor_key, cursor_position
+from category.infra.async_repositories import \
+    CategoryAsyncRepositoryAdapter
+
+
+Row = Tuple[bytes, str, Optional[str], Optional[int], Optional[int]]
+
+SCHEMA = (
+    # ids are stored as their 16 raw bytes and created_at as epoch
+    # microseconds, so keys stay small and compare like the entities do
+    '''CREATE TABLE IF NOT EXISTS categories (
+        id BLOB NOT NULL PRIMARY KEY,
+        name TEXT NOT NULL,
+        description TEXT,
+        is_active INTEGER,
+        created_at INTEGER
+    ) WITHOUT ROWID''',
+    'CREATE INDEX IF NOT EXISTS categories_name '
+    'ON categories (name, id)',
+    'CREATE INDEX IF NOT EXISTS categories_created_at '
+    'ON categories (created_at, id)',
+    'CREATE INDEX IF NOT EXISTS categories_is_active_name '
+    'ON categories (is_active, name, id)',
+    'CREATE INDEX IF NOT EXISTS categories_is_active_created_at '
+    'ON categories (is_active, created_at, id)',
+)
+
+COLUMNS = 'id, name, description, is_active, created_at'
+
+UPSERT = f'''INSERT INTO categories ({COLUMNS}) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        name = excluded.name,
+        description = excluded.description,
+        is_active = excluded.is_active,
+        created_at = excluded.created_at'''
+UPDATABLE_COLUMNS = ('name', 'description', 'is_active', 'created_at')
+EXISTS = 'SELECT 1 FROM categories WHERE id = ?'
+DELETE = 'DELETE FROM categories WHERE id = ?'
+SELECT = f'SELECT {COLUMNS} FROM categories'
+SELECT_BY_ID = f'{SELECT} WHERE id = ?'
+
+
+class CategorySqliteRepository(CategoryRepository):
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        chunk_size: int = 10_000
+    ) -> None:
+        self.pool = pool
+        self.chunk_size = chunk_size
+        with self.pool.transaction() as connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+
+    def insert(self, entity: Category) -> None:
+        with self.pool.connection() as connection:
+            connection.execute(UPSERT, self._to_row(entity))
+        entity.clear_changes()
+
+    # an insert already writes every column, over any stored row
+    def save(self, entity: Category) -> None:
+        self.insert(entity)
+
+    def insert_many(self, entities: Iterable[Category]) -> int:
+        inserted = []
+        with self.pool.transaction() as connection:
+            for chunk in chunked(entities, self.chunk_size):
+                connection.executemany(UPSERT, map(self._to_row, chunk))
+                inserted.extend(chunk)
+        # only once the transaction has committed, as insert does
+        for entity in inserted:
+            entity.clear_changes()
+        return len(inserted)
+
+    def find_by_id(self, entity_id: str | UniqueEntityId) -> Category:
+        with self.pool.connection() as connection:
+            row = connection.execute(
+                SELECT_BY_ID, (self._get_raw_id(entity_id),)).fetchone()
+        if row is None:
+            raise self._not_found(entity_id)
+        return self._to_entity(row)
+
+    def find_all(self) -> List[Category]:
+        with self.pool.connection() as connection:
+            return self._to_entities(connection.execute(SELECT))
+
+    # only the columns of fields changed since the entity was loaded or
+    # last written are sent, and an unchanged entity is not written at all
+    def update(self, entity: Category) -> None:
+        entity_id, *values = self._to_row(entity)
+        values = dict(zip(UPDATABLE_COLUMNS, values))
+        columns = tuple(
+            name for name in entity.changed_fields() if name in values)
+        with self.pool.connection() as connection:
+            if columns:
+                found = connection.execute(
+                    self._update_statement(columns),
+                    (*map(values.__getitem__, columns), entity_id)
+                ).rowcount
+            else:
+                found = connection.execute(EXISTS, (entity_id,)).fetchone()
+        if not found:
+            raise self._not_found(entity.id)
+        entity.clear_changes()
+
+    def delete(self, entity_id: str | UniqueEntityId) -> None:
+        with self.pool.connection() as connection:
+            cursor = connection.execute(
+                DELETE, (self._get_raw_id(entity_id),))
+        if not cursor.rowcount:
+            raise self._not_found(entity_id)
+
+    # each runs as one UPDATE over the filter's indexes, skipping the rows
+    # it would not change, and publishes the events of the rows it changed
+    def activate_where(self, category_filter: CategoryFilter) -> List[str]:
+        ids = [str(UniqueEntityId.trusted(raw)) for raw, in
+               self._update_where(category_filter, 'is_active', 1, 'id')]
+        for entity_id in ids:
+            DomainEvents.publish(CategoryActivated(aggregate_id=entity_id))
+        return ids
+
+    def deactivate_where(self, category_filter: CategoryFilter) -> List[str]:
+        ids = [str(UniqueEntityId.trusted(raw)) for raw, in
+               self._update_where(category_filter, 'is_active', 0, 'id')]
+        for entity_id in ids:
+            DomainEvents.publish(CategoryDeactivated(aggregate_id=entity_id))
+        return ids
+
+    def update_description_where(
+        self,
+        category_filter: CategoryFilter,
+        description: Optional[str]
+    ) -> List[str]:
+        Category.description_schema.validate(description)
+        ids = []
+        for raw, name in self._update_where(
+                category_filter, 'description', description, 'id, name'):
+            ids.append(str(UniqueEntityId.trusted(raw)))
+            DomainEvents.publish(CategoryUpdated(
+                aggregate_id=ids[-1], name=name, description=description))
+        return ids
+
+    def search(
+        self,
+        input_params: CategoryRepository.SearchParams
+    ) -> CategoryRepository.SearchResult:
+        if input_params.sort in self.sortable_fields:
+            sort_field = input_params.sort
+            sort_dir = 'DESC' if input_params.sort_dir == 'desc' else 'ASC'
+        else:
+            sort_field, sort_dir = 'created_at', 'DESC'
+
+        where, params = self._where(input_params.filter or CategoryFilter())
+        offset = (input_params.page - 1) * input_params.per_page
+        with self.pool.connection() as connection:
+            total, = connection.execute(
+                f'SELECT COUNT(*) FROM categories{where}', params).fetchone()
+            items = self._to_entities(connection.execute(
+                f'{SELECT}{where} '
+                f'ORDER BY {sort_field} {sort_dir}, id {sort_dir} '
+                'LIMIT ? OFFSET ?',
+                (*params, input_params.per_page, offset)))
+
+        return CategoryRepository.SearchResult(
+            items=items,
+            total=total,
+            current_page=input_params.page,
+            per_page=input_params.per_page,
+            sort=input_params.sort,
+            sort_dir=input_params.sort_dir,
+            filter=input_params.filter
+        )
+
+    def paginate(
+        self,
+        input_params: CategoryRepository.CursorParams
+    ) -> CategoryRepository.CursorPage:
+        conditions, params = self._conditions(
+            input_params.filter or CategoryFilter())
+        order = 'DESC' if input_params.descending else 'ASC'
+        limit = input_params.per_page + 1
+        window = []
+        with self.pool.connection() as connection:
+            for condition, bounds in self._keyset(input_params):
+                where = ' AND '.join(
+                    conditions + [condition] if condition else conditions)
+                window.extend(self._to_entities(connection.execute(
+                    f'{SELECT}{" WHERE " if where else ""}{where} '
+                    f'ORDER BY created_at {order}, id {order} LIMIT ?',
+                    (*params, *bounds, limit - len(window)))))
+                if len(window) == limit:
+                    break
+        return self.CursorPage.from_window(window, input_params, cursor_key)
+
+    # the rows past the cursor, as conditions to read in turn: row values
+    # seek the (created_at, id) indexes, and null created_at values, which
+    # sort lowest, are read as a segment of their own since they never
+    # compare
+    @staticmethod
+    def _keyset(
+        input_params: CategoryRepository.CursorParams
+    ) -> List[Tuple[Optional[str], tuple]]:
+        if input_params.cursor is None:
+            return [(None, ())]
+        created_at, unique_entity_id = cursor_position(input_params.cursor)
+        raw = unique_entity_id.raw
+        if input_params.descending:
+            if created_at is None:
+                return [('created_at IS NULL AND id < ?', (raw,))]
+            return [
+                ('(created_at, id) < (?, ?)',
+                 (to_epoch_micros(created_at), raw)),
+                ('created_at IS NULL', ())
+            ]
+        if created_at is None:
+            return [
+                ('created_at IS NULL AND id > ?', (raw,)),
+                ('created_at IS NOT NULL', ())
+            ]
+        return [('(created_at, id) > (?, ?)',
+                 (to_epoch_micros(created_at), raw))]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _update_statement(columns: Tuple[str, ...]) -> str:
+        assignments = ', '.join(f'{column} = ?' for column in columns)
+        return f'UPDATE categories SET {assignments} WHERE id = ?'
+
+    # reads the rows to change, then changes them with the same conditions;
+    # the write lock is taken first so no other writer runs in between
+    # (UPDATE ... RETURNING needs sqlite 3.35, newer than some distributions)
+    def _update_where(
+        self,
+        category_filter: CategoryFilter,
+        column: str,
+        value: Any,
+        returning: str
+    ) -> List[tuple]:
+        conditions, params = self._conditions(category_filter)
+        where = ' AND '.join([f'{column} IS NOT ?'] + conditions)
+        params = (value, *params)
+        with self.pool.transaction() as connection:
+            rows = connection.execute(
+                f'SELECT {returning} FROM categories WHERE {where}',
+                params).fetchall()
+            if rows:
+                connection.execute(
+                    f'UPDATE categories SET {column} = ? WHERE {where}',
+                    (value, *params))
+        return rows
+
+    def _where(self, category_filter: CategoryFilter) -> Tuple[str, list]:
+        conditions, params = self._conditions(category_filter)
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        return where, params
+
+    def _conditions(
+        self,
+        category_filter: CategoryFilter
+    ) -> Tuple[List[str], list]:
+        conditions, params = [], []
+        if category_filter.is_active is not None:
+            conditions.append('is_active = ?')
+            params.append(int(category_filter.is_active))
+        if category_filter.name_prefix is not None:
+            (minimum,), maximum = prefix_bounds(category_filter.name_prefix)
+            conditions.append('name >= ?')
+            params.append(minimum)
+            if maximum is not None:
+                conditions.append('name < ?')
+                params.append(maximum[0])
+        if category_filter.created_from is not None:
+            conditions.append('created_at >= ?')
+            params.append(to_epoch_micros(category_filter.created_from))
+        if category_filter.created_to is not None:
+            conditions.append('created_at <= ?')
+            params.append(to_epoch_micros(category_filter.created_to))
+        return conditions, params
+
+    def _get_raw_id(self, entity_id: str | UniqueEntityId) -> bytes:
+        if isinstance(entity_id, UniqueEntityId):
+            return entity_id.raw
+        try:
+            return UniqueEntityId(entity_id).raw
+        except InvalidUuidException as ex:
+            raise self._not_found(entity_id) from ex
+
+    def _not_found(self, entity_id: str | UniqueEntityId) -> Exception:
+        return NotFoundException(f"Entity not found using ID '{entity_id}'")
+
+    @staticmethod
+    def _to_row(entity: Category) -> Row:
+        is_active = entity.is_active
+        return (
+            entity.unique_entity_id.raw,
+            entity.name,
+            entity.description,
+            None if is_active is None else int(is_active),
+            to_epoch_micros(entity.created_at)
+        )
+
+    @staticmethod
+    def _to_entity(row: Row) -> Category:
+        entity_id, name, description, is_active, created_at = row
+        # rows were valid categories when written, so skip validation
+        return Category.from_persistence(
+            unique_entity_id=UniqueEntityId.trusted(entity_id),
+            name=name,
+            description=description,
+            is_active=None if is_active is None else bool(is_active),
+            created_at=from_epoch_micros(created_at)
+        )
+
+    @staticmethod
+    def _to_entities(rows: Iterable[Row]) -> List[Category]:
+        trusted = UniqueEntityId.trusted
+        return Category.rehydrate_many(
+            (trusted(entity_id), name, description,
+             None if is_active is None else bool(is_active),
+             from_epoch_micros(created_at))
+            for entity_id, name, description, is_active, created_at in rows
+        )
+
+
+class CategoryAsyncSqliteRepository(CategoryAsyncRepositoryAdapter):
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        executor: Optional[Executor] = None
+    ) -> None:
+        super().__init__(CategorySqliteRepository(pool), executor)
+
+    async def insert_many(self, entities: Iterable[Category]) -> int:
+        return await self._call(
+            self.repository.insert_many, list(entities))
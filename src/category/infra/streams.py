@@ -0,0 +1,147 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from __seedwork.domain.exceptions import InvalidUuidException
+from __seedwork.domain.serializers import EntitySerializer
+from __seedwork.domain.validators import ErrorFields
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.streams import Record, chunked, read_csv, read_jsonl, \
+    write_csv, write_jsonl
+from category.domain.entities import Category
+
+
+FORMATS = ('jsonl', 'csv')
+FIELDS = ('id', 'name', 'description', 'is_active', 'created_at')
+
+_CSV_BOOLEANS = {'true': True, 'false': False, '': None}
+
+
+@dataclass(frozen=True, slots=True)
+class ImportChunk:
+    categories: List[Category] = field(default_factory=list)
+    # keyed by the position of the record in the whole input
+    rejected: Dict[int, ErrorFields] = field(default_factory=dict)
+
+
+def import_categories(
+    records: Iterable[Record],
+    chunk_size: int = 1000
+) -> Iterator[ImportChunk]:
+    start = 0
+    for chunk in chunked(records, chunk_size):
+        yield _import_chunk(chunk, start)
+        start += len(chunk)
+
+
+def read_categories(
+    stream: Iterable[str],
+    format: str = 'jsonl',
+    chunk_size: int = 1000
+) -> Iterator[ImportChunk]:
+    _check_format(format)
+    if format == 'jsonl':
+        return import_categories(read_jsonl(stream), chunk_size)
+    return import_categories(
+        map(_from_csv_record, read_csv(stream)), chunk_size)
+
+
+def export_categories(
+    categories: Iterable[Category],
+    stream: TextIO,
+    format: str = 'jsonl',
+    chunk_size: int = 1000
+) -> int:
+    _check_format(format)
+    to_json_dict = EntitySerializer.for_class(Category).to_json_dict
+    records = map(to_json_dict, categories)
+    if format == 'jsonl':
+        return write_jsonl(stream, records, chunk_size)
+    return write_csv(
+        stream, map(_to_csv_record, records), FIELDS, chunk_size)
+
+
+# the keyword arguments of Category for `record`, with what cannot be parsed
+# left out and reported in `errors`
+def to_row(record: Record, errors: ErrorFields) -> Dict[str, Any]:
+    row = {
+        name: record[name] for name in ('name', 'description', 'is_active')
+        if name in record
+    }
+
+    entity_id = record.get('id')
+    if entity_id is not None:
+        try:
+            row['unique_entity_id'] = UniqueEntityId(entity_id)
+        except InvalidUuidException as ex:
+            errors['id'] = [str(ex)]
+
+    if 'created_at' in record:
+        created_at = record['created_at']
+        if isinstance(created_at, str):
+            try:
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                pass
+        if created_at is None or isinstance(created_at, datetime):
+            row['created_at'] = created_at
+        else:
+            errors['created_at'] = [
+                'The "created_at" must be an ISO 8601 datetime.']
+    return row
+
+
+def _check_format(format: str) -> None:
+    if format not in FORMATS:
+        raise ValueError(
+            f'Unsupported format {format!r}, expected one of {FORMATS}')
+
+
+def _import_chunk(records: List[Record], start: int) -> ImportChunk:
+    rows = []
+    positions = []
+    rejected = {}
+    for index, record in enumerate(records, start=start):
+        errors = {}
+        row = to_row(record, errors)
+        if errors:
+            # still report every error of the record, but keep it out of
+            # create_many so no CategoryCreated is published for it
+            Category.validate(
+                name=row.get('name'),
+                description=row.get('description'),
+                is_active=row.get('is_active'),
+                created_at=row.get('created_at'),
+                errors=errors
+            )
+            rejected[index] = errors
+        else:
+            rows.append(row)
+            positions.append(index)
+
+    categories, invalid = Category.create_many(rows)
+    for position, errors in invalid.items():
+        rejected[positions[position]] = errors
+    return ImportChunk(categories, dict(sorted(rejected.items())))
+
+
+def _from_csv_record(record: Record) -> Record:
+    # csv has no nulls nor booleans: empty cells are None, and is_active
+    # is written as true/false
+    converted = {
+        name: value for name, value in record.items()
+        if name in FIELDS and value != ''
+    }
+    is_active = record.get('is_active')
+    if is_active is not None:
+        converted['is_active'] = _CSV_BOOLEANS.get(
+            is_active.strip().lower(), is_active)
+    return converted
+
+
+def _to_csv_record(record: Record) -> Record:
+    is_active: Optional[bool] = record['is_active']
+    return {
+        **record,
+        'is_active': '' if is_active is None else str(is_active).lower()
+    }
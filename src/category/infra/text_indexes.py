@@ -0,0 +1,85 @@
+from typing import Dict, Iterable
+
+from __seedwork.domain.events import DomainEvents
+from __seedwork.domain.repositories import \
+    SearchResult as DefaultSearchResult
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.text_indexes import InvertedIndex
+from category.domain.entities import Category
+from category.domain.events import CategoryDeleted, CategoryUpdated
+
+
+class CategoryTextSearchResult(DefaultSearchResult[Category, str]):
+    pass
+
+
+class CategoryTextIndex:
+    # full-text and prefix search over name and description of the
+    # categories it was given, kept in sync by the CategoryUpdated and
+    # CategoryDeleted events whichever instance of a category raises them
+
+    weights = {'name': 3.0, 'description': 1.0}
+    indexed_fields = ('name', 'description')
+
+    def __init__(
+        self,
+        categories: Iterable[Category] = (),
+        max_expansions: int = 64
+    ) -> None:
+        self._index = InvertedIndex(self.weights, max_expansions)
+        self._categories: Dict[str, Category] = {}
+        for category in categories:
+            self.add(category)
+        DomainEvents.subscribe(CategoryUpdated, self._on_category_updated)
+        DomainEvents.subscribe(CategoryDeleted, self._on_category_deleted)
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def add(self, category: Category) -> None:
+        self._categories[category.id] = category
+        self._index.add(category.id, {
+            'name': category.name,
+            'description': category.description
+        })
+
+    def remove(self, entity_id: str | UniqueEntityId) -> None:
+        entity_id = str(entity_id)
+        if self._categories.pop(entity_id, None) is not None:
+            self._index.remove(entity_id)
+
+    def search(
+        self,
+        query: str,
+        page: int = 1,
+        per_page: int = 15
+    ) -> CategoryTextSearchResult:
+        # out of range values fall back to the defaults, as in SearchParams
+        page = page if page >= 1 else 1
+        per_page = per_page if per_page >= 1 else 15
+        total, hits = self._index.search(
+            query, limit=per_page, offset=(page - 1) * per_page)
+        return CategoryTextSearchResult(
+            items=[self._categories[entity_id] for entity_id, _ in hits],
+            total=total,
+            current_page=page,
+            per_page=per_page,
+            filter=query
+        )
+
+    def _on_category_updated(self, event: CategoryUpdated) -> None:
+        category = self._categories.get(event.aggregate_id)
+        if category is None:
+            return
+        if category.name != event.name \
+                or category.description != event.description:
+            # another instance changed: keep a copy with the new text
+            # rather than changing the instance the index was given
+            category, = Category.rehydrate_many([(
+                category.unique_entity_id, event.name, event.description,
+                category.is_active, category.created_at
+            )])
+        self.add(category)
+
+    def _on_category_deleted(self, event: CategoryDeleted) -> None:
+        self.remove(event.aggregate_id)
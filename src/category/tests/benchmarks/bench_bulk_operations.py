@@ -0,0 +1,63 @@
+# python -m category.tests.benchmarks.bench_bulk_operations [rows] (from src/)
+import sys
+import time
+
+from __seedwork.infra.sqlite import ConnectionPool
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+def make_categories(count: int) -> list:
+    return [
+        Category(name=f'Category {index}', is_active=index % 2 == 0)
+        for index in range(count)
+    ]
+
+
+def sqlite(categories: list) -> CategoryRepository:
+    repo = CategorySqliteRepository(ConnectionPool(':memory:'))
+    repo.insert_many(categories)
+    return repo
+
+
+# what a catalog-wide toggle took before: load, change and save each one
+def one_by_one(repo: CategoryRepository, is_active: bool) -> None:
+    for category in repo.search(CategoryRepository.SearchParams(
+            per_page=10 ** 9,
+            filter=CategoryFilter(is_active=not is_active))).items:
+        if is_active:
+            category.activate()
+        else:
+            category.deactivate()
+        repo.update(category)
+
+
+def set_based(repo: CategoryRepository, is_active: bool) -> None:
+    if is_active:
+        repo.activate_where(CategoryFilter())
+    else:
+        repo.deactivate_where(CategoryFilter())
+
+
+def timed(function, factory, count: int) -> float:
+    repo = factory(make_categories(count))
+    start = time.perf_counter()
+    function(repo, False)
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000) -> None:
+    print(f'{count:,} categories, half of them active, all deactivated')
+    print(f'{"backend":<12}{"one by one":>12}{"set based":>12}{"speedup":>9}')
+    for name, factory in [('in_memory', CategoryInMemoryRepository),
+                          ('sqlite', sqlite)]:
+        before = timed(one_by_one, factory, count)
+        after = min(timed(set_based, factory, count) for _ in range(3))
+        print(f'{name:<12}{before:>12.3f}{after:>12.3f}'
+              f'{before / after:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
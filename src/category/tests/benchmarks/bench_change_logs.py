@@ -0,0 +1,55 @@
+# python -m category.tests.benchmarks.bench_change_logs [count] (from src/)
+import sys
+import tempfile
+import time
+
+from category.domain.entities import Category
+from category.infra.change_logs import CategoryChangeLog
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def record_changes(change_log: CategoryChangeLog, count: int) -> None:
+    # every category is created, renamed and toggled twice; a tenth of them
+    # are deleted
+    with change_log:
+        categories = [
+            Category.create(name=f'Category {index}') for index in range(count)
+        ]
+        for index, category in enumerate(categories):
+            category.update(f'Renamed {index}', 'changed')
+            category.deactivate()
+            category.activate()
+            if index % 10 == 0:
+                category.delete()
+
+
+def main(count: int = 50_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        change_log = CategoryChangeLog(directory, segment_bytes=1 << 20)
+        record_seconds = timed(lambda: record_changes(change_log, count))
+        change_log = CategoryChangeLog(directory, segment_bytes=1 << 20)
+        print(f'{change_log.next_offset:,} records for {count:,} categories '
+              f'written in {record_seconds:.2f}s')
+
+        def replay() -> None:
+            change_log.replay(CategoryInMemoryRepository())
+
+        full = min(timed(replay) for _ in range(3))
+        compact_seconds = timed(change_log.compact)
+        compacted = min(timed(replay) for _ in range(3))
+        records = sum(1 for _ in change_log.records())
+        print(f'compacted to {records:,} records in {compact_seconds:.2f}s')
+        print(f'{"replay":<24}{"seconds":>10}{"speedup":>9}')
+        print(f'{"full history":<24}{full:>10.4f}{1:>8.1f}x')
+        print(f'{"compacted":<24}{compacted:>10.4f}{full / compacted:>8.1f}x')
+        change_log.close()
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
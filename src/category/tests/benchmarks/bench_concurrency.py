@@ -0,0 +1,69 @@
+# python -m category.tests.benchmarks.bench_concurrency [ops] (from src/)
+import os
+import random
+import sys
+import threading
+import time
+
+from __seedwork.infra.concurrent_repositories import ConcurrentRepository
+from category.domain.entities import Category
+
+
+def toggle(category: Category) -> None:
+    category.deactivate() if category.is_active else category.activate()
+
+
+def run(threads: int, stripes: int, keys: int, ops: int) -> tuple:
+    repo = ConcurrentRepository(
+        [Category(name=f'Category {index}') for index in range(keys)],
+        stripes=stripes)
+    ids = [category.id for category in repo.find_all()]
+    changes = [0] * threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(number: int) -> None:
+        choice = random.Random(number).choice
+
+        def change(category: Category) -> None:
+            changes[number] += 1
+            toggle(category)
+
+        barrier.wait()
+        for index in range(ops // threads):
+            # four reads for every write
+            if index % 5:
+                repo.find_by_id(choice(ids))
+            else:
+                repo.modify(choice(ids), change)
+
+    workers = [
+        threading.Thread(target=worker, args=(number,))
+        for number in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    writes = threads * len(range(0, ops // threads, 5))
+    return ops / elapsed, sum(changes) - writes
+
+
+def main(ops: int = 200_000) -> None:
+    sys.setswitchinterval(1e-4)
+    print(f'{ops:,} operations (80% reads), {os.cpu_count()} cores')
+    print(f'{"keys":>6}{"stripes":>9}{"threads":>9}{"ops/s":>12}'
+          f'{"retries":>9}')
+    for keys in (10_000, 8):
+        for stripes in (1, 64):
+            for threads in (1, 2, 4, 8):
+                throughput, retries = run(threads, stripes, keys, ops)
+                print(f'{keys:>6}{stripes:>9}{threads:>9}'
+                      f'{throughput:>12,.0f}{retries:>9,}', flush=True)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,99 @@
+# python -m category.tests.benchmarks.bench_hot_paths (from src/)
+#   --save-baseline   record the current numbers as the baseline
+#   --threshold 0.2   fail when throughput drops more than 20% against it
+from dataclasses import dataclass
+import sys
+
+from __seedwork.domain.exceptions import InvalidUuidException, \
+    ValidationException
+from __seedwork.domain.validators import ValidatorRules
+from __seedwork.domain.value_objects import TimeOrderedIdGenerator, \
+    UniqueEntityId, ValueObject
+from __seedwork.tests.benchmarks.harness import Benchmark, main
+from category.domain.entities import Category
+
+
+@dataclass(frozen=True, slots=True)
+class Price(ValueObject):
+    amount: int
+    currency: str
+
+
+VALID = {'name': 'Movie', 'description': 'some description',
+         'is_active': True}
+INVALID = {'name': 'a'*256, 'description': 5, 'is_active': 5}
+CANONICAL_ID = '5490020a-e866-4229-9adc-aa44b83234c4'
+CATEGORY = Category(**VALID)
+PRICE = Price(amount=1000, currency='BRL')
+SAME_PRICE = Price(amount=1000, currency='BRL')
+PRICES = {Price(amount=amount, currency='BRL'): amount
+          for amount in range(1000, 1100)}
+UNIQUE_ID = UniqueEntityId(CANONICAL_ID)
+SAME_UNIQUE_ID = UniqueEntityId(CANONICAL_ID)
+UNIQUE_IDS = {UniqueEntityId(): index for index in range(99)}
+UNIQUE_IDS[UNIQUE_ID] = 99
+GENERATOR = TimeOrderedIdGenerator()
+
+
+def raises(function, *args, exception_class=ValidationException, **kwargs):
+    def call():
+        try:
+            function(*args, **kwargs)
+        except exception_class as exception:
+            return exception
+    return call
+
+
+def chained_rules(name, description, is_active):
+    ValidatorRules.values(name, 'name').required().string().max_length(255)
+    ValidatorRules.values(description, 'description').string()
+    ValidatorRules.values(is_active, 'is_active').boolean()
+
+
+def collected_rules(name, description, is_active):
+    errors = {}
+    ValidatorRules.values(name, 'name', errors) \
+        .required().string().max_length(255)
+    ValidatorRules.values(description, 'description', errors).string()
+    ValidatorRules.values(is_active, 'is_active', errors).boolean()
+    return errors
+
+
+BENCHMARKS = [
+    Benchmark('category.construct.valid', lambda: Category(**VALID)),
+    Benchmark('category.construct.invalid', raises(Category, **INVALID)),
+    Benchmark('category.validate.valid',
+              lambda: Category.validate('Movie', 'some description', True)),
+    Benchmark('category.validate.invalid',
+              raises(Category.validate, 'a'*256, 5, 5)),
+    Benchmark('category.validate.collect',
+              lambda: Category.validate('a'*256, 5, 5, errors={})),
+    Benchmark('rules.chain.valid',
+              lambda: chained_rules('Movie', 'some description', True)),
+    Benchmark('rules.chain.invalid', raises(chained_rules, 'a'*256, 5, 5)),
+    Benchmark('rules.chain.collect',
+              lambda: collected_rules('a'*256, 5, 5)),
+    Benchmark('unique_id.generate', UniqueEntityId),
+    Benchmark('unique_id.generate.time_ordered',
+              lambda: UniqueEntityId(GENERATOR())),
+    Benchmark('unique_id.parse', lambda: UniqueEntityId(CANONICAL_ID)),
+    Benchmark('unique_id.parse.invalid',
+              raises(UniqueEntityId, 'fake id',
+                     exception_class=InvalidUuidException)),
+    Benchmark('unique_id.trusted',
+              lambda: UniqueEntityId.trusted(CANONICAL_ID)),
+    Benchmark('value_object.str.single', lambda: str(UNIQUE_ID)),
+    Benchmark('value_object.str.many', lambda: str(PRICE)),
+    Benchmark('value_object.eq.single', lambda: UNIQUE_ID == SAME_UNIQUE_ID),
+    Benchmark('value_object.eq.many', lambda: PRICE == SAME_PRICE),
+    Benchmark('value_object.hash.single', lambda: hash(UNIQUE_ID)),
+    Benchmark('value_object.hash.many', lambda: hash(PRICE)),
+    Benchmark('value_object.dict_key.single',
+              lambda: UNIQUE_IDS[SAME_UNIQUE_ID]),
+    Benchmark('value_object.dict_key.many', lambda: PRICES[SAME_PRICE]),
+    Benchmark('entity.to_dict', CATEGORY.to_dict),
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main(BENCHMARKS))
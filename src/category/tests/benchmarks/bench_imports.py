@@ -0,0 +1,71 @@
+# python -m category.tests.benchmarks.bench_imports [rows] (from src/)
+import os
+import sys
+import tempfile
+import time
+
+from __seedwork.infra.streams import write_jsonl
+from category.infra.imports import ShardedCategoryImporter
+
+
+def make_records(count: int) -> list:
+    return [
+        {
+            'name': 'a' * 256 if index % 10 == 0 else f'Category {index}',
+            'description': f'Description of category {index}',
+            'is_active': index % 2 == 0
+        }
+        for index in range(count)
+    ]
+
+
+def validate_all(records: list, workers: int, batch_size: int) -> float:
+    with ShardedCategoryImporter(
+            workers=workers, batch_size=batch_size) as importer:
+        # warms the pool up so process start-up is not measured
+        list(importer.validate(records[:batch_size * max(workers, 1)]))
+        start = time.perf_counter()
+        accepted = sum(batch.accepted for batch in importer.validate(records))
+        elapsed = time.perf_counter() - start
+    assert accepted == len(records) - len(records) // 10
+    return elapsed
+
+
+# the workers read and parse their own shards of the file
+def validate_file(path: str, count: int, workers: int) -> float:
+    with ShardedCategoryImporter(workers=workers) as importer:
+        list(importer.validate(make_records(workers)))
+        start = time.perf_counter()
+        accepted = sum(batch.accepted
+                       for batch in importer.validate_jsonl(path))
+        elapsed = time.perf_counter() - start
+    assert accepted == count - count // 10
+    return elapsed
+
+
+def main(count: int = 1_000_000, batch_size: int = 10_000) -> None:
+    records = make_records(count)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({0, 1, 2, 4, 8, cores} - {
+        workers for workers in (2, 4, 8) if workers > cores})
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'categories.jsonl')
+        with open(path, 'w', encoding='utf-8') as stream:
+            write_jsonl(stream, records, batch_size)
+
+        print(f'{count:,} rows, {cores} cores, batches of {batch_size:,}')
+        print(f'{"workers":>8}{"records":>10}{"speedup":>9}'
+              f'{"jsonl":>10}{"speedup":>9}')
+        baselines = None
+        for workers in worker_counts:
+            elapsed = (validate_all(records, workers, batch_size),
+                       validate_file(path, count, workers))
+            baselines = baselines or elapsed
+            print(f'{workers:>8}'
+                  f'{elapsed[0]:>10.2f}{baselines[0] / elapsed[0]:>8.2f}x'
+                  f'{elapsed[1]:>10.2f}{baselines[1] / elapsed[1]:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+# python -m category.tests.benchmarks.bench_snapshots [rows] (from src/)
+import os
+import sys
+import tempfile
+import time
+
+from category.domain.entities import Category
+from category.infra.snapshots import CategorySnapshot, \
+    write_category_snapshot
+from category.infra.streams import export_categories, read_categories
+
+
+def make_categories(count: int) -> list:
+    return [
+        Category(name=f'Category {index}',
+                 description=f'Description of category {index}',
+                 is_active=index % 2 == 0)
+        for index in range(count)
+    ]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def load_json(path: str) -> list:
+    with open(path, encoding='utf-8') as stream:
+        return [
+            category
+            for chunk in read_categories(stream, chunk_size=10_000)
+            for category in chunk.categories
+        ]
+
+
+def open_snapshot(path: str, verify: bool, load: bool) -> None:
+    with CategorySnapshot(path, verify=verify) as snapshot:
+        if load:
+            snapshot.to_categories()
+        else:
+            snapshot.find_by_id(snapshot[len(snapshot) // 2].id)
+
+
+def main(count: int = 200_000) -> None:
+    categories = make_categories(count)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'categories.jsonl')
+        snapshot_path = os.path.join(directory, 'categories.snapshot')
+        with open(json_path, 'w', encoding='utf-8') as stream:
+            export_categories(categories, stream)
+        write_seconds = timed(
+            lambda: write_category_snapshot(snapshot_path, categories))
+        del categories
+
+        print(f'{count:,} rows: jsonl {os.path.getsize(json_path):,} bytes, '
+              f'snapshot {os.path.getsize(snapshot_path):,} bytes '
+              f'written in {write_seconds:.2f}s')
+        cases = [
+            ('jsonl, load all', lambda: load_json(json_path)),
+            ('snapshot, load all', lambda: open_snapshot(
+                snapshot_path, verify=True, load=True)),
+            ('snapshot, open + lookup', lambda: open_snapshot(
+                snapshot_path, verify=True, load=False)),
+            ('snapshot unverified, open + lookup', lambda: open_snapshot(
+                snapshot_path, verify=False, load=False)),
+        ]
+        baseline = None
+        print(f'{"startup":<36}{"seconds":>10}{"speedup":>9}')
+        for name, function in cases:
+            elapsed = min(timed(function) for _ in range(3))
+            baseline = baseline or elapsed
+            print(f'{name:<36}{elapsed:>10.4f}{baseline / elapsed:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
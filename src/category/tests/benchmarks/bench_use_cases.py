@@ -0,0 +1,96 @@
+# python -m category.tests.benchmarks.bench_use_cases (from src/)
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from unittest.mock import patch
+
+from __seedwork.infra.sqlite import ConnectionPool
+from category.application.use_cases import CreateCategoriesUseCase, \
+    GetCategoryUseCase
+from category.domain.entities import Category
+from category.infra.in_memory.repositories import \
+    CategoryAsyncInMemoryRepository
+from category.infra.sqlite.repositories import CategoryAsyncSqliteRepository
+
+
+def percentile(latencies, fraction: float) -> float:
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+
+
+async def concurrent_gets(category_repo, ids, concurrency: int,
+                          requests: int) -> None:
+    use_case = GetCategoryUseCase(category_repo)
+    latencies = []
+    queue = iter(random.choices(ids, k=requests))
+
+    async def client():
+        for entity_id in queue:
+            start = time.perf_counter()
+            await use_case.execute(GetCategoryUseCase.Input(entity_id))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f'{type(category_repo).__name__:<32}{concurrency:>6}'
+          f'{requests / elapsed:>12.0f}/s'
+          f'{statistics.median(latencies) * 1e3:>10.3f}'
+          f'{percentile(latencies, 0.95) * 1e3:>10.3f}'
+          f'{percentile(latencies, 0.99) * 1e3:>10.3f}')
+
+
+async def loop_lag(rows, offload: bool) -> None:
+    # a heartbeat coroutine measures how long the loop is stalled while a
+    # large batch is validated and built
+    lags = []
+    running = True
+
+    async def heartbeat():
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lags.append(time.perf_counter() - start - 0.001)
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    use_case = CreateCategoriesUseCase(CategoryAsyncInMemoryRepository())
+    threshold = 0 if offload else len(rows) + 1
+    with patch.object(CreateCategoriesUseCase, 'offload_threshold', threshold):
+        await use_case.execute(CreateCategoriesUseCase.Input(rows))
+    await asyncio.sleep(0.01)
+    running = False
+    await task
+    print(f'create {len(rows)} rows, offload={offload!s:<6}'
+          f'max loop lag {max(lags) * 1e3:>8.1f} ms')
+
+
+async def main(size: int = 50_000, requests: int = 20_000) -> None:
+    categories = [Category(name=f'Category {i}') for i in range(size)]
+    ids = [category.id for category in categories]
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = ConnectionPool(os.path.join(directory, 'bench.db'), size=8)
+        sqlite_repo = CategoryAsyncSqliteRepository(pool)
+        await sqlite_repo.insert_many(categories)
+        memory_repo = CategoryAsyncInMemoryRepository(categories)
+
+        print(f'{"repository":<32}{"tasks":>6}{"throughput":>14}'
+              f'{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+        for category_repo in (memory_repo, sqlite_repo):
+            for concurrency in (1, 16, 64):
+                await concurrent_gets(
+                    category_repo, ids, concurrency, requests)
+        pool.close()
+
+    rows = [{'name': f'Category {i}'} for i in range(size)]
+    for offload in (False, True):
+        await loop_lag(rows, offload)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
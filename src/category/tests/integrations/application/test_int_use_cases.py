@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+import unittest
+from unittest.mock import patch
+
+from __seedwork.domain.exceptions import NotFoundException, \
+    ValidationException
+from category.application.dto import CategoryOutput
+from category.application.use_cases import CreateCategoriesUseCase, \
+    CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, \
+    ListCategoriesUseCase, UpdateCategoryUseCase
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+from category.infra.in_memory.repositories import \
+    CategoryAsyncInMemoryRepository
+
+
+class TestCategoryUseCasesInt(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.category_repo = CategoryAsyncInMemoryRepository()
+
+    async def create(self, **kwargs) -> CreateCategoryUseCase.Output:
+        return await CreateCategoryUseCase(self.category_repo).execute(
+            CreateCategoryUseCase.Input(**kwargs))
+
+    async def test_create(self):
+        output = await self.create(name='Movie', description='description')
+
+        self.assertIsInstance(output, CategoryOutput)
+        category = await self.category_repo.find_by_id(output.id)
+        self.assertEqual(output, CreateCategoryUseCase.Output(
+            id=category.id,
+            name='Movie',
+            description='description',
+            is_active=True,
+            created_at=category.created_at
+        ))
+
+        with self.assertRaises(ValidationException):
+            await self.create(name=None)
+
+    async def test_create_many(self):
+        rows = [{'name': 'Movie'}, {'name': None}, {'name': 'Music'}]
+        use_case = CreateCategoriesUseCase(self.category_repo)
+
+        output = await use_case.execute(CreateCategoriesUseCase.Input(rows))
+        self.assertEqual([item.name for item in output.items],
+                         ['Movie', 'Music'])
+        self.assertEqual(list(output.rejected), [1])
+        self.assertEqual(len(await self.category_repo.find_all()), 2)
+
+    async def test_create_many_offloads_large_batches(self):
+        rows = [{'name': f'Category {i}'} for i in range(10)]
+        use_case = CreateCategoriesUseCase(self.category_repo)
+
+        with patch.object(
+                CreateCategoriesUseCase, 'offload_threshold', 5):
+            output = await use_case.execute(
+                CreateCategoriesUseCase.Input(rows))
+        self.assertEqual(len(output.items), 10)
+
+    async def test_get(self):
+        created = await self.create(name='Movie')
+        use_case = GetCategoryUseCase(self.category_repo)
+
+        output = await use_case.execute(GetCategoryUseCase.Input(created.id))
+        self.assertEqual(output.name, 'Movie')
+        self.assertIsInstance(output, GetCategoryUseCase.Output)
+
+        outputs = await use_case.execute_many([created.id, created.id])
+        self.assertEqual([item.id for item in outputs], [created.id] * 2)
+
+        with self.assertRaises(NotFoundException):
+            await use_case.execute(GetCategoryUseCase.Input('fake id'))
+
+    async def test_list(self):
+        created_at = datetime(2022, 6, 1)
+        for minute, name in enumerate(['Movie', 'Documentary', 'Music']):
+            await self.category_repo.insert(Category(
+                name=name, is_active=name != 'Music',
+                created_at=created_at + timedelta(minutes=minute)))
+        use_case = ListCategoriesUseCase(self.category_repo)
+
+        output = await use_case.execute(ListCategoriesUseCase.Input())
+        self.assertEqual([item.name for item in output.items],
+                         ['Music', 'Documentary', 'Movie'])
+        self.assertEqual(
+            (output.total, output.current_page, output.last_page,
+             output.per_page), (3, 1, 1, 15))
+
+        output = await use_case.execute(ListCategoriesUseCase.Input(
+            sort='name', per_page=1, page=2,
+            filter=CategoryFilter(is_active=True)))
+        self.assertEqual([item.name for item in output.items], ['Movie'])
+        self.assertEqual((output.total, output.last_page), (2, 2))
+
+        with patch.object(
+                ListCategoriesUseCase, 'offload_threshold', 1):
+            output = await use_case.execute(ListCategoriesUseCase.Input())
+        self.assertEqual(len(output.items), 3)
+
+    async def test_update(self):
+        created = await self.create(name='Movie')
+        use_case = UpdateCategoryUseCase(self.category_repo)
+
+        output = await use_case.execute(UpdateCategoryUseCase.Input(
+            id=created.id, name='Cinema', description='description',
+            is_active=False))
+        self.assertEqual(
+            (output.name, output.description, output.is_active),
+            ('Cinema', 'description', False))
+
+        output = await use_case.execute(UpdateCategoryUseCase.Input(
+            id=created.id, name='Cinema'))
+        self.assertFalse(output.is_active)
+        self.assertIsNone(output.description)
+
+        output = await use_case.execute(UpdateCategoryUseCase.Input(
+            id=created.id, name='Cinema', is_active=True))
+        self.assertTrue(output.is_active)
+
+    async def test_delete(self):
+        created = await self.create(name='Movie')
+        use_case = DeleteCategoryUseCase(self.category_repo)
+
+        await use_case.execute(DeleteCategoryUseCase.Input(created.id))
+        self.assertEqual(await self.category_repo.find_all(), [])
+        with self.assertRaises(NotFoundException):
+            await use_case.execute(DeleteCategoryUseCase.Input(created.id))
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 import unittest
 
 from category.domain.entities import Category
@@ -45,6 +46,26 @@ class TestCategoryIntegration(unittest.TestCase):
         self.assertEqual(
             assert_error.exception.args[0], 'The "is_active" must be a boolean.')
 
+    def test_create_with_invalid_cases_for_created_at_attribute(self):
+        message = 'The "created_at" must be a datetime without a time zone.'
+        for created_at in [datetime.now(timezone.utc),
+                           datetime(2022, 6, 1, tzinfo=timezone(
+                               timedelta(hours=-3))),
+                           '2022-06-01', 12345]:
+            with self.subTest(created_at=created_at):
+                with self.assertRaises(ValidationException) as assert_error:
+                    Category.create(name='Category', created_at=created_at)
+                self.assertEqual(assert_error.exception.args[0], message)
+
+        categories, errors = Category.create_many([
+            {'name': 'Movie', 'created_at': datetime.now(timezone.utc)},
+            {'name': 'Music', 'created_at': datetime(2022, 6, 1)},
+            {'name': 'Series', 'created_at': None},
+        ])
+        self.assertEqual([category.name for category in categories],
+                         ['Music', 'Series'])
+        self.assertEqual(errors, {0: {'created_at': [message]}})
+
     def test_create_with_valid_cases(self):
         try:
             Category(name='Category')
@@ -54,6 +75,8 @@ class TestCategoryIntegration(unittest.TestCase):
             Category(name='Category', is_active=False)
             Category(name='Category',
                      description='some description', is_active=False)
+            Category(name='Category', created_at=None)
+            Category(name='Category', created_at=datetime(2022, 6, 1))
         except ValidationException as exception:
             self.fail(
                 f'Some attribute is not valid. Error: {exception.args[0]}')
@@ -94,3 +117,45 @@ class TestCategoryIntegration(unittest.TestCase):
         except ValidationException as exception:
             self.fail(
                 f'Some attribute is not valid. Error: {exception.args[0]}')
+
+    def test_create_many_reports_every_invalid_row_and_field(self):
+        categories, errors = Category.create_many([
+            {'name': 'Movie'},
+            {'name': None, 'description': 5, 'is_active': 5},
+            {'name': 'Documentary', 'description': 'some description',
+             'is_active': False},
+            {'name': 'a'*256},
+        ])
+
+        self.assertEqual([category.name for category in categories],
+                         ['Movie', 'Documentary'])
+        self.assertEqual(categories[1].description, 'some description')
+        self.assertFalse(categories[1].is_active)
+        self.assertDictEqual(errors, {
+            1: {
+                'name': ['The "name" is required.'],
+                'description': ['The "description" must be a string.'],
+                'is_active': ['The "is_active" must be a boolean.']
+            },
+            3: {
+                'name': ['The "name" must be less than 255 characters.']
+            }
+        })
+
+    def test_create_many_rejects_unknown_keys(self):
+        for validate in (True, False):
+            with self.subTest(validate=validate):
+                categories, errors = Category.create_many([
+                    {'name': 'Movie', 'title': 'Movie', '_version': 3},
+                    {'name': 'Music'},
+                    {'name': None, 'color': 'red'},
+                ], validate=validate)
+
+                self.assertEqual(
+                    [category.name for category in categories], ['Music'])
+                self.assertEqual(errors[0], {
+                    'title': ['The "title" is not a known field.'],
+                    '_version': ['The "_version" is not a known field.']
+                })
+                self.assertEqual(errors[2]['color'],
+                                 ['The "color" is not a known field.'])
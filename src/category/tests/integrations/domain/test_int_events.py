@@ -0,0 +1,71 @@
+import unittest
+
+from __seedwork.domain.events import DomainEvent, DomainEvents
+from category.domain.entities import Category
+from category.domain.events import CategoryActivated, CategoryCreated, \
+    CategoryDeactivated, CategoryDeleted, CategoryUpdated
+
+
+class TestCategoryEventsIntegration(unittest.TestCase):
+
+    def setUp(self):
+        self.events = []
+        DomainEvents.subscribe(DomainEvent, self.on_event)
+        self.addCleanup(DomainEvents.unsubscribe, DomainEvent, self.on_event)
+
+    def on_event(self, event):
+        self.events.append(event)
+
+    def event_names(self):
+        return [event.event_name for event in self.events]
+
+    def test_create(self):
+        category = Category(name='Movie')
+        self.assertEqual(self.events, [])
+
+        category = Category.create(name='Movie', is_active=False)
+        self.assertEqual(self.events, [CategoryCreated(
+            aggregate_id=category.id,
+            occurred_on=self.events[0].occurred_on,
+            name='Movie',
+            description=None,
+            is_active=False,
+            created_at=category.created_at
+        )])
+
+        Category.create_many([{'name': 'Music'}, {'name': None}])
+        self.assertEqual(self.event_names(),
+                         ['CategoryCreated', 'CategoryCreated'])
+
+    def test_update_raises_only_on_change(self):
+        category = Category(name='Movie')
+        category.update('Movie', None)
+        category.update('Cinema', 'description')
+
+        self.assertEqual(len(self.events), 1)
+        self.assertIsInstance(self.events[0], CategoryUpdated)
+        self.assertEqual(
+            (self.events[0].aggregate_id, self.events[0].name,
+             self.events[0].description),
+            (category.id, 'Cinema', 'description'))
+
+    def test_activate_and_deactivate_raise_only_on_change(self):
+        category = Category(name='Movie')
+        category.activate()
+        category.deactivate()
+        category.deactivate()
+        category.activate()
+
+        self.assertEqual(
+            [type(event) for event in self.events],
+            [CategoryDeactivated, CategoryActivated])
+
+    def test_delete(self):
+        category = Category(name='Movie')
+        category.delete()
+
+        self.assertIsInstance(self.events[0], CategoryDeleted)
+        self.assertEqual(
+            (self.events[0].name, self.events[0].is_active,
+             self.events[0].created_at),
+            ('Movie', True, category.created_at))
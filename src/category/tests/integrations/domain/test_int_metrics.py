@@ -0,0 +1,60 @@
+import unittest
+
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.domain.metrics import Instrumentation
+from category.domain.entities import Category
+
+
+class TestCategoryMetricsIntegration(unittest.TestCase):
+
+    def setUp(self):
+        self.instrumentation = Instrumentation().enable(Category)
+        self.addCleanup(self.instrumentation.disable)
+
+    def test_constructions_and_validation_failures(self):
+        Category(name='Movie')
+        with self.assertRaises(ValidationException):
+            Category(name='a'*256)
+        _, rejected = Category.create_many(
+            [{'name': 'Music'}, {'name': None, 'is_active': 5}])
+        self.instrumentation.disable()
+        Category(name='Series')
+
+        instrumentation = self.instrumentation
+        self.assertEqual(instrumentation.constructions.values, {
+            ('Category', 'ok'): 1, ('Category', 'invalid'): 1})
+        self.assertEqual(instrumentation.construction_seconds.count(
+            ('Category', 'new')), 2)
+        self.assertEqual(instrumentation.validations.values, {
+            ('Category', 'raise'): 2, ('Category', 'collect'): 2})
+        self.assertEqual(instrumentation.validation_failures.values, {
+            ('name', 'max_length'): 1,
+            ('name', 'required'): 1,
+            ('is_active', 'boolean'): 1
+        })
+        self.assertEqual(len(rejected[1]), 2)
+
+    def test_prometheus_dump(self):
+        Category(name='Movie').to_dict()
+        dump = self.instrumentation.registry.to_prometheus()
+
+        self.assertIn('# TYPE entity_constructions_total counter', dump)
+        self.assertIn(
+            'entity_constructions_total{entity="Category",outcome="ok"} 1',
+            dump)
+        self.assertIn('entity_to_dict_total{entity="Category"} 1', dump)
+        self.assertIn('entity_construction_seconds_count'
+                      '{entity="Category",phase="new"} 1', dump)
+        self.assertIn('unique_entity_id_creations_total'
+                      '{source="generated"} 1', dump)
+
+    def test_disable_restores_validation(self):
+        schema = Category.validation_schema
+        validate, collect = schema.validate, schema.collect
+        self.instrumentation.disable()
+
+        self.assertIsNot(schema.validate, validate)
+        self.assertIsNot(schema.collect, collect)
+        self.assertEqual(schema.validate.__name__, 'validate')
+        with self.assertRaises(ValidationException):
+            Category(name=None)
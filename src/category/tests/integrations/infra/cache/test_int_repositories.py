@@ -0,0 +1,74 @@
+import unittest
+
+from __seedwork.domain.exceptions import NotFoundException
+from __seedwork.infra.caches import LRUCache
+from category.domain.entities import Category
+from category.domain.repositories import CategoryRepository
+from category.infra.cache.repositories import CategoryCachedRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class TestCategoryCachedRepositoryInt(unittest.TestCase):
+
+    def setUp(self):
+        self.movie = Category(name='Movie')
+        self.documentary = Category(name='Documentary')
+        self.inner_repo = CategoryInMemoryRepository(
+            [self.movie, self.documentary])
+        self.repo = CategoryCachedRepository(
+            self.inner_repo, LRUCache(max_entries=1))
+
+    def test_reads_through_and_hands_out_copies(self):
+        first = self.repo.find_by_id(self.movie.id)
+        second = self.repo.find_by_id(self.movie.unique_entity_id)
+
+        self.assertEqual(first, self.movie)
+        self.assertIsNot(first, self.movie)
+        self.assertIsNot(first, second)
+        self.assertEqual(self.repo.cache.stats().hits, 1)
+        self.assertEqual(self.repo.cache.stats().misses, 1)
+
+    def test_id_forms_share_an_entry(self):
+        self.repo.find_by_id(self.movie.unique_entity_id)
+        self.movie.update('Cinema', None)
+
+        self.assertEqual(self.repo.find_by_id(self.movie.id).name, 'Cinema')
+
+    def test_mutations_invalidate(self):
+        self.repo.find_by_id(self.movie.id).deactivate()
+        self.assertTrue(self.repo.find_by_id(self.movie.id).is_active)
+
+        self.movie.deactivate()
+        self.assertFalse(self.repo.find_by_id(self.movie.id).is_active)
+
+        self.movie.activate()
+        self.assertTrue(self.repo.find_by_id(self.movie.id).is_active)
+        self.assertEqual(self.repo.cache.stats().invalidations, 3)
+
+    def test_writes_invalidate(self):
+        category = self.repo.find_by_id(self.movie.id)
+        category.update('Cinema', None)
+        self.repo.update(category)
+        self.assertEqual(self.repo.find_by_id(self.movie.id).name, 'Cinema')
+
+        self.repo.insert(Category(
+            unique_entity_id=self.movie.unique_entity_id, name='Film'))
+        self.assertEqual(self.repo.find_by_id(self.movie.id).name, 'Film')
+
+        self.repo.delete(self.movie.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(self.movie.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id('fake id')
+
+    def test_evicts(self):
+        self.repo.find_by_id(self.movie.id)
+        self.repo.find_by_id(self.documentary.id)
+
+        self.assertEqual(self.repo.cache.stats().evictions, 1)
+        self.assertEqual(len(self.repo.cache), 1)
+
+    def test_delegates_listing(self):
+        self.assertEqual(len(self.repo.find_all()), 2)
+        result = self.repo.search(CategoryRepository.SearchParams())
+        self.assertEqual(result.total, 2)
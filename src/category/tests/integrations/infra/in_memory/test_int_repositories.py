@@ -0,0 +1,152 @@
+from datetime import datetime, timedelta
+import unittest
+
+from __seedwork.domain.exceptions import NotFoundException
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+
+
+class TestCategoryInMemoryRepositoryInt(unittest.TestCase):
+
+    def setUp(self):
+        self.created_at = datetime(2022, 6, 1, 12, 0, 0)
+        self.categories = [
+            Category(name=name, is_active=is_active,
+                     created_at=self.created_at + timedelta(minutes=minute))
+            for minute, (name, is_active) in enumerate([
+                ('Movie', True),
+                ('Documentary', False),
+                ('Music', True),
+                ('Animation', True),
+                ('Musical', False),
+            ])
+        ]
+        self.repo = CategoryInMemoryRepository(self.categories)
+
+    def search(self, **kwargs) -> CategoryRepository.SearchResult:
+        return self.repo.search(CategoryRepository.SearchParams(**kwargs))
+
+    def names(self, result: CategoryRepository.SearchResult):
+        return [item.name for item in result.items]
+
+    def test_insert_and_find_by_id(self):
+        category = Category(name='Series')
+        self.repo.insert(category)
+
+        self.assertIs(self.repo.find_by_id(category.id), category)
+        self.assertIs(
+            self.repo.find_by_id(category.unique_entity_id), category)
+        self.assertEqual(len(self.repo.find_all()), 6)
+
+    def test_throw_not_found_exception(self):
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake id')
+        self.assertEqual(assert_error.exception.args[0],
+                         "Entity not found using ID 'fake id'")
+
+        with self.assertRaises(NotFoundException):
+            self.repo.update(Category(name='Series'))
+
+        with self.assertRaises(NotFoundException):
+            self.repo.delete('fake id')
+
+    def test_delete(self):
+        self.repo.delete(self.categories[0].id)
+
+        self.assertEqual(len(self.repo.find_all()), 4)
+        self.assertNotIn('Movie', self.names(self.search(sort='name')))
+        self.assertEqual(self.search(
+            filter=CategoryFilter(is_active=True)).total, 2)
+
+        self.repo.insert(Category(name='Series', is_active=False))
+        self.assertEqual(self.search(
+            filter=CategoryFilter(is_active=False)).total, 3)
+
+    def test_default_search_sorts_by_created_at_desc(self):
+        result = self.search(per_page=2)
+
+        self.assertEqual(self.names(result), ['Musical', 'Animation'])
+        self.assertEqual(result.total, 5)
+        self.assertEqual(result.last_page, 3)
+        self.assertIsNone(result.sort)
+
+    def test_sort_by_name(self):
+        self.assertEqual(
+            self.names(self.search(sort='name')),
+            ['Animation', 'Documentary', 'Movie', 'Music', 'Musical'])
+        self.assertEqual(
+            self.names(self.search(sort='name', sort_dir='desc', page=2,
+                                   per_page=2)),
+            ['Movie', 'Documentary'])
+
+    def test_filter_by_is_active(self):
+        result = self.search(
+            sort='name', filter=CategoryFilter(is_active=True), per_page=2)
+
+        self.assertEqual(result.total, 3)
+        self.assertEqual(self.names(result), ['Animation', 'Movie'])
+
+    def test_filter_by_name_prefix(self):
+        result = self.search(
+            sort='name', filter=CategoryFilter(name_prefix='Mu'))
+        self.assertEqual(result.total, 2)
+        self.assertEqual(self.names(result), ['Music', 'Musical'])
+
+        result = self.search(
+            filter=CategoryFilter(name_prefix='Mu', is_active=True))
+        self.assertEqual(result.total, 1)
+        self.assertEqual(self.names(result), ['Music'])
+
+    def test_filter_by_created_at_range(self):
+        category_filter = CategoryFilter(
+            created_from=self.created_at + timedelta(minutes=1),
+            created_to=self.created_at + timedelta(minutes=3)
+        )
+
+        result = self.search(filter=category_filter)
+        self.assertEqual(self.names(result),
+                         ['Animation', 'Music', 'Documentary'])
+
+        result = self.search(sort='name', filter=category_filter,
+                             per_page=2, page=2)
+        self.assertEqual(result.total, 3)
+        self.assertEqual(self.names(result), ['Music'])
+
+        result = self.search(
+            sort='name',
+            filter=CategoryFilter(
+                created_from=self.created_at, name_prefix='M',
+                is_active=True))
+        self.assertEqual(self.names(result), ['Movie', 'Music'])
+
+    def test_indexes_follow_entity_mutations(self):
+        movie, documentary = self.categories[:2]
+
+        movie.update('Zombie', None)
+        movie.deactivate()
+        documentary.activate()
+
+        self.assertEqual(self.names(self.search(sort='name'))[-1], 'Zombie')
+        self.assertEqual(
+            self.names(self.search(
+                sort='name', filter=CategoryFilter(is_active=True))),
+            ['Animation', 'Documentary', 'Music'])
+        self.assertEqual(
+            self.search(filter=CategoryFilter(name_prefix='Mo')).total, 0)
+
+    def test_update_replaces_a_different_instance(self):
+        movie = self.categories[0]
+        replacement = Category(
+            unique_entity_id=movie.unique_entity_id, name='Cinema',
+            created_at=movie.created_at)
+        self.repo.update(replacement)
+
+        self.assertIs(self.repo.find_by_id(movie.id), replacement)
+        self.assertEqual(
+            self.names(self.search(filter=CategoryFilter(name_prefix='C'))),
+            ['Cinema'])
+
+        movie.update('Ignored', None)
+        self.assertEqual(
+            self.search(filter=CategoryFilter(name_prefix='I')).total, 0)
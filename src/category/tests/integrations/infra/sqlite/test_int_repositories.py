@@ -0,0 +1,221 @@
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+from __seedwork.domain.exceptions import NotFoundException, \
+    ValidationException
+from __seedwork.domain.value_objects import UniqueEntityId
+from __seedwork.infra.sqlite import ConnectionPool
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+class TestCategorySqliteRepositoryInt(unittest.TestCase):
+
+    def setUp(self):
+        self.created_at = datetime(2022, 6, 1, 12, 0, 0)
+        self.categories = [
+            Category(name=name, is_active=is_active,
+                     created_at=self.created_at + timedelta(minutes=minute))
+            for minute, (name, is_active) in enumerate([
+                ('Movie', True),
+                ('Documentary', False),
+                ('Music', True),
+                ('Animation', True),
+                ('Musical', False),
+            ])
+        ]
+        self.pool = ConnectionPool(':memory:')
+        self.addCleanup(self.pool.close)
+        self.repo = CategorySqliteRepository(self.pool)
+        self.repo.insert_many(self.categories)
+
+    def search(self, **kwargs) -> CategoryRepository.SearchResult:
+        return self.repo.search(CategoryRepository.SearchParams(**kwargs))
+
+    def names(self, result: CategoryRepository.SearchResult):
+        return [item.name for item in result.items]
+
+    def test_round_trip(self):
+        category = Category(name='Series', description='some description',
+                            is_active=None, created_at=None)
+        self.repo.insert(category)
+
+        found = self.repo.find_by_id(category.id)
+        self.assertEqual(found, category)
+        self.assertIsNot(found, category)
+        self.assertEqual(self.repo.find_by_id(category.unique_entity_id),
+                         category)
+        self.assertCountEqual(self.repo.find_all(),
+                              self.categories + [category])
+
+    def test_store_every_created_at_the_domain_accepts(self):
+        for created_at in [None, datetime(2022, 6, 1, 12, 0, 0, 123456),
+                           datetime(1969, 12, 31, 23, 59, 59, 999999),
+                           datetime(9999, 12, 31, 23, 59, 59, 999999)]:
+            categories = [Category(name=write, created_at=created_at)
+                          for write in ('insert', 'insert_many', 'save')]
+            self.repo.insert(categories[0])
+            self.repo.insert_many(categories[1:2])
+            self.repo.save(categories[2])
+            for category in categories:
+                with self.subTest(write=category.name,
+                                  created_at=created_at):
+                    self.assertEqual(
+                        self.repo.find_by_id(category.id).created_at,
+                        created_at)
+
+        # aware datetimes are rejected by the domain before any store
+        with self.assertRaises(ValidationException):
+            Category(name='Series', created_at=datetime.now(timezone.utc))
+
+    def test_insert_many_of_a_rehydrated_aware_created_at(self):
+        # rehydrating skips validation; the batch fails as a whole
+        aware, = Category.rehydrate_many([(
+            UniqueEntityId(), 'Series', None, True,
+            datetime.now(timezone.utc))])
+        with self.assertRaises(ValueError):
+            self.repo.insert_many([Category(name='Short'), aware])
+        self.assertEqual(len(self.repo.find_all()), 5)
+
+    def test_insert_many_upserts(self):
+        movie = self.categories[0]
+        movie.update('Cinema', 'renamed')
+
+        self.assertEqual(
+            self.repo.insert_many([movie, Category(name='Series')]), 2)
+        self.assertEqual(len(self.repo.find_all()), 6)
+        self.assertEqual(self.repo.find_by_id(movie.id), movie)
+        self.assertFalse(movie.is_dirty)
+
+    def test_insert_many_is_atomic(self):
+        series = Category(name='Series')
+
+        def categories():
+            yield series
+            raise RuntimeError()
+
+        with self.assertRaises(RuntimeError):
+            self.repo.insert_many(categories())
+        self.assertEqual(len(self.repo.find_all()), 5)
+        self.assertTrue(series.is_dirty)
+
+    def test_insert_many_clears_changes(self):
+        categories = [Category(name=f'Category {index}') for index in range(5)]
+        self.repo.chunk_size = 2
+        self.repo.insert_many(iter(categories))
+        self.assertFalse(any(category.is_dirty for category in categories))
+
+        statements = self.trace_statements()
+        for category in categories:
+            self.repo.update(category)
+        self.assertTrue(all(
+            statement.startswith('SELECT 1') for statement in statements))
+
+    def test_throw_not_found_exception(self):
+        with self.assertRaises(NotFoundException) as assert_error:
+            self.repo.find_by_id('fake id')
+        self.assertEqual(assert_error.exception.args[0],
+                         "Entity not found using ID 'fake id'")
+
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(Category(name='Series').id)
+
+        with self.assertRaises(NotFoundException):
+            self.repo.update(Category(name='Series'))
+
+        with self.assertRaises(NotFoundException):
+            self.repo.delete('fake id')
+
+    def test_update_and_delete(self):
+        movie, documentary = self.categories[:2]
+        movie.deactivate()
+        self.repo.update(movie)
+        self.repo.delete(documentary.id)
+
+        self.assertFalse(self.repo.find_by_id(movie.id).is_active)
+        self.assertEqual(
+            self.names(self.search(filter=CategoryFilter(is_active=False))),
+            ['Musical', 'Movie'])
+
+    def test_default_search_sorts_by_created_at_desc(self):
+        result = self.search(per_page=2)
+
+        self.assertEqual(self.names(result), ['Musical', 'Animation'])
+        self.assertEqual(result.total, 5)
+        self.assertEqual(result.last_page, 3)
+        self.assertIsNone(result.sort)
+
+    def test_sort_by_name(self):
+        self.assertEqual(
+            self.names(self.search(sort='name')),
+            ['Animation', 'Documentary', 'Movie', 'Music', 'Musical'])
+        self.assertEqual(
+            self.names(self.search(sort='name', sort_dir='desc', page=2,
+                                   per_page=2)),
+            ['Movie', 'Documentary'])
+
+    def test_filters(self):
+        result = self.search(
+            sort='name', filter=CategoryFilter(is_active=True), per_page=2)
+        self.assertEqual(result.total, 3)
+        self.assertEqual(self.names(result), ['Animation', 'Movie'])
+
+        result = self.search(
+            filter=CategoryFilter(name_prefix='Mu', is_active=True))
+        self.assertEqual(self.names(result), ['Music'])
+
+        result = self.search(filter=CategoryFilter(
+            created_from=self.created_at + timedelta(minutes=1),
+            created_to=self.created_at + timedelta(minutes=3)
+        ))
+        self.assertEqual(self.names(result),
+                         ['Animation', 'Music', 'Documentary'])
+
+    def test_shared_across_threads(self):
+        categories = [Category(name=f'Category {i}') for i in range(40)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(self.repo.insert, categories))
+            found = list(executor.map(
+                self.repo.find_by_id, [c.id for c in categories]))
+
+        self.assertEqual(found, categories)
+        self.assertEqual(len(self.repo.find_all()), 45)
+
+    def trace_statements(self):
+        statements = []
+        with self.pool.connection() as connection:
+            connection.set_trace_callback(statements.append)
+        return statements
+
+    def test_update_writes_changed_columns_only(self):
+        movie = self.repo.find_by_id(self.categories[0].id)
+        statements = self.trace_statements()
+
+        self.repo.update(movie)
+        movie.deactivate()
+        self.repo.update(movie)
+        self.repo.update(movie)
+
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[0].startswith('SELECT 1'))
+        self.assertTrue(statements[1].startswith(
+            'UPDATE categories SET is_active = 0 WHERE id ='))
+        self.assertTrue(statements[2].startswith('SELECT 1'))
+        self.assertFalse(self.repo.find_by_id(movie.id).is_active)
+
+    def test_update_writes_every_column_of_new_entities(self):
+        movie = self.categories[0]
+        replacement = Category(
+            unique_entity_id=movie.unique_entity_id, name='Cinema',
+            created_at=movie.created_at)
+        statements = self.trace_statements()
+
+        self.repo.update(replacement)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith(
+            "UPDATE categories SET name = 'Cinema', description = NULL, "
+            "is_active = 1, created_at = "))
+        self.assertFalse(replacement.is_dirty)
+        self.assertEqual(self.repo.find_by_id(movie.id), replacement)
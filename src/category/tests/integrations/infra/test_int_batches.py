@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+import unittest
+
+from __seedwork.domain.value_objects import UniqueEntityId
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter
+from category.infra.batches import CategoryBatch
+
+
+class TestCategoryBatchInt(unittest.TestCase):
+
+    def setUp(self):
+        self.created_at = datetime(2022, 6, 1, 12, 0, 0, 123456)
+        self.categories = [
+            Category(name=name, description=description, is_active=is_active,
+                     created_at=self.created_at + timedelta(minutes=minute))
+            for minute, (name, description, is_active) in enumerate([
+                ('Movie', 'some description', True),
+                ('Documentary', None, False),
+                ('Música', '', True),
+                ('Animation', None, None),
+                ('Musical', 'ação', False),
+            ])
+        ]
+        self.batch = CategoryBatch.from_categories(self.categories)
+
+    def names(self, batch: CategoryBatch):
+        return [category.name for category in batch]
+
+    def test_round_trip_without_loss(self):
+        self.assertEqual(len(self.batch), 5)
+        self.assertEqual(self.batch.to_categories(), self.categories)
+        self.assertEqual(self.batch[-1], self.categories[-1])
+        self.assertEqual(self.batch[0].to_dict(),
+                         self.categories[0].to_dict())
+
+        with self.assertRaises(IndexError):
+            self.batch[5]
+
+    def test_null_created_at(self):
+        category = Category(name='Series', created_at=None)
+        batch = CategoryBatch.from_categories([category])
+        self.assertIsNone(batch[0].created_at)
+
+    def test_rejects_aware_datetimes(self):
+        # the domain rejects them, but rehydrating skips validation
+        category, = Category.rehydrate_many([(
+            UniqueEntityId(), 'Series', None, True,
+            datetime.now(timezone.utc))])
+        with self.assertRaises(ValueError):
+            CategoryBatch.from_categories([category])
+
+    def test_count_and_filter(self):
+        self.assertEqual(self.batch.count(), 5)
+        self.assertEqual(self.batch.count(CategoryFilter(is_active=False)), 2)
+        self.assertEqual(
+            self.names(self.batch.filter(CategoryFilter(name_prefix='Mú'))),
+            ['Música'])
+
+        category_filter = CategoryFilter(
+            created_from=self.created_at + timedelta(minutes=1),
+            created_to=self.created_at + timedelta(minutes=3)
+        )
+        self.assertEqual(
+            self.names(self.batch.filter(category_filter)),
+            ['Documentary', 'Música', 'Animation'])
+
+        category_filter = CategoryFilter(
+            name_prefix='M', is_active=False,
+            created_to=self.created_at + timedelta(minutes=4))
+        filtered = self.batch.filter(category_filter)
+        self.assertEqual(filtered.to_categories(), [self.categories[4]])
+
+    def test_combine_masks(self):
+        mask = self.batch.mask(CategoryFilter(is_active=True)) \
+            | self.batch.mask(CategoryFilter(name_prefix='D'))
+        self.assertEqual(self.names(self.batch.take(mask)),
+                         ['Movie', 'Documentary', 'Música'])
+
+    def test_slice(self):
+        self.assertEqual(self.batch.slice(1, 3).to_categories(),
+                         self.categories[1:3])
+        self.assertEqual(self.batch.slice(-2).to_categories(),
+                         self.categories[-2:])
+        self.assertEqual(len(self.batch.slice(4, 2)), 0)
@@ -0,0 +1,189 @@
+import asyncio
+from copy import copy
+from datetime import datetime, timedelta
+import unittest
+
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.infra.sqlite import ConnectionPool
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.cache.repositories import CategoryCachedRepository
+from category.infra.in_memory.repositories import \
+    CategoryAsyncInMemoryRepository, CategoryInMemoryRepository
+from category.infra.projections import CategoryStatsProjection
+from category.infra.sqlite.repositories import CategoryAsyncSqliteRepository, \
+    CategorySqliteRepository
+
+
+# the in-memory repository changes the entities it was given
+def in_memory(categories):
+    return CategoryInMemoryRepository(map(copy, categories))
+
+
+def sqlite(categories):
+    repo = CategorySqliteRepository(ConnectionPool(':memory:'))
+    repo.insert_many(categories)
+    return repo
+
+
+def cached(categories):
+    return CategoryCachedRepository(sqlite(categories))
+
+
+class TestCategoryBulkOperationsInt(unittest.TestCase):
+
+    factories = (in_memory, sqlite, cached)
+
+    def setUp(self):
+        self.start = datetime(2022, 6, 1, 12, 0, 0)
+        self.categories = [
+            Category(name=name, is_active=is_active,
+                     created_at=None if index == 6
+                     else self.start + timedelta(minutes=index // 2))
+            for index, (name, is_active) in enumerate([
+                ('Movie', True), ('Documentary', False), ('Music', True),
+                ('Animation', False), ('Musical', True), ('Series', None),
+                ('Short', True)
+            ])
+        ]
+        self.ids = {category.name: category.id for category in self.categories}
+
+    def names(self, ids):
+        names = {entity_id: name for name, entity_id in self.ids.items()}
+        return sorted(names[entity_id] for entity_id in ids)
+
+    def search(self, repo, **kwargs):
+        return self.names(category.id for category in repo.search(
+            CategoryRepository.SearchParams(
+                per_page=50, filter=CategoryFilter(**kwargs))).items)
+
+    def test_activate_and_deactivate(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+
+                self.assertEqual(self.names(repo.deactivate_where(
+                    CategoryFilter(name_prefix='Mus'))), ['Music', 'Musical'])
+                self.assertEqual(repo.deactivate_where(
+                    CategoryFilter(name_prefix='Mus')), [])
+                self.assertEqual(self.names(repo.activate_where(
+                    CategoryFilter(created_from=self.start + timedelta(
+                        minutes=1)))),
+                    ['Animation', 'Music', 'Musical', 'Series'])
+                self.assertEqual(
+                    repo.activate_where(CategoryFilter(is_active=True)), [])
+                self.assertEqual(self.names(repo.deactivate_where(
+                    CategoryFilter(is_active=True, name_prefix='M',
+                                   created_to=self.start))), ['Movie'])
+
+                self.assertEqual(self.search(repo, is_active=False),
+                                 ['Documentary', 'Movie'])
+                self.assertEqual(self.search(repo, is_active=True), [
+                    'Animation', 'Music', 'Musical', 'Series', 'Short'])
+                self.assertIs(
+                    repo.find_by_id(self.ids['Series']).is_active, True)
+
+    def test_created_range_leaves_out_null_created_at(self):
+        created_to = self.start + timedelta(minutes=1)
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+
+                for sort in ('created_at', 'name'):
+                    self.assertEqual(
+                        repo.search(CategoryRepository.SearchParams(
+                            sort=sort, filter=CategoryFilter(
+                                created_to=created_to))).total, 4)
+                self.assertEqual(self.search(repo, created_to=created_to,
+                                             name_prefix='S'), [])
+                self.assertEqual(self.search(repo, is_active=True,
+                                             created_to=created_to),
+                                 ['Movie', 'Music'])
+                self.assertEqual(self.names(repo.deactivate_where(
+                    CategoryFilter(created_to=created_to))),
+                    ['Movie', 'Music'])
+                self.assertIs(
+                    repo.find_by_id(self.ids['Short']).is_active, True)
+
+    def test_toggle_every_category(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+
+                self.assertEqual(
+                    self.names(repo.deactivate_where(CategoryFilter())),
+                    ['Movie', 'Music', 'Musical', 'Series', 'Short'])
+                self.assertEqual(
+                    len(repo.activate_where(CategoryFilter())), 7)
+                self.assertTrue(all(
+                    category.is_active for category in repo.find_all()))
+
+    def test_update_description(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+
+                self.assertEqual(self.names(repo.update_description_where(
+                    CategoryFilter(name_prefix='M'), 'sound')),
+                    ['Movie', 'Music', 'Musical'])
+                self.assertEqual(self.names(repo.update_description_where(
+                    CategoryFilter(is_active=True), 'sound')), ['Short'])
+                self.assertEqual(self.names(repo.update_description_where(
+                    CategoryFilter(name_prefix='Movie'), None)), ['Movie'])
+                self.assertEqual(
+                    {category.name: category.description
+                     for category in repo.find_all()
+                     if category.description is not None},
+                    {'Music': 'sound', 'Musical': 'sound', 'Short': 'sound'})
+
+    def test_invalid_description(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+
+                with self.assertRaises(ValidationException) as assert_error:
+                    repo.update_description_where(CategoryFilter(), 5)
+                self.assertEqual(assert_error.exception.args[0],
+                                 'The "description" must be a string.')
+                self.assertTrue(all(
+                    category.description is None
+                    for category in repo.find_all()))
+
+    def test_publish_the_events_of_each_change(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+                projection = CategoryStatsProjection()
+                projection.rebuild(repo.find_all())
+                with projection:
+                    repo.deactivate_where(CategoryFilter(name_prefix='M'))
+                    repo.activate_where(CategoryFilter(name_prefix='Series'))
+                self.assertEqual(
+                    (projection.total, projection.active,
+                     projection.inactive), (7, 2, 5))
+
+    def test_cached_reads_see_the_change(self):
+        repo = cached(self.categories)
+        self.assertIs(repo.find_by_id(self.ids['Music']).is_active, True)
+        repo.deactivate_where(CategoryFilter(name_prefix='Music'))
+        self.assertIs(repo.find_by_id(self.ids['Music']).is_active, False)
+        repo.update_description_where(CategoryFilter(), 'all')
+        self.assertEqual(repo.find_by_id(self.ids['Music']).description,
+                         'all')
+
+    def test_async_repositories(self):
+        repos = [
+            CategoryAsyncInMemoryRepository(map(copy, self.categories)),
+            CategoryAsyncSqliteRepository(ConnectionPool(':memory:'))
+        ]
+        asyncio.run(repos[1].insert_many(self.categories))
+        for repo in repos:
+            with self.subTest(repository=type(repo).__name__):
+                ids = asyncio.run(repo.deactivate_where(
+                    CategoryFilter(name_prefix='Mus')))
+                self.assertEqual(self.names(ids), ['Music', 'Musical'])
+                ids = asyncio.run(repo.update_description_where(
+                    CategoryFilter(is_active=False), 'off'))
+                self.assertEqual(len(ids), 4)
+                self.assertEqual(len(asyncio.run(
+                    repo.activate_where(CategoryFilter()))), 5)
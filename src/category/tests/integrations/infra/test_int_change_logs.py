@@ -0,0 +1,182 @@
+from datetime import datetime, timezone
+import tempfile
+import time
+import unittest
+
+from __seedwork.domain.exceptions import ValidationException
+from __seedwork.infra.concurrent_repositories import ConcurrentRepository
+from __seedwork.infra.sqlite import ConnectionPool
+from category.domain.entities import Category
+from category.infra.cache.repositories import CategoryCachedRepository
+from category.infra.change_logs import CategoryChangeLog
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+class TestCategoryChangeLogInt(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.change_log = self.open()
+
+    def open(self, **kwargs) -> CategoryChangeLog:
+        change_log = CategoryChangeLog(self.directory.name, **kwargs)
+        change_log.subscribe()
+        self.addCleanup(change_log.close)
+        self.addCleanup(change_log.unsubscribe)
+        return change_log
+
+    def state(self, repository: CategoryInMemoryRepository) -> dict:
+        return {
+            category.id: (category.name, category.description,
+                          category.is_active, category.created_at)
+            for category in repository.find_all()
+        }
+
+    def make_changes(self) -> dict:
+        movie = Category.create(
+            name='Movie', description='films', is_active=None,
+            created_at=datetime(2022, 6, 1, 10, 30, 0, 123456))
+        documentary = Category.create(name='Documentary', created_at=None)
+        short = Category.create(name='Short', is_active=False)
+        movie.update('Movies', None)
+        movie.activate()
+        documentary.deactivate()
+        short.delete()
+        return {category.id: category for category in [movie, documentary]}
+
+    def test_replay_into_a_repository(self):
+        categories = self.make_changes()
+        repository = CategoryInMemoryRepository()
+
+        self.assertEqual(self.change_log.replay(repository), 7)
+        self.assertEqual(self.state(repository), {
+            category.id: (category.name, category.description,
+                          category.is_active, category.created_at)
+            for category in categories.values()
+        })
+
+    def test_replay_into_every_repository(self):
+        factories = {
+            'in_memory': CategoryInMemoryRepository,
+            'sqlite': lambda: CategorySqliteRepository(
+                ConnectionPool(':memory:')),
+            'cached': lambda: CategoryCachedRepository(
+                CategorySqliteRepository(ConnectionPool(':memory:'))),
+            'concurrent': ConcurrentRepository
+        }
+        movie = Category.create(name='Movie')
+        replicas = {name: factory() for name, factory in factories.items()}
+        for replica in replicas.values():
+            self.assertEqual(self.change_log.replay(replica), 1)
+
+        # the replicas already store the category the next records change
+        movie.update('Renamed', 'd')
+        movie.deactivate()
+        for name, replica in replicas.items():
+            with self.subTest(repository=name):
+                self.assertEqual(self.change_log.replay(replica, 1), 3)
+                self.assertEqual(self.state(replica), {
+                    movie.id: ('Renamed', 'd', False, movie.created_at)})
+                self.assertEqual(self.change_log.replay(replica, 0), 3)
+
+    def test_aware_created_at_fails_validation_before_the_log(self):
+        with self.assertRaises(ValidationException):
+            Category.create(
+                name='Movie', created_at=datetime.now(timezone.utc))
+        self.assertEqual(self.change_log.next_offset, 0)
+
+        Category.create(name='Movie', created_at=datetime(2022, 6, 1))
+        self.assertEqual(self.change_log.next_offset, 1)
+
+    def test_replay_incrementally(self):
+        categories = self.make_changes()
+        replica = CategoryInMemoryRepository()
+        offset = self.change_log.replay(replica)
+
+        movie = categories[next(iter(categories))]
+        movie.deactivate()
+        music = Category.create(name='Music')
+        movie.update('Films', 'all of them')
+        self.assertEqual(self.change_log.replay(replica, offset), 10)
+        self.assertEqual(self.change_log.replay(replica, 10), 10)
+
+        state = self.state(replica)
+        self.assertEqual(state[movie.id], (
+            'Films', 'all of them', False, movie.created_at))
+        self.assertEqual(state[music.id][0], 'Music')
+        self.assertEqual(len(state), 3)
+
+    def test_replay_changes_to_categories_created_before_the_log(self):
+        self.change_log.unsubscribe()
+        movie = Category.create(name='Movie', is_active=False)
+        self.change_log.subscribe()
+        replica = CategoryInMemoryRepository([
+            Category.from_persistence(
+                unique_entity_id=movie.unique_entity_id, name='Movie',
+                description=None, is_active=False,
+                created_at=movie.created_at)
+        ])
+        movie.activate()
+        movie.update('Movies', 'films')
+        unknown = Category.create(name='Unknown')
+
+        self.assertEqual(self.change_log.compact(), 3)
+        self.assertEqual(self.change_log.replay(replica), 3)
+        self.assertEqual(self.change_log.replay(
+            CategoryInMemoryRepository()), 3)
+        state = self.state(replica)
+        self.assertEqual(state[movie.id], (
+            'Movies', 'films', True, movie.created_at))
+        self.assertIn(unknown.id, state)
+
+    def test_compaction_keeps_the_replayed_state(self):
+        movie = Category.create(name='Movie', is_active=None)
+        short = Category.create(name='Short')
+        # a replica that caught up halfway through the compacted history
+        halfway = CategoryInMemoryRepository()
+        self.assertEqual(self.change_log.replay(halfway), 2)
+        movie.update('Movies', 'films')
+        movie.activate()
+        short.delete()
+        Category.create(name='Music').deactivate()
+        before = CategoryInMemoryRepository()
+        self.change_log.replay(before)
+
+        self.assertEqual(self.change_log.compact(), 3)
+        records = list(self.change_log.records())
+        self.assertEqual([offset for offset, _ in records], [3, 4, 6])
+
+        after = CategoryInMemoryRepository()
+        self.assertEqual(self.change_log.replay(after), 7)
+        self.assertEqual(self.state(after), self.state(before))
+        self.assertEqual(self.change_log.replay(halfway, 2), 7)
+        self.assertEqual(self.state(halfway), self.state(before))
+
+    def test_reopen_after_compaction(self):
+        self.make_changes()
+        self.change_log.compact()
+        before = CategoryInMemoryRepository()
+        self.change_log.replay(before)
+        self.change_log.unsubscribe()
+        self.change_log.close()
+
+        change_log = self.open()
+        self.assertEqual(change_log.next_offset, 7)
+        after = CategoryInMemoryRepository()
+        self.assertEqual(change_log.replay(after), 7)
+        self.assertEqual(self.state(after), self.state(before))
+
+    def test_commit_in_the_background(self):
+        self.change_log.unsubscribe()
+        self.change_log.close()
+        with CategoryChangeLog(self.directory.name,
+                               commit_interval=0.001) as change_log:
+            Category.create(name='Movie')
+            deadline = time.monotonic() + 5
+            while change_log.log.durable_offset < 1 \
+                    and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.assertEqual(change_log.log.durable_offset, 1)
+        self.assertEqual(change_log.next_offset, 1)
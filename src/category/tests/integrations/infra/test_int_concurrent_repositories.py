@@ -0,0 +1,119 @@
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import unittest
+
+from __seedwork.domain.exceptions import NotFoundException, \
+    StaleEntityException
+from __seedwork.infra.concurrent_repositories import ConcurrentRepository
+from category.domain.entities import Category
+
+
+class TestConcurrentRepositoryInt(unittest.TestCase):
+
+    def setUp(self):
+        self.category = Category(name='Movie', description='0')
+        self.repo = ConcurrentRepository([self.category])
+
+    def test_insert_stores_version_one(self):
+        self.assertEqual(self.category.version, 1)
+        self.assertFalse(self.category.is_dirty)
+        self.assertEqual(self.repo.find_by_id(self.category.id).version, 1)
+        self.assertEqual(Category(name='Movie').version, 0)
+
+        with self.assertRaises(StaleEntityException):
+            self.repo.insert(self.category)
+
+    def test_save_overwrites_any_version(self):
+        self.repo.modify(self.category.id, lambda found: found.deactivate())
+        copy = Category.from_persistence(
+            unique_entity_id=self.category.unique_entity_id, name='Saved',
+            description=None, is_active=True,
+            created_at=self.category.created_at)
+        self.repo.save(copy)
+        stored = self.repo.find_by_id(self.category.id)
+        self.assertEqual((stored.name, stored.is_active, stored.version),
+                         ('Saved', True, 3))
+
+        other = Category(name='Other')
+        self.repo.save(other)
+        self.assertEqual(self.repo.find_by_id(other.id).version, 1)
+
+    def test_hands_out_copies(self):
+        found = self.repo.find_by_id(self.category.unique_entity_id)
+        self.assertEqual(found, self.category)
+        self.assertIsNot(found, self.category)
+
+        found.update('Changed', None)
+        self.category.deactivate()
+        stored = self.repo.find_by_id(self.category.id)
+        self.assertEqual(stored.name, 'Movie')
+        self.assertTrue(stored.is_active)
+        self.assertEqual(self.repo.find_all(), [stored])
+
+    def test_update_bumps_the_version(self):
+        found = self.repo.find_by_id(self.category.id)
+        found.update('Changed', None)
+        self.repo.update(found)
+
+        self.assertEqual(found.version, 2)
+        self.assertFalse(found.is_dirty)
+        stored = self.repo.find_by_id(self.category.id)
+        self.assertEqual(stored.name, 'Changed')
+        self.assertEqual(stored.version, 2)
+
+    def test_reject_stale_writes(self):
+        first = self.repo.find_by_id(self.category.id)
+        second = self.repo.find_by_id(self.category.id)
+        first.update('First', None)
+        self.repo.update(first)
+
+        second.update('Second', None)
+        with self.assertRaisesRegex(StaleEntityException,
+                                    'is at version 2, not 1'):
+            self.repo.update(second)
+        self.assertEqual(self.repo.find_by_id(self.category.id).name,
+                         'First')
+
+    def test_not_found(self):
+        self.repo.delete(self.category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id(self.category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.update(self.category)
+        with self.assertRaises(NotFoundException):
+            self.repo.delete(self.category.id)
+        with self.assertRaises(NotFoundException):
+            self.repo.find_by_id('fake id')
+
+    def test_invalid_stripes(self):
+        with self.assertRaises(ValueError):
+            ConcurrentRepository(stripes=0)
+
+    def test_no_update_is_lost_across_threads(self):
+        def increment(category: Category):
+            category.update(
+                category.name, str(int(category.description) + 1))
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(
+                    lambda _: self.repo.modify(self.category.id, increment),
+                    range(400)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        stored = self.repo.find_by_id(self.category.id)
+        self.assertEqual(stored.description, '400')
+        self.assertEqual(stored.version, 401)
+
+    def test_modify_gives_up_after_the_last_attempt(self):
+        def conflicting(category: Category):
+            other = self.repo.find_by_id(category.id)
+            other.deactivate() if other.is_active else other.activate()
+            self.repo.update(other)
+
+        with self.assertRaises(StaleEntityException):
+            self.repo.modify(self.category.id, conflicting, attempts=3)
+        self.assertEqual(self.repo.find_by_id(self.category.id).version, 4)
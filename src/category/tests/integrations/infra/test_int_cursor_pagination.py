@@ -0,0 +1,169 @@
+import asyncio
+from datetime import datetime, timedelta
+import unittest
+
+from __seedwork.domain.exceptions import InvalidCursorException
+from __seedwork.domain.repositories import Cursor
+from __seedwork.infra.sqlite import ConnectionPool
+from category.domain.entities import Category
+from category.domain.repositories import CategoryFilter, CategoryRepository
+from category.infra.cache.repositories import CategoryCachedRepository
+from category.infra.in_memory.repositories import \
+    CategoryAsyncInMemoryRepository, CategoryInMemoryRepository
+from category.infra.sqlite.repositories import CategorySqliteRepository
+
+
+def in_memory(categories):
+    return CategoryInMemoryRepository(categories)
+
+
+def sqlite(categories):
+    pool = ConnectionPool(':memory:')
+    repo = CategorySqliteRepository(pool)
+    repo.insert_many(categories)
+    return repo
+
+
+def cached(categories):
+    return CategoryCachedRepository(sqlite(categories))
+
+
+def sort_key(category):
+    return category.created_at or datetime.min, category.id
+
+
+class TestCategoryCursorPaginationInt(unittest.TestCase):
+
+    factories = (in_memory, sqlite, cached)
+
+    def setUp(self):
+        created_at = datetime(2022, 6, 1, 12, 0, 0)
+        self.categories = [
+            Category(name=name, is_active=index % 2 == 0,
+                     created_at=None if index == 6
+                     else created_at + timedelta(minutes=index // 2))
+            for index, name in enumerate([
+                'Movie', 'Documentary', 'Music', 'Animation', 'Musical',
+                'Series', 'Short'
+            ])
+        ]
+
+    def paginate(self, repo, **kwargs) -> CategoryRepository.CursorPage:
+        return repo.paginate(CategoryRepository.CursorParams(**kwargs))
+
+    def walk(self, repo, cursor_name='next_cursor', **kwargs):
+        pages = [self.paginate(repo, **kwargs)]
+        while getattr(pages[-1], cursor_name) is not None:
+            kwargs['cursor'] = getattr(pages[-1], cursor_name)
+            pages.append(self.paginate(repo, **kwargs))
+        return pages
+
+    def test_walk_forward_and_back(self):
+        expected = sorted(self.categories, key=sort_key, reverse=True)
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+                pages = self.walk(repo, per_page=3)
+
+                self.assertEqual([len(page.items) for page in pages],
+                                 [3, 3, 1])
+                self.assertEqual(
+                    [item for page in pages for item in page.items],
+                    expected)
+                self.assertIsNone(pages[0].previous_cursor)
+                self.assertIsNone(pages[-1].next_cursor)
+
+                back = self.walk(repo, 'previous_cursor', per_page=3,
+                                 cursor=pages[-1].previous_cursor)
+                self.assertEqual([page.items for page in back],
+                                 [page.items for page in pages[-2::-1]])
+                self.assertIsNotNone(back[0].next_cursor)
+                self.assertIsNone(back[-1].previous_cursor)
+
+    def test_ascending(self):
+        expected = sorted(self.categories, key=sort_key)
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                pages = self.walk(
+                    factory(self.categories), per_page=2, sort_dir='asc')
+                self.assertEqual(
+                    [item for page in pages for item in page.items],
+                    expected)
+                self.assertEqual(pages[0].items[0].created_at, None)
+
+    def test_filter(self):
+        category_filter = CategoryFilter(is_active=True, name_prefix='M')
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                pages = self.walk(factory(self.categories), per_page=1,
+                                  filter=category_filter)
+                self.assertEqual(
+                    [page.items[0].name for page in pages],
+                    ['Musical', 'Music', 'Movie'])
+
+    def test_created_range_leaves_out_null_created_at(self):
+        created_to = datetime(2022, 6, 1, 12, 1, 0)
+        for factory in self.factories:
+            for sort_dir in ('asc', 'desc'):
+                with self.subTest(repository=factory.__name__,
+                                  sort_dir=sort_dir):
+                    pages = self.walk(
+                        factory(self.categories), per_page=1,
+                        sort_dir=sort_dir,
+                        filter=CategoryFilter(created_to=created_to))
+                    self.assertEqual(
+                        sorted(page.items[0].name for page in pages),
+                        ['Animation', 'Documentary', 'Movie', 'Music'])
+
+    def test_stable_when_rows_are_inserted(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+                page = self.paginate(repo, per_page=2)
+                seen = list(page.items)
+                while page.next_cursor is not None:
+                    # newer rows land before the cursor, older ones after
+                    repo.insert(Category(
+                        name='Newer', created_at=datetime(2030, 1, 1)))
+                    page = self.paginate(
+                        repo, per_page=2, cursor=page.next_cursor)
+                    seen.extend(page.items)
+
+                self.assertEqual(len(seen), len({item.id for item in seen}))
+                self.assertEqual(
+                    seen, sorted(self.categories, key=sort_key,
+                                 reverse=True))
+
+    def test_past_the_end(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+                last, before_last = sorted(
+                    self.categories, key=sort_key)[:2]
+                cursor = Cursor((last.created_at, last.id)).encode()
+                page = self.paginate(repo, cursor=cursor)
+
+                self.assertEqual(page.items, [])
+                self.assertIsNone(page.next_cursor)
+                back = self.paginate(repo, cursor=page.previous_cursor,
+                                     per_page=1)
+                self.assertEqual(back.items, [before_last])
+
+    def test_invalid_cursor(self):
+        for factory in self.factories:
+            with self.subTest(repository=factory.__name__):
+                repo = factory(self.categories)
+                for cursor in (Cursor(('a', 'b')), Cursor((None, 'fake')),
+                               Cursor((None,))):
+                    with self.assertRaises(InvalidCursorException):
+                        self.paginate(repo, cursor=cursor)
+        with self.assertRaises(InvalidCursorException):
+            CategoryRepository.CursorParams(cursor='not a cursor')
+
+    def test_async_repository(self):
+        repo = CategoryAsyncInMemoryRepository(self.categories)
+        page = asyncio.run(repo.paginate(
+            CategoryRepository.CursorParams(per_page=2)))
+        self.assertEqual(
+            page.items,
+            sorted(self.categories, key=sort_key, reverse=True)[:2])
@@ -0,0 +1,128 @@
+from datetime import datetime
+import os
+import tempfile
+import unittest
+
+from __seedwork.infra.streams import write_jsonl
+from category.infra.imports import ShardedCategoryImporter, validate_columns
+from category.infra.streams import import_categories
+
+
+def make_records(count: int):
+    records = []
+    for index in range(count):
+        record = {
+            'id': f'5490020a-e866-4229-9adc-{index:012x}',
+            'name': f'Category {index}',
+            'description': None if index % 2 else f'Description {index}',
+            'created_at': datetime(2022, 6, 1, 0, 0, index % 60).isoformat()
+        }
+        if index % 3:
+            record['is_active'] = bool(index % 2)
+        records.append(record)
+    records[3]['name'] = 'a' * 256
+    records[7]['id'] = 'fake id'
+    records[11]['created_at'] = 'yesterday'
+    records[12] = {'name': None, 'is_active': 5}
+    return records
+
+
+class TestShardedCategoryImporterInt(unittest.TestCase):
+
+    def import_all(self, chunks):
+        categories, rejected = [], {}
+        for chunk in chunks:
+            categories.extend(chunk.categories)
+            rejected.update(chunk.rejected)
+        return categories, rejected
+
+    def test_matches_sequential_import(self):
+        records = make_records(25)
+        expected = self.import_all(import_categories(records, 4))
+
+        for workers in (0, 2):
+            with self.subTest(workers=workers), ShardedCategoryImporter(
+                    workers=workers, batch_size=4) as importer:
+                categories, rejected = self.import_all(
+                    importer.import_categories(iter(records)))
+                self.assertEqual(rejected, expected[1])
+                self.assertEqual(sorted(rejected), [3, 7, 11, 12])
+                self.assertEqual(categories, expected[0])
+                self.assertEqual([category.id for category in categories],
+                                 [category.id for category in expected[0]])
+
+    def test_jsonl_shards_match_sequential_import(self):
+        records = make_records(25)
+        expected = self.import_all(import_categories(records, 4))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'categories.jsonl')
+        with open(path, 'w', encoding='utf-8') as stream:
+            write_jsonl(stream, records)
+
+        for workers in (0, 2):
+            with self.subTest(workers=workers), ShardedCategoryImporter(
+                    workers=workers, shard_bytes=400) as importer:
+                batches = list(importer.validate_jsonl(path))
+                self.assertGreater(len(batches), 2)
+                self.assertEqual(
+                    [batch.start for batch in batches[1:]],
+                    [batch.start + batch.size for batch in batches[:-1]])
+                self.assertEqual(sum(batch.size for batch in batches), 25)
+
+                categories, rejected = self.import_all(
+                    importer.import_jsonl(path))
+                self.assertEqual(rejected, expected[1])
+                self.assertEqual(categories, expected[0])
+                self.assertEqual([category.id for category in categories],
+                                 [category.id for category in expected[0]])
+
+    def test_jsonl_shard_errors_name_the_shard(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'categories.jsonl')
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.write('{"name": "Movie"}\n{"name": "Music"}\n{"name":\n')
+
+        with ShardedCategoryImporter(workers=0, shard_bytes=20) as importer:
+            with self.assertRaises(ValueError) as assert_error:
+                list(importer.validate_jsonl(path))
+        self.assertEqual(str(assert_error.exception),
+                         'Invalid JSON on line 1 of the shard at byte 36')
+
+    def test_validate_in_order(self):
+        records = make_records(25)
+        with ShardedCategoryImporter(
+                workers=2, batch_size=3, max_pending=2) as importer:
+            batches = list(importer.validate(records))
+
+        self.assertEqual([batch.start for batch in batches],
+                         list(range(0, 25, 3)))
+        self.assertEqual(sum(batch.accepted for batch in batches), 21)
+        self.assertEqual(batches[2].rejected, {
+            7: {'id': ['ID must be a valid UUID']}})
+        self.assertEqual(batches[4].rejected[12], {
+            'name': ['The "name" is required.'],
+            'is_active': ['The "is_active" must be a boolean.']})
+
+    def test_validate_columns(self):
+        validated = validate_columns(10, (
+            ['5490020a-e866-4229-9adc-aa44b83234c4', ...],
+            ['Movie', 'Music'],
+            [..., None],
+            [..., True],
+            [..., ...]
+        ))
+
+        self.assertEqual(validated.start, 10)
+        self.assertEqual(validated.size, 2)
+        self.assertEqual(validated.rejected, {})
+        self.assertEqual(validated.raw_id(0).hex(),
+                         '5490020ae86642299adcaa44b83234c4')
+        self.assertEqual(validated.raw_id(1), bytes(16))
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            ShardedCategoryImporter(batch_size=0)
+        with self.assertRaises(ValueError):
+            ShardedCategoryImporter(shard_bytes=0)
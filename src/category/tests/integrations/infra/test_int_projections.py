@@ -0,0 +1,100 @@
+from datetime import datetime
+import unittest
+
+from __seedwork.domain.events import DomainEvents
+from category.domain.entities import Category
+from category.domain.events import CategoryActivated
+from category.infra.projections import CategoryStatsProjection
+
+
+class TestCategoryStatsProjectionInt(unittest.TestCase):
+
+    def setUp(self):
+        self.projection = CategoryStatsProjection()
+        self.projection.subscribe()
+        self.addCleanup(self.projection.unsubscribe)
+
+    def create(self, hour: int, day: int = 1, **kwargs) -> Category:
+        return Category.create(
+            name='Movie', created_at=datetime(2022, 6, day, hour, 30),
+            **kwargs)
+
+    def assert_counts(self, total: int, active: int, inactive: int):
+        self.assertEqual(
+            (self.projection.total, self.projection.active,
+             self.projection.inactive),
+            (total, active, inactive))
+
+    def test_follow_the_category_lifecycle(self):
+        movie = self.create(10)
+        documentary = self.create(10, is_active=False)
+        animation = self.create(11, is_active=None)
+        self.assert_counts(3, 1, 1)
+
+        documentary.activate()
+        animation.deactivate()
+        self.assert_counts(3, 2, 1)
+        movie.update('Movies', 'changed')
+        movie.activate()
+        self.assert_counts(3, 2, 1)
+
+        movie.delete()
+        self.assert_counts(2, 1, 1)
+        self.assertEqual(self.projection.created(per='hour'), 2)
+        movie.delete()
+        self.assert_counts(2, 1, 1)
+
+    def test_count_creations_per_day_and_hour(self):
+        for day, hour in [(1, 10), (1, 10), (1, 23), (2, 0), (5, 12)]:
+            self.create(hour, day)
+        Category.create(name='Undated', created_at=None)
+
+        self.assertEqual(self.projection.total, 6)
+        self.assertEqual(self.projection.created(), 5)
+        self.assertEqual(self.projection.created(
+            datetime(2022, 6, 1, 23), datetime(2022, 6, 2)), 4)
+        self.assertEqual(self.projection.created(
+            datetime(2022, 6, 1, 11), datetime(2022, 6, 2), per='hour'), 2)
+        self.assertEqual(
+            self.projection.created_series(end=datetime(2022, 6, 30)),
+            [(datetime(2022, 6, 1), 3), (datetime(2022, 6, 2), 1),
+             (datetime(2022, 6, 5), 1)])
+        self.assertEqual(
+            self.projection.created_series(
+                datetime(2022, 6, 1, 10, 59), datetime(2022, 6, 2, 0),
+                per='hour'),
+            [(datetime(2022, 6, 1, 10), 2), (datetime(2022, 6, 1, 23), 1),
+             (datetime(2022, 6, 2, 0), 1)])
+        with self.assertRaises(ValueError):
+            self.projection.created(per='week')
+
+    def test_empty_buckets_are_dropped(self):
+        category = self.create(10)
+        category.delete()
+        self.assertEqual(self.projection.created_series(per='hour'), [])
+        self.assertEqual(len(self.projection.per_day), 0)
+
+    def test_rebuild_from_categories(self):
+        categories = [self.create(10), self.create(11, is_active=False)]
+        self.projection.reset()
+        self.assert_counts(0, 0, 0)
+
+        self.projection.rebuild(categories)
+        self.assert_counts(2, 1, 1)
+        self.assertEqual(self.projection.created(per='hour'), 2)
+
+        # events of categories already counted are not counted twice
+        categories[0]._raise_created()
+        categories[1].activate()
+        self.assert_counts(2, 2, 0)
+
+    def test_ignore_events_of_unknown_categories(self):
+        DomainEvents.publish(CategoryActivated(aggregate_id='unknown'))
+        self.assert_counts(0, 0, 0)
+
+    def test_stop_following_once_unsubscribed(self):
+        with CategoryStatsProjection() as projection:
+            self.create(10)
+        self.create(10)
+        self.assertEqual(projection.total, 1)
+        self.assertEqual(self.projection.total, 2)
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+import os
+import tempfile
+import unittest
+
+from __seedwork.domain.exceptions import NotFoundException
+from category.domain.entities import Category
+from category.infra.in_memory.repositories import CategoryInMemoryRepository
+from category.infra.snapshots import CategorySnapshot, \
+    write_category_snapshot
+
+
+class TestCategorySnapshotInt(unittest.TestCase):
+
+    def setUp(self):
+        created_at = datetime(2022, 6, 1, 12, 0, 0, 123456)
+        self.categories = [
+            Category(name=name, description=description, is_active=is_active,
+                     created_at=None if minute == 3
+                     else created_at + timedelta(minutes=minute))
+            for minute, (name, description, is_active) in enumerate([
+                ('Movie', 'some description', True),
+                ('Documentary', None, False),
+                ('Música', '', True),
+                ('Animation', None, None),
+                ('Musical', 'ação', False),
+            ])
+        ]
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'categories.snapshot')
+        write_category_snapshot(self.path, self.categories)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_without_loss(self):
+        with CategorySnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 5)
+            self.assertEqual(list(snapshot), self.categories)
+            self.assertEqual(snapshot.to_categories(), self.categories)
+            self.assertEqual(snapshot[-1], self.categories[-1])
+            self.assertFalse(snapshot[0].is_dirty)
+            with self.assertRaises(IndexError):
+                snapshot[5]
+
+    def test_find_by_id(self):
+        with CategorySnapshot(self.path) as snapshot:
+            for category in self.categories:
+                self.assertEqual(snapshot.find_by_id(category.id), category)
+                self.assertEqual(
+                    snapshot.find_by_id(category.unique_entity_id), category)
+
+            for entity_id in ('fake id',
+                              '9366b7dc-2d71-4799-b91c-c64adb205104'):
+                with self.assertRaises(NotFoundException):
+                    snapshot.find_by_id(entity_id)
+
+    def test_empty_snapshot(self):
+        self.assertEqual(write_category_snapshot(self.path, []), 0)
+        with CategorySnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 0)
+            self.assertEqual(snapshot.to_categories(), [])
+            with self.assertRaises(NotFoundException):
+                snapshot.find_by_id(self.categories[0].id)
+
+    def test_duplicated_ids(self):
+        with self.assertRaisesRegex(ValueError, 'Duplicated ID'):
+            write_category_snapshot(
+                self.path, self.categories + self.categories[:1])
+        with CategorySnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 5)
+
+    def test_warm_a_repository(self):
+        with CategorySnapshot(self.path, verify=False) as snapshot:
+            repository = CategoryInMemoryRepository(snapshot)
+        self.assertEqual(
+            repository.find_by_id(self.categories[2].id), self.categories[2])
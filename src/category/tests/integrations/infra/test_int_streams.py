@@ -0,0 +1,125 @@
+from datetime import datetime
+import io
+import json
+import unittest
+
+from __seedwork.domain.events import DomainEvents
+from category.domain.entities import Category
+from category.domain.events import CategoryCreated
+from category.infra.streams import export_categories, import_categories, \
+    read_categories
+
+
+class TestCategoryStreamsInt(unittest.TestCase):
+
+    def setUp(self):
+        self.categories = [
+            Category(name='Movie', description='some description',
+                     created_at=datetime(2022, 6, 1, 12, 0, 0, 123)),
+            Category(name='Música', is_active=False,
+                     created_at=datetime(2022, 6, 2)),
+            Category(name='Documentary', is_active=None, created_at=None),
+        ]
+
+    def import_all(self, chunks):
+        categories, rejected = [], {}
+        for chunk in chunks:
+            categories.extend(chunk.categories)
+            rejected.update(chunk.rejected)
+        return categories, rejected
+
+    def test_jsonl_round_trip(self):
+        stream = io.StringIO()
+        self.assertEqual(export_categories(iter(self.categories), stream), 3)
+
+        first_line = json.loads(stream.getvalue().splitlines()[0])
+        self.assertEqual(first_line, self.categories[0].to_dict(True))
+
+        stream.seek(0)
+        categories, rejected = self.import_all(
+            read_categories(stream, chunk_size=2))
+        self.assertEqual(categories, self.categories)
+        self.assertEqual(rejected, {})
+
+    def test_csv_round_trip(self):
+        stream = io.StringIO(newline='')
+        export_categories(self.categories[:2], stream, format='csv')
+
+        self.assertEqual(
+            stream.getvalue().splitlines()[0],
+            'id,name,description,is_active,created_at')
+
+        stream.seek(0)
+        categories, rejected = self.import_all(
+            read_categories(stream, format='csv'))
+        self.assertEqual(categories, self.categories[:2])
+        self.assertEqual(rejected, {})
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            read_categories(io.StringIO(), format='xml')
+        with self.assertRaises(ValueError):
+            export_categories([], io.StringIO(), format='xml')
+
+    def test_reports_rejected_records_by_position(self):
+        records = [
+            {'name': 'Movie'},
+            {'name': None, 'id': 'fake id'},
+            {'name': 'Series', 'created_at': 'yesterday'},
+            {'name': 'Music', 'is_active': 'yes'},
+            {'name': 'Animation'},
+        ]
+        chunks = list(import_categories(records, chunk_size=2))
+
+        self.assertEqual([len(chunk.categories) for chunk in chunks],
+                         [1, 0, 1])
+        categories, rejected = self.import_all(chunks)
+        self.assertEqual([category.name for category in categories],
+                         ['Movie', 'Animation'])
+        self.assertEqual(rejected, {
+            1: {
+                'id': ['ID must be a valid UUID'],
+                'name': ['The "name" is required.'],
+            },
+            2: {'created_at': [
+                'The "created_at" must be an ISO 8601 datetime.']},
+            3: {'is_active': ['The "is_active" must be a boolean.']},
+        })
+
+    def test_rejected_records_publish_no_event(self):
+        # handlers are held weakly, so keep the bound method alive
+        created = []
+        on_created = created.append
+        DomainEvents.subscribe(CategoryCreated, on_created)
+        self.addCleanup(DomainEvents.unsubscribe, CategoryCreated, on_created)
+        records = [
+            {'name': 'Movie', 'id': 'fake id'},
+            {'name': 'Series', 'created_at': 'yesterday'},
+            {'name': 'Music', 'created_at': 12345},
+            {'name': 'Animation', 'created_at': None},
+            {'name': 'Short', 'created_at': datetime(2022, 6, 1)},
+        ]
+        categories, rejected = self.import_all(import_categories(records))
+
+        self.assertEqual([category.name for category in categories],
+                         ['Animation', 'Short'])
+        self.assertEqual([event.name for event in created],
+                         ['Animation', 'Short'])
+        self.assertEqual(sorted(rejected), [0, 1, 2])
+        self.assertEqual(rejected[2], {'created_at': [
+            'The "created_at" must be an ISO 8601 datetime.']})
+
+    def test_pulls_one_chunk_at_a_time(self):
+        read = []
+
+        def records():
+            index = 0
+            while True:
+                read.append(index)
+                yield {'name': f'Category {index}'}
+                index += 1
+
+        chunks = import_categories(records(), chunk_size=50)
+        self.assertEqual(len(next(chunks).categories), 50)
+        self.assertEqual(len(next(chunks).categories), 50)
+        self.assertEqual(len(read), 100)
@@ -0,0 +1,68 @@
+import unittest
+
+from category.domain.entities import Category
+from category.infra.text_indexes import CategoryTextIndex
+
+
+class TestCategoryTextIndexInt(unittest.TestCase):
+
+    def setUp(self):
+        self.categories = [
+            Category(name='Ação', description='Filmes de ação'),
+            Category(name='Animação', description='Desenhos'),
+            Category(name='Documentário', description='Histórias reais'),
+        ]
+        self.index = CategoryTextIndex(self.categories)
+
+    def names(self, query, **kwargs):
+        return [category.name
+                for category in self.index.search(query, **kwargs).items]
+
+    def test_search(self):
+        result = self.index.search('acao', per_page=1, page=2)
+        self.assertEqual(result.total, 1)
+        self.assertEqual(result.items, [])
+        self.assertEqual(result.filter, 'acao')
+
+        self.assertEqual(self.names('a'), ['Ação', 'Animação'])
+        self.assertEqual(self.names('HIST'), ['Documentário'])
+        self.assertIs(self.index.search('doc').items[0], self.categories[2])
+
+    def test_follows_category_updates(self):
+        self.categories[0].update('Comédia', None)
+
+        self.assertEqual(self.names('acao'), [])
+        self.assertEqual(self.names('come'), ['Comédia'])
+        self.assertIs(self.index.search('come').items[0], self.categories[0])
+
+        other_instance = Category(
+            unique_entity_id=self.categories[1].unique_entity_id,
+            name='Animação')
+        other_instance.update('Desenho animado', None)
+        self.assertEqual(self.names('anima'), ['Desenho animado'])
+        self.assertEqual(self.categories[1].name, 'Animação')
+
+        Category(name='Not indexed').update('Not indexed either', None)
+        self.assertEqual(self.names('indexed'), [])
+        self.assertEqual(len(self.index), 3)
+
+    def test_follows_category_deletes(self):
+        Category(unique_entity_id=self.categories[2].unique_entity_id,
+                 name='Documentário').delete()
+
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.names('doc'), [])
+
+    def test_out_of_range_pages(self):
+        result = self.index.search('a', page=0, per_page=0)
+        self.assertEqual(result.current_page, 1)
+        self.assertEqual(result.per_page, 15)
+        self.assertEqual(len(result.items), 2)
+        self.assertEqual(self.names('a', page=-1, per_page=1), ['Ação'])
+
+    def test_remove(self):
+        self.index.remove(self.categories[0].unique_entity_id)
+        self.index.remove('fake id')
+
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.names('acao'), [])
@@ -3,6 +3,7 @@ from datetime import datetime
 import unittest
 from unittest.mock import patch
 
+from __seedwork.domain.value_objects import UniqueEntityId
 from category.domain.entities import Category
 
 
@@ -77,3 +78,35 @@ class TestCategoryUnit(unittest.TestCase):
             category.deactivate()
 
             self.assertFalse(category.is_active)
+
+    def test_create_many(self):
+        with patch.object(Category, 'validate') as mock_validate_method:
+            categories, errors = Category.create_many([
+                {'name': 'Movie'},
+                {'name': 'Documentary', 'is_active': False},
+            ])
+
+            self.assertEqual(mock_validate_method.call_count, 2)
+            self.assertEqual(errors, {})
+            self.assertEqual([category.name for category in categories],
+                             ['Movie', 'Documentary'])
+            self.assertFalse(categories[1].is_active)
+
+    def test_from_persistence_skips_validation(self):
+        created_at = datetime(2022, 6, 1)
+        with patch.object(Category, 'validate') as mock_validate_method:
+            category = Category.from_persistence(
+                unique_entity_id=UniqueEntityId.trusted(
+                    '5490020a-e866-4229-9adc-aa44b83234c4'),
+                name='Movie',
+                description=None,
+                is_active=False,
+                created_at=created_at
+            )
+            mock_validate_method.assert_not_called()
+
+        self.assertEqual(category.id, '5490020a-e866-4229-9adc-aa44b83234c4')
+        self.assertEqual(category.name, 'Movie')
+        self.assertFalse(category.is_active)
+        self.assertIs(category.created_at, created_at)
+        self.assertFalse(category.is_dirty)